@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Selenium 크롬 리소스 차단 정책 (사조/KIS/네이버 리뷰 크롤러 공용)
+- CDP Network.setBlockedURLs로 이미지/폰트/미디어/외부 분석 스크립트 요청 차단
+  (--disable-images 같은 실행 옵션은 최신 크롬에서 무시됨)
+- 스크립트(.js)는 외부 분석 도메인 외에는 막지 않음 (IBSheet/cswm 등 크롤링에 필요한 스크립트 유지)
+  setBlockedURLs에는 예외 지정이 없으므로 허용 목록 대신 필요한 전역 함수 확인으로 보호
+- 페이지 로드 후 필요한 전역 함수(OnList 등)가 없으면 차단 해제 후 새로고침
+- 차단 전/후 페이지 용량/요청 수/로드 시간 측정 (Performance API)
+
+환경변수 BROWSER_POLICY:
+    on (기본)  차단 적용
+    off        차단 없이 수집
+    measure    첫 페이지에서 차단 전/후를 측정해 로그로 남긴 뒤 차단 적용
+"""
+
+import os
+import time
+from fnmatch import fnmatchcase
+
+
+# 차단 패턴 (setBlockedURLs 와일드카드 - '*'만 지원)
+RESOURCE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*', '*.bmp*'],
+    'font': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*', '*.wav*'],
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*connect.facebook.net*', '*wcs.naver.net*', '*wcs.naver.com*', '*lcs.naver.com*',
+        '*nelo2-col.navercorp.com*', '*hotjar.com*', '*clarity.ms*',
+    ],
+}
+DEFAULT_BLOCK = ('image', 'font', 'media', 'analytics')
+
+
+class SitePolicy:
+    """
+    사이트별 차단 정책
+    block: 차단할 리소스 종류 (RESOURCE_PATTERNS 키)
+    required: 페이지에 있어야 하는 전역 함수/객체 이름 (없으면 차단이 스크립트를 깨뜨린 것으로 보고 해제)
+    """
+
+    def __init__(self, name, block=DEFAULT_BLOCK, required=()):
+        self.name = name
+        self.block = tuple(block)
+        self.required = tuple(required)
+
+    def patterns(self):
+        return [p for kind in self.block for p in RESOURCE_PATTERNS[kind]]
+
+    def blocks(self, url):
+        """URL이 차단되는지 (setBlockedURLs와 같은 '*' 와일드카드 매칭)"""
+        return any(fnmatchcase(url, p) for p in self.patterns())
+
+
+SAJO_POLICY = SitePolicy('sajo', required=('OnList',))
+KIS_POLICY = SitePolicy('kis', required=('cswmButtonDown',))
+NAVER_REVIEW_POLICY = SitePolicy('naver_review')
+
+
+def policy_mode():
+    mode = os.environ.get('BROWSER_POLICY', 'on').strip().lower()
+    return mode if mode in ('on', 'off', 'measure') else 'on'
+
+
+def apply_policy(driver, policy):
+    """차단 적용 (크롬 드라이버가 아니거나 CDP 실패 시 False - 차단 없이 계속)"""
+    if policy_mode() == 'off':
+        print(f"[POLICY] {policy.name}: 리소스 차단 끔 (BROWSER_POLICY=off)", flush=True)
+        return False
+    try:
+        patterns = policy.patterns()
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        print(f"[POLICY] {policy.name}: {', '.join(policy.block)} 차단 (패턴 {len(patterns)}개)", flush=True)
+        return True
+    except Exception as e:
+        print(f"[POLICY] {policy.name}: 차단 적용 실패 - 차단 없이 진행 ({e})", flush=True)
+        return False
+
+
+def clear_policy(driver):
+    try:
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+    except Exception:
+        pass
+
+
+def ensure_required(driver, policy, names=None):
+    """
+    필요한 전역 함수/객체가 있는지 확인 - 없으면 차단 해제 후 새로고침
+    반환: 처음부터 모두 있었으면 True
+    """
+    names = list(names or policy.required)
+    if not names:
+        return True
+    try:
+        missing = driver.execute_script(
+            "return arguments[0].filter(n => typeof window[n] === 'undefined');", names
+        )
+    except Exception:
+        return True
+    if not missing:
+        return True
+
+    print(f"[POLICY] {policy.name}: {', '.join(missing)} 없음 - 차단 해제 후 새로고침", flush=True)
+    clear_policy(driver)
+    driver.refresh()
+    time.sleep(3)
+    return False
+
+
+# transferSize는 Timing-Allow-Origin이 없는 외부 리소스에서 0이므로 그때는 encodedBodySize 사용
+PAGE_WEIGHT_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const entries = performance.getEntriesByType('resource');
+const size = e => e.transferSize || e.encodedBodySize || 0;
+return {
+    bytes: (nav ? size(nav) : 0) + entries.reduce((sum, e) => sum + size(e), 0),
+    requests: entries.length + (nav ? 1 : 0),
+    load_ms: nav && nav.loadEventEnd ? Math.round(nav.loadEventEnd - nav.startTime) : null
+};
+"""
+
+
+def page_weight(driver):
+    """현재 페이지 용량(byte)/요청 수/로드 시간(ms)"""
+    try:
+        return driver.execute_script(PAGE_WEIGHT_JS) or {}
+    except Exception as e:
+        print(f"[POLICY] 측정 실패: {e}", flush=True)
+        return {}
+
+
+def _measured_load(driver, url, settle):
+    driver.get(url)
+    time.sleep(settle)
+    return page_weight(driver)
+
+
+def measure_policy(driver, url, policy, settle=3):
+    """
+    같은 페이지를 캐시 없이 차단 없음/차단 순서로 한 번씩 로드해서 비교 (로그 출력)
+    측정 후에는 차단이 적용된 상태로 이 페이지가 열려 있음
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+    except Exception as e:
+        print(f"[POLICY] 측정 불가 (CDP 없음): {e}", flush=True)
+        return None
+
+    try:
+        clear_policy(driver)
+        before = _measured_load(driver, url, settle)
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': policy.patterns()})
+        after = _measured_load(driver, url, settle)
+    finally:
+        driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+
+    def fmt(w):
+        return (f"{w.get('bytes', 0) / 1024:.0f}KB, 요청 {w.get('requests', 0)}개, "
+                f"load {w.get('load_ms')}ms")
+
+    saved = before.get('bytes', 0) - after.get('bytes', 0)
+    print(f"[POLICY] {policy.name} {url}", flush=True)
+    print(f"    차단 없음: {fmt(before)}", flush=True)
+    print(f"    차단 적용: {fmt(after)} (-{saved / 1024:.0f}KB)", flush=True)
+    return {'url': url, 'without': before, 'with': after}
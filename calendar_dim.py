@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+날짜 차원 테이블 (리포트 생성기 공용)
+- 기간별로 한 번만 생성: 일자 -> ISO 주차, 월, 요일, 월중 주차, 공휴일 여부
+- 리포트 생성기는 정수 일자 인덱스로 조회 (레코드마다 strptime 하지 않음)
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+
+WEEKDAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+# 대한민국 공휴일 (대체공휴일/임시공휴일/선거일 포함, 오프라인 번들)
+KR_HOLIDAYS = {
+    # 2024
+    "2024-01-01": "신정",
+    "2024-02-09": "설날", "2024-02-10": "설날", "2024-02-11": "설날",
+    "2024-02-12": "대체공휴일(설날)",
+    "2024-03-01": "삼일절",
+    "2024-04-10": "국회의원선거",
+    "2024-05-05": "어린이날", "2024-05-06": "대체공휴일(어린이날)",
+    "2024-05-15": "부처님오신날",
+    "2024-06-06": "현충일",
+    "2024-08-15": "광복절",
+    "2024-09-16": "추석", "2024-09-17": "추석", "2024-09-18": "추석",
+    "2024-10-01": "국군의날",
+    "2024-10-03": "개천절",
+    "2024-10-09": "한글날",
+    "2024-12-25": "성탄절",
+    # 2025
+    "2025-01-01": "신정",
+    "2025-01-27": "임시공휴일",
+    "2025-01-28": "설날", "2025-01-29": "설날", "2025-01-30": "설날",
+    "2025-03-01": "삼일절", "2025-03-03": "대체공휴일(삼일절)",
+    "2025-05-05": "어린이날/부처님오신날", "2025-05-06": "대체공휴일(부처님오신날)",
+    "2025-06-03": "대통령선거",
+    "2025-06-06": "현충일",
+    "2025-08-15": "광복절",
+    "2025-10-03": "개천절",
+    "2025-10-05": "추석", "2025-10-06": "추석", "2025-10-07": "추석",
+    "2025-10-08": "대체공휴일(추석)",
+    "2025-10-09": "한글날",
+    "2025-12-25": "성탄절",
+    # 2026
+    "2026-01-01": "신정",
+    "2026-02-16": "설날", "2026-02-17": "설날", "2026-02-18": "설날",
+    "2026-03-01": "삼일절", "2026-03-02": "대체공휴일(삼일절)",
+    "2026-05-05": "어린이날",
+    "2026-05-24": "부처님오신날", "2026-05-25": "대체공휴일(부처님오신날)",
+    "2026-06-03": "지방선거",
+    "2026-06-06": "현충일",
+    "2026-08-15": "광복절", "2026-08-17": "대체공휴일(광복절)",
+    "2026-09-24": "추석", "2026-09-25": "추석", "2026-09-26": "추석",
+    "2026-10-03": "개천절", "2026-10-05": "대체공휴일(개천절)",
+    "2026-10-09": "한글날",
+    "2026-12-25": "성탄절",
+    # 2027
+    "2027-01-01": "신정",
+    "2027-02-06": "설날", "2027-02-07": "설날", "2027-02-08": "설날",
+    "2027-02-09": "대체공휴일(설날)",
+    "2027-03-01": "삼일절",
+    "2027-05-05": "어린이날",
+    "2027-05-13": "부처님오신날",
+    "2027-06-06": "현충일",
+    "2027-08-15": "광복절", "2027-08-16": "대체공휴일(광복절)",
+    "2027-09-14": "추석", "2027-09-15": "추석", "2027-09-16": "추석",
+    "2027-10-03": "개천절", "2027-10-04": "대체공휴일(개천절)",
+    "2027-10-09": "한글날", "2027-10-11": "대체공휴일(한글날)",
+    "2027-12-25": "성탄절", "2027-12-27": "대체공휴일(성탄절)",
+}
+
+
+def to_date(date_str):
+    """YYYYMMDD 또는 YYYY-MM-DD -> date (실패 시 None)"""
+    if not date_str:
+        return None
+    d = str(date_str).strip().replace('-', '')
+    if len(d) != 8 or not d.isdigit():
+        return None
+    try:
+        return date(int(d[:4]), int(d[4:6]), int(d[6:8]))
+    except ValueError:
+        return None
+
+
+class CalendarDim:
+    """
+    start~end 기간의 날짜 차원 테이블
+    모든 컬럼은 일자 인덱스(0 = start)로 접근하는 리스트
+    """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+        self.dates = []          # YYYY-MM-DD
+        self.dates_raw = []      # YYYYMMDD
+        self.week_keys = []      # YYYY-WXX (ISO)
+        self.month_keys = []     # YYYY-MM
+        self.weekdays = []       # 0=월 ~ 6=일
+        self.week_of_month = []  # 1~6 (월요일 시작)
+        self.is_holiday = []
+        self.holiday_names = []
+        self._index = {}
+
+        day = start
+        idx = 0
+        while day <= end:
+            iso = day.isoformat()
+            raw = iso.replace('-', '')
+            year, week, _ = day.isocalendar()
+            first_weekday = day.replace(day=1).weekday()
+
+            self.dates.append(iso)
+            self.dates_raw.append(raw)
+            self.week_keys.append(f"{year}-W{week:02d}")
+            self.month_keys.append(iso[:7])
+            self.weekdays.append(day.weekday())
+            self.week_of_month.append((day.day + first_weekday - 1) // 7 + 1)
+            self.holiday_names.append(KR_HOLIDAYS.get(iso, ''))
+            self.is_holiday.append(iso in KR_HOLIDAYS)
+
+            self._index[iso] = idx
+            self._index[raw] = idx
+
+            day += timedelta(days=1)
+            idx += 1
+
+    def __len__(self):
+        return len(self.dates)
+
+    def index(self, date_str):
+        """날짜 문자열(YYYYMMDD/YYYY-MM-DD) -> 일자 인덱스 (범위 밖이면 None)"""
+        return self._index.get(str(date_str).strip()) if date_str else None
+
+    def row(self, idx):
+        return {
+            "date": self.dates[idx],
+            "week": self.week_keys[idx],
+            "month": self.month_keys[idx],
+            "weekday": self.weekdays[idx],
+            "weekday_name": WEEKDAY_NAMES[self.weekdays[idx]],
+            "week_of_month": self.week_of_month[idx],
+            "is_holiday": self.is_holiday[idx],
+            "holiday_name": self.holiday_names[idx]
+        }
+
+
+@lru_cache(maxsize=None)
+def build_calendar(start, end):
+    """기간별 날짜 테이블 (같은 기간은 한 번만 생성)"""
+    return CalendarDim(start, end)
+
+
+def calendar_for(date_strs):
+    """날짜 문자열 목록의 최소~최대 기간 테이블 (날짜가 없으면 None)"""
+    parsed = {}
+    for d in date_strs:
+        if d not in parsed:
+            parsed[d] = to_date(d)
+    valid = [d for d in parsed.values() if d]
+    if not valid:
+        return None
+    return build_calendar(min(valid), max(valid))
@@ -5,6 +5,7 @@
  */
 
 let adsData = null;
+let adsHistory = null; // 일별 이력 시계열 (ads_history.json)
 let filteredKeywords = [];
 let changedKeywords = {};
 let selectedKeywords = new Set();
@@ -84,6 +85,7 @@ async function loadData() {
         }
         
         initCampaignSelect();
+        loadHistory();
         
     } catch (error) {
         console.error('Failed to load ads data:', error);
@@ -91,6 +93,18 @@ async function loadData() {
     }
 }
 
+async function loadHistory() {
+    try {
+        const response = await fetch('ads_history.json?t=' + Date.now());
+        if (!response.ok) return;
+        
+        adsHistory = await response.json();
+        console.log('Ads history loaded:', adsHistory.dates?.length, 'days');
+    } catch (error) {
+        console.warn('Ads history not available:', error);
+    }
+}
+
 function showNoDataMessage() {
     const content = document.getElementById('naverContent');
     if (content) {
@@ -546,6 +560,7 @@ function updateRankBidsFooter() {
     });
     
     html += '</div>';
+    html += renderBidTrend(keyword);
     footer.innerHTML = html;
     
     const tableContainer = document.querySelector('#keywords .table-wrapper');
@@ -554,6 +569,30 @@ function updateRankBidsFooter() {
     }
 }
 
+function renderBidTrend(keyword) {
+    const dates = adsHistory?.dates || [];
+    const values = adsHistory?.series?.[keyword]?.m1 || [];
+    const points = values
+        .map((value, i) => ({ date: dates[i], value }))
+        .filter(p => p.value !== null && p.value !== undefined);
+    
+    if (points.length < 2) return '';
+    
+    const first = points[0];
+    const last = points[points.length - 1];
+    const bids = points.map(p => p.value);
+    const change = last.value - first.value;
+    const sign = change > 0 ? '+' : '';
+    
+    return `
+        <div class="rank-bids-trend">
+            📈 1위 모바일 입찰가 추이 (${first.date.slice(5)} ~ ${last.date.slice(5)}):
+            ${formatNumber(first.value)}원 → ${formatNumber(last.value)}원 (${sign}${formatNumber(change)}원),
+            최저 ${formatNumber(Math.min(...bids))}원 / 최고 ${formatNumber(Math.max(...bids))}원
+        </div>
+    `;
+}
+
 function removeRankBidsFooter() {
     const existing = document.getElementById('rankBidsFooter');
     if (existing) existing.remove();
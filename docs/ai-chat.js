@@ -13,6 +13,8 @@
     
     let salesData = null;
     let orderData = null;
+    let costData = null;
+    let reviewTrends = null;
     let isOpen = false;
     let isLoading = false;
     let configLoaded = false;
@@ -452,6 +454,22 @@
             console.log('Order data not available');
         }
         
+        try {
+            const costResponse = await fetch('cost_data.json?t=' + Date.now());
+            costData = await costResponse.json();
+            loaded.push('발주율');
+        } catch (e) {
+            console.log('Cost data not available');
+        }
+        
+        try {
+            const trendResponse = await fetch('reviews/trends.json?t=' + Date.now());
+            reviewTrends = await trendResponse.json();
+            loaded.push('리뷰 트렌드');
+        } catch (e) {
+            console.log('Review trends not available');
+        }
+        
         // 상태 업데이트
         if (!configLoaded) {
             statusEl.textContent = '⚠ AI 설정을 불러올 수 없습니다';
@@ -558,6 +576,47 @@
             }
         }
         
+        if (costData) {
+            const c = costData.summary;
+            context += `### 매출 대비 발주율\n`;
+            context += `- 기간: ${c.date_range?.start} ~ ${c.date_range?.end}\n`;
+            context += `- 전체 발주율: ${c.cost_ratio ?? '-'}%\n\n`;
+            
+            if (costData.stores?.length > 0) {
+                context += `### 지점별 발주율 (최근 월)\n`;
+                costData.stores
+                    .filter(store => store.sales > 0)
+                    .forEach(store => {
+                        const months = costData.monthly?.[store.id] || [];
+                        const last = months[months.length - 1];
+                        const recent = last ? `, ${last.month}: ${last.ratio ?? '-'}%` : '';
+                        context += `- ${store.name}: 전체 ${store.ratio ?? '-'}%${recent}\n`;
+                    });
+                context += `\n`;
+            }
+        }
+        
+        if (reviewTrends?.all?.weeks?.length) {
+            // 리뷰 원문 대신 주별 집계만 (전체 지점 기준)
+            const t = reviewTrends.all;
+            context += `### 네이버 리뷰 주간 트렌드 (전체 지점)\n`;
+            t.weeks.slice(-4).forEach((week, i, weeks) => {
+                const [total, negative] = t.reviews[t.reviews.length - weeks.length + i];
+                context += `- ${week} 주: 리뷰 ${total}개, 부정 ${negative}개 (${total ? Math.round(negative / total * 100) : 0}%)\n`;
+            });
+            
+            const movers = (label, list) => {
+                if (!list?.length) return;
+                context += `- ${label}: ` + list.map(m =>
+                    `${m.term} ${m.count}회(4주 평균 ${m.baseline}${m.negative_ratio ? `, 부정 ${Math.round(m.negative_ratio * 100)}%` : ''})`
+                ).join(', ') + `\n`;
+            };
+            movers('급상승 태그', t.tags_movers?.rising);
+            movers('감소 태그', t.tags_movers?.falling);
+            movers('급상승 키워드', t.keywords_movers?.rising);
+            context += `\n`;
+        }
+        
         return context;
     }
     
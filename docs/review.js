@@ -3,6 +3,9 @@
  * - 지점 필터 시 메타태그 리뷰수 표시
  * - 이미지 로딩 개선
  * - 무한 스크롤
+ * - 요약(reviews/summary.json) 먼저, 지점별 리뷰 파일은 필요할 때 로드
+ * - 검색은 지점별 bigram 색인(reviews/search/)으로 후보만 추린 뒤 문자열 비교
+ * - 주간 태그/키워드 트렌드는 미리 집계된 reviews/trends.json 사용
  */
 
 let reviewData = null;
@@ -18,6 +21,11 @@ const REVIEWS_PER_PAGE = 20;
 let currentPage = 1;
 let isLoading = false;
 let hasMoreReviews = true;
+let renderToken = 0;
+const storeReviewLoads = {};
+const searchIndexLoads = {};
+let imageManifest = {};  // 리뷰 ID -> [[썸네일, 원본], ...] (로컬 사진 캐시, 없으면 네이버 이미지)
+let trendData = null;    // 주별 태그/키워드 집계 {all, stores: {place_id: ...}}
 
 // ============================================
 // 초기화
@@ -36,7 +44,7 @@ document.addEventListener('DOMContentLoaded', async function() {
 
 async function loadData() {
     try {
-        const response = await fetch('review_data.json?t=' + Date.now());
+        const response = await fetch('reviews/summary.json?t=' + Date.now());
         if (!response.ok) throw new Error('데이터 파일 없음');
         
         reviewData = await response.json();
@@ -48,12 +56,120 @@ async function loadData() {
         }
         
         initStoreSelect();
+        await Promise.all([loadImageManifest(), loadTrends()]);
     } catch (error) {
         console.error('Failed to load review data:', error);
         showNoDataMessage();
     }
 }
 
+// 로컬 사진 캐시 목록 (선택 단계 - 없으면 네이버 이미지 그대로 사용)
+async function loadImageManifest() {
+    try {
+        const response = await fetch('reviews/images.json?v=' + encodeURIComponent(reviewData.generated_at || ''));
+        if (response.ok) imageManifest = await response.json();
+    } catch (error) {
+        imageManifest = {};
+    }
+}
+
+// 주간 트렌드 집계 (없으면 트렌드 영역만 비움)
+async function loadTrends() {
+    try {
+        const response = await fetch('reviews/trends.json?v=' + encodeURIComponent(reviewData.generated_at || ''));
+        if (response.ok) trendData = await response.json();
+    } catch (error) {
+        trendData = null;
+    }
+}
+
+// 지점별 리뷰 파일 (선택한 지점만, 전체 지점이면 모두 - 한 번 받은 지점은 재사용)
+function loadStoreReviews(stores) {
+    const version = encodeURIComponent(reviewData.generated_at || '');
+    return Promise.all(stores.map(store => {
+        if (!store.file) return null;
+        if (!storeReviewLoads[store.place_id]) {
+            storeReviewLoads[store.place_id] = fetch('reviews/' + store.file + '?v=' + version)
+                .then(response => {
+                    if (!response.ok) throw new Error(store.file);
+                    return response.json();
+                })
+                .then(data => {
+                    store.visitor_reviews = data.visitor_reviews || [];
+                    store.blog_reviews = data.blog_reviews || [];
+                })
+                .catch(error => {
+                    console.error('Failed to load store reviews:', error);
+                    delete storeReviewLoads[store.place_id];
+                });
+        }
+        return storeReviewLoads[store.place_id];
+    }));
+}
+
+// 지점별 검색 색인 (검색할 때만 로드 - 없거나 실패하면 전체 스캔)
+function loadSearchIndexes(stores) {
+    const version = encodeURIComponent(reviewData.generated_at || '');
+    return Promise.all(stores.map(store => {
+        if (!store.file) return null;
+        if (!searchIndexLoads[store.place_id]) {
+            searchIndexLoads[store.place_id] = fetch('reviews/search/' + store.file + '?v=' + version)
+                .then(response => {
+                    if (!response.ok) throw new Error(store.file);
+                    return response.json();
+                })
+                .then(data => {
+                    store.searchIndex = { count: data.count, grams: data.grams || {}, decoded: {} };
+                })
+                .catch(error => {
+                    console.warn('Search index unavailable:', store.file);
+                    store.searchIndex = null;
+                });
+        }
+        return searchIndexLoads[store.place_id];
+    }));
+}
+
+// 검색어의 bigram (공백 포함 조합 제외 - review_search.py bigrams와 같은 규칙)
+function queryBigrams(query) {
+    const grams = new Set();
+    for (let i = 0; i < query.length - 1; i++) {
+        if (!/\s/.test(query[i]) && !/\s/.test(query[i + 1])) grams.add(query.slice(i, i + 2));
+    }
+    return [...grams];
+}
+
+// 차이값 목록 -> 리뷰 순번 목록 (한 번 풀면 재사용)
+function postingList(index, gram) {
+    if (!index.decoded[gram]) {
+        let pos = 0;
+        index.decoded[gram] = (index.grams[gram] || []).map(delta => (pos += delta));
+    }
+    return index.decoded[gram];
+}
+
+// 검색 후보 리뷰 순번 (visitor_reviews 다음 blog_reviews) - null이면 색인을 쓸 수 없어 전체 스캔
+function searchCandidates(store, query) {
+    const index = store.searchIndex;
+    const total = (store.visitor_reviews || []).length + (store.blog_reviews || []).length;
+    if (!index || index.count !== total) return null;
+    
+    const grams = queryBigrams(query);
+    if (!grams.length) return null;
+    
+    const lists = grams.map(gram => postingList(index, gram)).sort((a, b) => a.length - b.length);
+    let result = lists[0];
+    for (let i = 1; i < lists.length && result.length; i++) {
+        const other = lists[i];
+        let j = 0;
+        result = result.filter(pos => {
+            while (j < other.length && other[j] < pos) j++;
+            return j < other.length && other[j] === pos;
+        });
+    }
+    return new Set(result);
+}
+
 function showNoDataMessage() {
     const content = document.getElementById('naverContent');
     if (content) {
@@ -234,6 +350,62 @@ function renderDashboard() {
     filterAndRender();
 }
 
+// ============================================
+// 주간 트렌드 (선택 지점 또는 전체)
+// ============================================
+
+function renderTrends() {
+    const chart = document.getElementById('trendChart');
+    const movers = document.getElementById('trendMovers');
+    if (!chart || !movers) return;
+    
+    const store = (reviewData.stores || []).find(s => s.store_name === currentStore);
+    const trend = store ? trendData?.stores?.[store.place_id] : trendData?.all;
+    if (!trend || !trend.weeks?.length) {
+        chart.innerHTML = '<span style="color: #666;">트렌드 데이터가 없습니다.</span>';
+        movers.innerHTML = '';
+        document.getElementById('trendRange').textContent = '';
+        return;
+    }
+    
+    document.getElementById('trendRange').textContent =
+        `${trend.weeks[0]} ~ ${trend.weeks[trend.weeks.length - 1]} 주`;
+    
+    const max = Math.max(1, ...trend.reviews.map(([total]) => total));
+    chart.innerHTML = trend.weeks.map((week, i) => {
+        const [total, negative] = trend.reviews[i];
+        const ratio = total ? Math.round(negative / total * 100) : 0;
+        return `
+            <div class="trend-bar" title="${week} 주: 리뷰 ${total}개, 부정 ${negative}개 (${ratio}%)">
+                <div class="trend-bar-fill" style="height: ${total / max * 100}%">
+                    <div class="trend-bar-negative" style="height: ${total ? negative / total * 100 : 0}%"></div>
+                </div>
+                <div class="trend-bar-label">${week.slice(5)}</div>
+            </div>
+        `;
+    }).join('');
+    
+    const renderMovers = (title, list) => `
+        <div>
+            <h4>${title}</h4>
+            ${list.length ? list.map(m => `
+                <div class="trend-mover">
+                    <span>${escapeHtml(m.term)}</span>
+                    <span class="${m.change > 0 ? 'trend-up' : 'trend-down'}">
+                        ${m.count}개 (${m.change > 0 ? '+' : ''}${m.change})${m.negative_ratio ? ` · 부정 ${Math.round(m.negative_ratio * 100)}%` : ''}
+                    </span>
+                </div>
+            `).join('') : '<span style="color: #666; font-size: 0.8rem;">변화 없음</span>'}
+        </div>
+    `;
+    
+    movers.innerHTML =
+        renderMovers('태그 급상승 (직전 4주 평균 대비)', trend.tags_movers?.rising || []) +
+        renderMovers('태그 감소', trend.tags_movers?.falling || []) +
+        renderMovers('키워드 급상승', trend.keywords_movers?.rising || []) +
+        renderMovers('키워드 감소', trend.keywords_movers?.falling || []);
+}
+
 // ============================================
 // 요약 카드 렌더링 (메타태그 리뷰수 사용)
 // ============================================
@@ -253,8 +425,8 @@ function renderSummaryCards() {
             const metaBlog = selectedStore.meta_blog_count || 0;
             const totalReviews = metaVisitor + metaBlog;
             
-            // 부정적 리뷰는 수집된 데이터에서 계산
-            const negativeCount = countNegativeReviews(selectedStore);
+            // 부정적 리뷰는 수집된 데이터에서 계산 (요약에 있으면 그대로)
+            const negativeCount = selectedStore.negative_count ?? countNegativeReviews(selectedStore);
             
             document.getElementById('totalReviews').textContent = formatNumber(totalReviews);
             document.getElementById('totalStores').textContent = selectedStore.store_name;
@@ -328,19 +500,31 @@ function renderChangeIndicator(elementId, changeValue) {
 // 필터링 및 렌더링
 // ============================================
 
-function filterAndRender() {
+async function filterAndRender() {
     if (!reviewData) return;
     
     renderSummaryCards();
     
+    const token = ++renderToken;
+    const stores = (reviewData.stores || []).filter(store => !currentStore || store.store_name === currentStore);
+    await loadStoreReviews(stores);
+    if (token !== renderToken) return;  // 로드 중에 필터가 바뀜
+    
+    const query = searchQuery.toLowerCase();
+    if (query) {
+        await loadSearchIndexes(stores);
+        if (token !== renderToken) return;
+    }
+    
     let allReviews = [];
-    const stores = reviewData.stores || [];
     
     stores.forEach(store => {
-        if (currentStore && store.store_name !== currentStore) return;
+        const candidates = query ? searchCandidates(store, query) : null;
+        const visitorCount = (store.visitor_reviews || []).length;
         
         if (currentReviewType !== 'blog') {
-            (store.visitor_reviews || []).forEach(review => {
+            (store.visitor_reviews || []).forEach((review, i) => {
+                if (candidates && !candidates.has(i)) return;
                 const r = { ...review, store_name: store.store_name };
                 if (currentReviewType === 'negative' && !r.is_negative) return;
                 if (currentReviewType !== 'negative' || r.is_negative) {
@@ -350,7 +534,8 @@ function filterAndRender() {
         }
         
         if (currentReviewType !== 'visitor') {
-            (store.blog_reviews || []).forEach(review => {
+            (store.blog_reviews || []).forEach((review, i) => {
+                if (candidates && !candidates.has(visitorCount + i)) return;
                 const r = { ...review, store_name: store.store_name };
                 if (currentReviewType === 'negative' && !r.is_negative) return;
                 if (currentReviewType !== 'negative' || r.is_negative) {
@@ -360,8 +545,8 @@ function filterAndRender() {
         }
     });
     
-    if (searchQuery) {
-        const query = searchQuery.toLowerCase();
+    if (query) {
+        // 색인 후보에는 bigram이 모두 있지만 연속 여부는 여기서 확인
         allReviews = allReviews.filter(r => {
             const content = (r.content || '').toLowerCase();
             const author = (r.author || '').toLowerCase();
@@ -384,6 +569,7 @@ function filterAndRender() {
     displayedReviews = [];
     
     renderTagCloud();
+    renderTrends();
     renderInitialReviews();
 }
 
@@ -503,7 +689,7 @@ function createReviewCard(review, idx) {
             </div>
         </div>
         ${isBlog && review.title ? `<div class="review-title">${escapeHtml(review.title)}</div>` : ''}
-        ${renderImages(review.images)}
+        ${renderImages(review.images, imageManifest[review.id])}
         <div class="review-content">${escapeHtml(review.content || '')}</div>
         ${renderKeywords(review.keywords)}
         ${renderTags(review.tags)}
@@ -526,7 +712,8 @@ function createReviewCard(review, idx) {
 // 이미지 렌더링
 // ============================================
 
-function renderImages(images) {
+function renderImages(images, cached) {
+    if (cached && cached.length) images = cached.map(([thumb]) => thumb);
     if (!images || images.length === 0) return '';
     
     const maxImages = Math.min(4, images.length);
@@ -639,7 +826,8 @@ function showReviewModal(review) {
     const isNegative = review.is_negative;
     const dateRaw = review.visit_date_raw || review.write_date_raw || '';
     
-    const modalImages = (review.images || []).map(url => {
+    const cached = imageManifest[review.id];
+    const modalImages = cached && cached.length ? cached.map(([, full]) => full) : (review.images || []).map(url => {
         if (url.includes('pstatic.net')) {
             return url.replace(/type=\w+/, 'type=w750');
         }
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+매출 대비 발주율 리포트 생성
+- KIS 매출(SHOP_CD/SHOP_NM)과 사조 발주(지점명)를 지점 레지스트리로 연결
+- 지점별 일/주/월 매출, 발주금액, 발주율 집계
+- 대시보드/AI 채팅용 JSON 생성
+"""
+
+import os
+import json
+from datetime import datetime
+from collections import defaultdict
+
+from store_registry import StoreRegistry
+from calendar_dim import to_date, calendar_for
+from generate_sales_report import load_sales_data, parse_int
+from generate_report import load_master_data
+
+
+def calc_ratio(cost, sales):
+    """발주율 (%)"""
+    if not sales:
+        return None
+    return round(cost / sales * 100, 1)
+
+
+def aggregate_daily(sales_data, order_data, registry):
+    """지점 ID x 일자별 매출/발주금액 집계"""
+    sales = defaultdict(lambda: defaultdict(int))
+    cost = defaultdict(lambda: defaultdict(int))
+
+    for item in sales_data:
+        sale_date = to_date(item.get('SALE_DATE'))
+        shop_cd = str(item.get('SHOP_CD', '') or '')
+        if not sale_date or not shop_cd:
+            continue
+        date_str = sale_date.isoformat()
+
+        store_id = registry.resolve(item.get('SHOP_NM'), code=shop_cd)
+        if not store_id:
+            continue
+
+        total_sale = parse_int(item.get('DCM_SALE_AMT', 0))
+        if total_sale == 0:
+            total_sale = (
+                parse_int(item.get('GEN_DCM_SALE_AMT', 0)) +
+                parse_int(item.get('DLV_DCM_SALE_AMT', 0)) +
+                parse_int(item.get('PKG_DCM_SALE_AMT', 0))
+            )
+        sales[store_id][date_str] += total_sale
+
+    for item in order_data:
+        date_str = str(item.get('조회일자', '') or '').strip()
+        if not date_str:
+            continue
+
+        store_id = registry.resolve(item.get('지점명'))
+        if not store_id:
+            continue
+
+        cost[store_id][date_str] += parse_int(item.get('합계', 0))
+
+    return sales, cost
+
+
+def rollup(keys, sales_row, cost_row, key_name):
+    """일별 배열을 주/월 단위로 합산 (keys: 일자 인덱스별 주차/월 키)"""
+    buckets = {}
+    for i, key in enumerate(keys):
+        if key not in buckets:
+            buckets[key] = {key_name: key, "sales": 0, "cost": 0, "days": 0}
+        buckets[key]["sales"] += sales_row[i]
+        buckets[key]["cost"] += cost_row[i]
+        buckets[key]["days"] += 1
+
+    result = []
+    for key in sorted(buckets.keys()):
+        bucket = buckets[key]
+        bucket["ratio"] = calc_ratio(bucket["cost"], bucket["sales"])
+        result.append(bucket)
+    return result
+
+
+def generate_report():
+    sales_data = load_sales_data()
+    order_data = load_master_data()
+
+    if not sales_data and not order_data:
+        print("[INFO] No data")
+        save_report(create_empty_report())
+        return
+
+    registry = StoreRegistry()
+    sales, cost = aggregate_daily(sales_data, order_data, registry)
+
+    if registry.unresolved:
+        print(f"[WARN] 레지스트리에 없는 지점명 {len(registry.unresolved)}개:")
+        for name in sorted(registry.unresolved):
+            print(f"  - {name}")
+
+    all_dates = set()
+    for by_date in list(sales.values()) + list(cost.values()):
+        all_dates.update(by_date.keys())
+
+    # 전체 기간 날짜 테이블 - 일자 인덱스로 일/주/월 배열 정렬
+    cal = calendar_for(all_dates)
+    dates = cal.dates if cal else []
+
+    store_ids = [s for s in registry.stores if s in sales or s in cost]
+
+    daily = {}
+    weekly = {}
+    monthly = {}
+    store_list = []
+    total_sales = 0
+    total_cost = 0
+
+    for store_id in store_ids:
+        sales_row = [sales[store_id].get(d, 0) for d in dates]
+        cost_row = [cost[store_id].get(d, 0) for d in dates]
+
+        daily[store_id] = {
+            "sales": sales_row,
+            "cost": cost_row,
+            "ratio": [calc_ratio(c, s) for s, c in zip(sales_row, cost_row)]
+        }
+        weekly[store_id] = rollup(cal.week_keys, sales_row, cost_row, "week")
+        monthly[store_id] = rollup(cal.month_keys, sales_row, cost_row, "month")
+
+        store_sales = sum(sales_row)
+        store_cost = sum(cost_row)
+        total_sales += store_sales
+        total_cost += store_cost
+
+        store_list.append({
+            "id": store_id,
+            "name": registry.name(store_id),
+            "sales": store_sales,
+            "cost": store_cost,
+            "ratio": calc_ratio(store_cost, store_sales)
+        })
+
+    print(f"[INFO] Stores: {len(store_list)}")
+    print(f"[INFO] Days: {len(dates)}")
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "summary": {
+            "total_stores": len(store_list),
+            "total_days": len(dates),
+            "date_range": {
+                "start": dates[0] if dates else None,
+                "end": dates[-1] if dates else None
+            },
+            "total_sales": total_sales,
+            "total_cost": total_cost,
+            "cost_ratio": calc_ratio(total_cost, total_sales),
+            "unresolved_stores": sorted(registry.unresolved)
+        },
+        "stores": store_list,
+        "dates": dates,
+        "daily": daily,
+        "weekly": weekly,
+        "monthly": monthly
+    }
+
+    save_report(report)
+
+
+def create_empty_report():
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "summary": {
+            "total_stores": 0,
+            "total_days": 0,
+            "date_range": {"start": None, "end": None},
+            "total_sales": 0,
+            "total_cost": 0,
+            "cost_ratio": None,
+            "unresolved_stores": []
+        },
+        "stores": [],
+        "dates": [],
+        "daily": {},
+        "weekly": {},
+        "monthly": {}
+    }
+
+
+def save_report(report):
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # output 폴더
+    output_dir = os.path.join(script_dir, "output")
+    os.makedirs(output_dir, exist_ok=True)
+    output_file = os.path.join(output_dir, "cost_report.json")
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[SAVE] {output_file}")
+
+    # docs 폴더 (대시보드용, 공백 없이)
+    docs_dir = os.path.join(script_dir, "docs")
+    os.makedirs(docs_dir, exist_ok=True)
+    docs_file = os.path.join(docs_dir, "cost_data.json")
+
+    with open(docs_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"[SAVE] {docs_file}")
+
+    print(f"\n[DONE] Report generated:")
+    print(f"  - Stores: {len(report.get('stores', []))}")
+    print(f"  - Days: {len(report.get('dates', []))}")
+    print(f"  - Cost ratio: {report['summary'].get('cost_ratio')}%")
+
+
+if __name__ == "__main__":
+    generate_report()
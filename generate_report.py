@@ -10,6 +10,8 @@ import json
 from datetime import datetime
 from collections import defaultdict
 
+from calendar_dim import calendar_for, WEEKDAY_NAMES
+
 
 def load_master_data():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -196,6 +198,25 @@ def generate_report():
     # 날짜 범위
     dates = sorted(daily_sales.keys())
     
+    # 주별/월별/요일별 발주 집계 (날짜 차원 테이블 조회)
+    cal = calendar_for(dates)
+    weekly_sales = defaultdict(lambda: {"count": 0, "total": 0, "items": 0, "days": 0})
+    monthly_sales = defaultdict(lambda: {"count": 0, "total": 0, "items": 0, "days": 0})
+    weekday_sales = defaultdict(lambda: {"count": 0, "total": 0, "items": 0, "days": 0})
+    
+    for date_str in dates:
+        idx = cal.index(date_str) if cal else None
+        if idx is None:
+            continue
+        day = daily_sales[date_str]
+        for bucket in (weekly_sales[cal.week_keys[idx]],
+                       monthly_sales[cal.month_keys[idx]],
+                       weekday_sales[cal.weekdays[idx]]):
+            bucket["count"] += day["count"]
+            bucket["total"] += day["total"]
+            bucket["items"] += day["items"]
+            bucket["days"] += 1
+    
     # 검증 출력
     print("\n[CHECK] Data consistency:")
     print(f"  store_list: {len(store_list)}")
@@ -227,6 +248,12 @@ def generate_report():
         },
         "daily": dict(sorted(daily_sales.items())),
         "daily_details": {k: v for k, v in sorted(daily_details.items())},
+        "weekly": [{"week": k, **v} for k, v in sorted(weekly_sales.items())],
+        "monthly": [{"month": k, **v} for k, v in sorted(monthly_sales.items())],
+        "weekday": [
+            {"weekday": k, "name": WEEKDAY_NAMES[k], **v}
+            for k, v in sorted(weekday_sales.items())
+        ],
         "stores": [
             {"name": k, "count": v["count"], "total": v["total"]} 
             for k, v in sorted(store_sales.items(), key=lambda x: -x[1]["total"])
@@ -314,6 +341,9 @@ def create_empty_report():
         },
         "daily": {},
         "daily_details": {},
+        "weekly": [],
+        "monthly": [],
+        "weekday": [],
         "stores": [],
         "categories": [],
         "price_changes": [],
@@ -10,6 +10,8 @@ import json
 from datetime import datetime
 from collections import defaultdict
 
+from calendar_dim import calendar_for, WEEKDAY_NAMES
+
 
 def load_sales_data():
     """매출 데이터 로드"""
@@ -39,37 +41,6 @@ def parse_int(value):
         return 0
 
 
-def format_date(date_str):
-    """날짜 형식 변환 (YYYYMMDD -> YYYY-MM-DD)"""
-    if not date_str or len(str(date_str)) != 8:
-        return date_str
-    d = str(date_str)
-    return f"{d[:4]}-{d[4:6]}-{d[6:8]}"
-
-
-def get_week_key(date_str):
-    """주차 키 생성 (YYYY-WXX)"""
-    try:
-        if len(date_str) == 8:
-            dt = datetime.strptime(date_str, '%Y%m%d')
-        else:
-            dt = datetime.strptime(date_str, '%Y-%m-%d')
-        year, week, _ = dt.isocalendar()
-        return f"{year}-W{week:02d}"
-    except:
-        return None
-
-
-def get_month_key(date_str):
-    """월 키 생성 (YYYY-MM)"""
-    if not date_str:
-        return None
-    d = str(date_str).replace('-', '')
-    if len(d) >= 6:
-        return f"{d[:4]}-{d[4:6]}"
-    return None
-
-
 def generate_report():
     """리포트 생성"""
     data = load_sales_data()
@@ -193,49 +164,42 @@ def generate_report():
     # 날짜 정렬
     sorted_dates = sorted(all_dates)
     
-    # 주별 집계
-    weekly_totals = defaultdict(lambda: {
-        "hall": 0,
-        "delivery": 0,
-        "packaging": 0,
-        "total": 0,
-        "count": 0,
-        "customers": 0,
-        "days": 0
-    })
+    # 날짜 차원 테이블 (일자 인덱스 -> 주차/월/요일)
+    cal = calendar_for(sorted_dates)
+    day_index = {d: cal.index(d) if cal else None for d in sorted_dates}
     
-    for date_str, day_data in daily_totals.items():
-        week_key = get_week_key(date_str)
-        if week_key:
-            weekly_totals[week_key]["hall"] += day_data["hall"]
-            weekly_totals[week_key]["delivery"] += day_data["delivery"]
-            weekly_totals[week_key]["packaging"] += day_data["packaging"]
-            weekly_totals[week_key]["total"] += day_data["total"]
-            weekly_totals[week_key]["count"] += day_data["count"]
-            weekly_totals[week_key]["customers"] += day_data["customers"]
-            weekly_totals[week_key]["days"] += 1
+    def new_bucket():
+        return {
+            "hall": 0,
+            "delivery": 0,
+            "packaging": 0,
+            "total": 0,
+            "count": 0,
+            "customers": 0,
+            "days": 0
+        }
     
-    # 월별 집계
-    monthly_totals = defaultdict(lambda: {
-        "hall": 0,
-        "delivery": 0,
-        "packaging": 0,
-        "total": 0,
-        "count": 0,
-        "customers": 0,
-        "days": 0
-    })
+    def add_day(bucket, day_data):
+        bucket["hall"] += day_data["hall"]
+        bucket["delivery"] += day_data["delivery"]
+        bucket["packaging"] += day_data["packaging"]
+        bucket["total"] += day_data["total"]
+        bucket["count"] += day_data["count"]
+        bucket["customers"] += day_data["customers"]
+        bucket["days"] += 1
+    
+    # 주별/월별/요일별 집계
+    weekly_totals = defaultdict(new_bucket)
+    monthly_totals = defaultdict(new_bucket)
+    weekday_totals = defaultdict(new_bucket)
     
     for date_str, day_data in daily_totals.items():
-        month_key = get_month_key(date_str)
-        if month_key:
-            monthly_totals[month_key]["hall"] += day_data["hall"]
-            monthly_totals[month_key]["delivery"] += day_data["delivery"]
-            monthly_totals[month_key]["packaging"] += day_data["packaging"]
-            monthly_totals[month_key]["total"] += day_data["total"]
-            monthly_totals[month_key]["count"] += day_data["count"]
-            monthly_totals[month_key]["customers"] += day_data["customers"]
-            monthly_totals[month_key]["days"] += 1
+        idx = day_index.get(date_str)
+        if idx is None:
+            continue
+        add_day(weekly_totals[cal.week_keys[idx]], day_data)
+        add_day(monthly_totals[cal.month_keys[idx]], day_data)
+        add_day(weekday_totals[cal.weekdays[idx]], day_data)
     
     # 지점 리스트 생성 (이름순 정렬)
     store_list = []
@@ -257,9 +221,12 @@ def generate_report():
     daily_list = []
     for date_str in sorted_dates:
         day_data = daily_totals[date_str]
+        idx = day_index[date_str]
         daily_list.append({
-            "date": format_date(date_str),
+            "date": cal.dates[idx] if idx is not None else date_str,
             "date_raw": date_str,
+            "weekday": cal.weekdays[idx] if idx is not None else None,
+            "is_holiday": cal.is_holiday[idx] if idx is not None else False,
             "hall": day_data["hall"],
             "delivery": day_data["delivery"],
             "packaging": day_data["packaging"],
@@ -272,7 +239,8 @@ def generate_report():
     # 일별-지점별 상세 데이터
     daily_store_data = {}
     for date_str, store_data in daily_data.items():
-        formatted_date = format_date(date_str)
+        idx = day_index.get(date_str)
+        formatted_date = cal.dates[idx] if idx is not None else date_str
         daily_store_data[formatted_date] = []
         for shop_cd, values in store_data.items():
             store_info = stores.get(shop_cd, {})
@@ -302,6 +270,20 @@ def generate_report():
             "days": week_data["days"]
         })
     
+    # 요일별 리스트 (월~일)
+    weekday_list = []
+    for weekday in sorted(weekday_totals.keys()):
+        wd_data = weekday_totals[weekday]
+        weekday_list.append({
+            "weekday": weekday,
+            "name": WEEKDAY_NAMES[weekday],
+            "total": wd_data["total"],
+            "count": wd_data["count"],
+            "customers": wd_data["customers"],
+            "days": wd_data["days"],
+            "avg_total": round(wd_data["total"] / wd_data["days"]) if wd_data["days"] else 0
+        })
+    
     # 월별 리스트
     monthly_list = []
     for month_key in sorted(monthly_totals.keys()):
@@ -330,8 +312,8 @@ def generate_report():
             "total_stores": len(stores),
             "total_days": len(sorted_dates),
             "date_range": {
-                "start": format_date(sorted_dates[0]) if sorted_dates else None,
-                "end": format_date(sorted_dates[-1]) if sorted_dates else None
+                "start": daily_list[0]["date"] if daily_list else None,
+                "end": daily_list[-1]["date"] if daily_list else None
             },
             "total_sales": total_stats["total_sales"],
             "total_hall": total_stats["total_hall"],
@@ -345,6 +327,7 @@ def generate_report():
         "daily_detail": daily_store_data,
         "weekly": weekly_list,
         "monthly": monthly_list,
+        "weekday": weekday_list,
         "month_list": sorted(monthly_totals.keys(), reverse=True)
     }
     
@@ -372,6 +355,7 @@ def create_empty_report():
         "daily_detail": {},
         "weekly": [],
         "monthly": [],
+        "weekday": [],
         "month_list": []
     }
 
@@ -45,6 +45,8 @@ except ImportError as e:
     print(f"WebDriver Manager import error: {e}", flush=True)
     sys.exit(1)
 
+from browser_policy import KIS_POLICY, apply_policy, ensure_required, measure_policy, policy_mode
+
 sys.stdout.flush()
 
 
@@ -62,6 +64,8 @@ def setup_driver():
     try:
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
+        # 이미지/폰트/미디어/분석 스크립트는 CDP로 차단 (IBSheet/메뉴 스크립트는 허용)
+        apply_policy(driver, KIS_POLICY)
         print("[SETUP] Chrome 드라이버 설정 완료", flush=True)
         return driver
     except Exception as e:
@@ -524,6 +528,10 @@ def main():
         
         login_to_kis(driver)
         
+        if policy_mode() == 'measure':
+            measure_policy(driver, driver.current_url, KIS_POLICY)
+        ensure_required(driver, KIS_POLICY)
+        
         navigate_to_sales_page(driver)
         
         set_date_and_search(driver, start_date, end_date)
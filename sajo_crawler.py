@@ -11,6 +11,8 @@ import json
 from datetime import datetime, timedelta
 from collections import defaultdict
 import re
+import queue
+import threading
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -23,8 +25,12 @@ from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+from browser_policy import SAJO_POLICY, apply_policy, ensure_required, measure_policy, policy_mode
+
 
 class SajoCrawler:
+    PARSE_QUEUE_SIZE = 4  # 파싱 대기 중인 페이지 수 상한 (HTML 메모리 제한)
+    
     def __init__(self):
         self.driver = None
         self.base_url = "https://sajo-order.fusewith.com"
@@ -61,7 +67,6 @@ class SajoCrawler:
             chrome_options.add_argument("--window-size=1920,1080")
             chrome_options.add_argument("--disable-blink-features=AutomationControlled")
             chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-images")
             chrome_options.add_argument("--log-level=3")
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
             chrome_options.add_argument(
@@ -72,6 +77,8 @@ class SajoCrawler:
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.implicitly_wait(10)
+            # 이미지/폰트/미디어/분석 스크립트는 CDP로 차단 (IBSheet/OnList 스크립트는 허용)
+            apply_policy(self.driver, SAJO_POLICY)
             
             print("[SUCCESS] WebDriver ready.")
             return True
@@ -131,10 +138,15 @@ class SajoCrawler:
             return False
     
     def parse_order_data(self, date_str):
+        return self.parse_order_html(self.driver.page_source, date_str)
+    
+    @staticmethod
+    def parse_order_html(html, date_str):
+        """조회 결과 페이지 HTML -> 주문 행 목록 (드라이버 없이 파싱 스레드에서 호출)"""
         data_list = []
         
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             rows = soup.find_all('tr')
             
             for row in rows:
@@ -167,6 +179,25 @@ class SajoCrawler:
         
         return data_list
     
+    def parse_worker(self, pages, results, timing):
+        """
+        파싱 스레드 - 큐에서 (순번, 날짜, HTML)을 받아 파싱 (None이면 종료)
+        결과는 results[날짜] = (순번, 주문 행 목록, 파싱 예외 또는 None) - 출력은 조회 스레드가 join 후에
+        한 페이지에서 예외가 나도 큐를 계속 비움 (스레드가 죽으면 조회 스레드가 pages.put에서 멈춤)
+        """
+        while True:
+            page = pages.get()
+            if page is None:
+                break
+            day_count, date_str, html = page
+            try:
+                parse_started = time.time()
+                daily_data = self.parse_order_html(html, date_str)
+                timing['parse'] += time.time() - parse_started
+                results[date_str] = (day_count, daily_data, None)
+            except Exception as e:
+                results[date_str] = (day_count, [], e)
+    
     def load_existing_data(self):
         master_file = os.path.join(self.data_dir, "master_data.json")
         if os.path.exists(master_file):
@@ -235,8 +266,12 @@ class SajoCrawler:
             if not self.login():
                 sys.exit(1)
             
-            self.driver.get(self.order_list_url)
+            if policy_mode() == 'measure':
+                measure_policy(self.driver, self.order_list_url, SAJO_POLICY)
+            else:
+                self.driver.get(self.order_list_url)
             time.sleep(3)
+            ensure_required(self.driver, SAJO_POLICY)
             
             start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
             end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
@@ -245,34 +280,65 @@ class SajoCrawler:
             existing_data = self.load_existing_data()
             existing_dates = set(item['조회일자'] for item in existing_data)
             
-            new_data = []
+            # 브라우저(조회 + HTML 캡처)와 파싱(BeautifulSoup)을 겹쳐서 실행
+            # 조회 스레드가 다음 날짜를 요청하는 동안 파싱 스레드가 이전 날짜 HTML을 파싱
+            pages = queue.Queue(maxsize=self.PARSE_QUEUE_SIZE)
+            results = {}
+            timing = {'fetch': 0.0, 'parse': 0.0, 'pause': 0.0}
+            parser = threading.Thread(target=self.parse_worker, args=(pages, results, timing), daemon=True)
+            parser.start()
+            loop_started = time.time()
+            
             current_date = start_date
             day_count = 0
             
             print(f"\n[START] Collecting data ({total_days} days)")
             print("-" * 70)
             
-            while current_date <= end_date:
-                day_count += 1
-                date_str = current_date.strftime("%Y-%m-%d")
-                progress = (day_count / total_days) * 100
-                
-                if date_str in existing_dates:
-                    print(f"[{day_count:4}/{total_days}] {date_str} ({progress:5.1f}%) -> Already exists (skip)")
+            try:
+                while current_date <= end_date:
+                    day_count += 1
+                    date_str = current_date.strftime("%Y-%m-%d")
+                    progress = (day_count / total_days) * 100
+                    
+                    if date_str in existing_dates:
+                        print(f"[{day_count:4}/{total_days}] {date_str} ({progress:5.1f}%) -> Already exists (skip)")
+                        current_date += timedelta(days=1)
+                        continue
+                    
+                    fetch_started = time.time()
+                    if self.set_date_and_search(date_str):
+                        html = self.driver.page_source
+                        timing['fetch'] += time.time() - fetch_started
+                        pages.put((day_count, date_str, html))
+                    else:
+                        timing['fetch'] += time.time() - fetch_started
+                        print(f"[{day_count:4}/{total_days}] {date_str} ({progress:5.1f}%) -> Failed")
+                    
                     current_date += timedelta(days=1)
+                    time.sleep(0.3)
+                    timing['pause'] += 0.3
+            finally:
+                pages.put(None)
+                parser.join()
+            
+            loop_seconds = time.time() - loop_started
+            
+            # 날짜 순서대로 출력/합치기 (파싱 완료 순서와 무관)
+            new_data = []
+            for date_str in sorted(results):
+                day_count, daily_data, error = results[date_str]
+                if error:
+                    print(f"[{day_count:4}/{total_days}] {date_str} -> Parse failed: {error}")
                     continue
-                
-                print(f"[{day_count:4}/{total_days}] {date_str} ({progress:5.1f}%)", end="")
-                
-                if self.set_date_and_search(date_str):
-                    daily_data = self.parse_order_data(date_str)
-                    new_data.extend(daily_data)
-                    print(f" -> {len(daily_data):4} records")
-                else:
-                    print(" -> Failed")
-                
-                current_date += timedelta(days=1)
-                time.sleep(0.3)
+                print(f"[{day_count:4}/{total_days}] {date_str} -> {len(daily_data):4} records")
+                new_data.extend(daily_data)
+            
+            # 순차 실행이었다면: 조회 + 파싱 + 날짜 사이 대기
+            sequential = timing['fetch'] + timing['parse'] + timing['pause']
+            print(f"[PIPELINE] fetch {timing['fetch']:.1f}s + parse {timing['parse']:.1f}s "
+                  f"+ pause {timing['pause']:.1f}s = sequential {sequential:.1f}s "
+                  f"-> overlapped {loop_seconds:.1f}s (saved {sequential - loop_seconds:.1f}s)")
             
             print("-" * 70)
             print(f"[COMPLETE] New data: {len(new_data):,} records")
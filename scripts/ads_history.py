@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 광고 데이터 일별 이력 (변경분만 저장)
+- deltas.jsonl: 실행마다 이전 상태와 달라진 키워드 필드만 한 줄씩 추가 (append-only)
+  (사라진 필드는 None, 삭제된 키워드는 키워드 값 자체가 None)
+- index.json: 키워드별 변경 (날짜, 줄 번호) 목록 + 최신 상태
+- 대시보드용 시계열(최근 N일)은 변경분을 재생해서 생성
+"""
+
+import os
+import json
+from datetime import datetime, timedelta
+
+
+# 필드 키 (저장 용량을 줄이기 위해 짧게)
+# qc_pc/qc_m: 월간 검색량, comp: 경쟁정도, m1~m5/p1~p5: 모바일/PC 순위별 입찰가, bid: 현재 입찰가
+SERIES_FIELDS = ['qc_pc', 'qc_m', 'm1', 'p1']
+
+
+def keyword_state(result):
+    """ads_data.json 결과 -> {키워드: {필드: 값}}"""
+    state = {}
+
+    for kw in result.get('keywords', []):
+        text = kw.get('keyword', '')
+        if not text:
+            continue
+        fields = state.setdefault(text, {})
+        if 'bidAmt' in kw and 'bid' not in fields:
+            fields['bid'] = kw.get('bidAmt')
+
+        stats = result.get('keyword_stats', {}).get(text)
+        if stats:
+            fields['qc_pc'] = stats.get('monthlyPcQcCnt', 0)
+            fields['qc_m'] = stats.get('monthlyMobileQcCnt', 0)
+            fields['comp'] = stats.get('compIdx', '')
+
+    for text, landscape in result.get('keyword_rank_bids', {}).items():
+        fields = state.setdefault(text, {})
+        for item in landscape:
+            rank = item.get('rank')
+            fields[f'm{rank}'] = item.get('mobileBid', 0)
+            fields[f'p{rank}'] = item.get('pcBid', 0)
+
+    return state
+
+
+def diff_state(prev, curr):
+    """이전 상태 대비 바뀐 필드만 (사라진 필드는 None, 현재 상태에 없는 키워드는 None)"""
+    changes = {}
+    for text, fields in curr.items():
+        old = prev.get(text, {})
+        delta = {k: v for k, v in fields.items() if old.get(k) != v}
+        delta.update({k: None for k in old if k not in fields})
+        if delta:
+            changes[text] = delta
+    for text in prev:
+        if text not in curr:
+            changes[text] = None
+    return changes
+
+
+def apply_changes(state, changes):
+    """변경분을 상태에 반영 (None 필드는 제거, None 키워드는 삭제)"""
+    for text, delta in changes.items():
+        if delta is None:
+            state.pop(text, None)
+            continue
+        fields = state.setdefault(text, {})
+        for k, v in delta.items():
+            if v is None:
+                fields.pop(k, None)
+            else:
+                fields[k] = v
+
+
+def load_index(history_dir):
+    index_file = os.path.join(history_dir, 'index.json')
+    if os.path.exists(index_file):
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[HISTORY] 인덱스 로드 실패: {e}", flush=True)
+    return {'lines': 0, 'dates': [], 'keywords': {}, 'state': {}}
+
+
+def record_snapshot(result, history_dir, date_str=None):
+    """
+    현재 수집 결과의 변경분을 deltas.jsonl에 추가하고 인덱스 갱신
+    반환: 변경된 키워드 수
+    """
+    os.makedirs(history_dir, exist_ok=True)
+    date_str = date_str or datetime.now().strftime('%Y-%m-%d')
+
+    index = load_index(history_dir)
+    curr = keyword_state(result)
+    changes = diff_state(index.get('state', {}), curr)
+
+    if changes:
+        line_no = index.get('lines', 0)
+        with open(os.path.join(history_dir, 'deltas.jsonl'), 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'date': date_str, 'changes': changes}, ensure_ascii=False) + '\n')
+
+        index['lines'] = line_no + 1
+        for text in changes:
+            index['keywords'].setdefault(text, []).append([date_str, line_no])
+
+        state = index.get('state', {})
+        apply_changes(state, changes)
+        index['state'] = state
+
+    if date_str not in index['dates']:
+        index['dates'].append(date_str)
+
+    with open(os.path.join(history_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+
+    print(f"[HISTORY] {date_str}: {len(changes)}/{len(curr)}개 키워드 변경 저장", flush=True)
+    return len(changes)
+
+
+def build_series(history_dir, days=90, fields=SERIES_FIELDS, end_date=None):
+    """
+    최근 days일 키워드별 시계열 (변경이 없던 날은 직전 값 유지)
+    반환: {"dates": [...], "series": {키워드: {필드: [...]}}}
+    """
+    deltas_file = os.path.join(history_dir, 'deltas.jsonl')
+    end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+    dates = [(end - timedelta(days=days - 1 - i)).strftime('%Y-%m-%d') for i in range(days)]
+
+    # 이력 시작일 이전 날짜는 제외 (빈 값만 있는 구간)
+    recorded = load_index(history_dir).get('dates', [])
+    if recorded:
+        dates = [d for d in dates if d >= min(recorded)]
+
+    # 날짜별 마지막 변경분 적용 후 상태를 일자 인덱스에 기록
+    state = {}
+    series = {}
+    day_idx = 0
+
+    def fill_until(limit):
+        nonlocal day_idx
+        while day_idx < len(dates) and dates[day_idx] < limit:
+            for text, kw_fields in state.items():
+                row = series.setdefault(text, {f: [None] * len(dates) for f in fields})
+                for f in fields:
+                    row[f][day_idx] = kw_fields.get(f)
+            day_idx += 1
+
+    if os.path.exists(deltas_file):
+        with open(deltas_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # 이 변경 날짜 이전 날들은 현재 상태로 채움
+                fill_until(entry['date'])
+                apply_changes(state, entry['changes'])
+
+    fill_until('9999-12-31')
+
+    # 기간 내 값이 전혀 없는 키워드 제외
+    series = {
+        text: row for text, row in series.items()
+        if any(v is not None for values in row.values() for v in values)
+    }
+
+    return {'dates': dates, 'fields': list(fields), 'series': series}
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 광고 성과 (노출/클릭/비용) 일별 저장소
+- 대용량 리포트(AD_DETAIL) TSV를 한 줄씩 읽어 키워드 x 기기별로 합산
+- output/ads_performance/YYYY-MM-DD.json: 하루 한 파일 (같은 날짜 재수집 시 교체)
+- 대시보드용 요약(최근 N일 일별 합계 + 키워드별 합계) 생성
+"""
+
+import os
+import json
+from datetime import datetime, timedelta
+
+
+# AD_DETAIL 리포트 컬럼 (헤더 없는 TSV)
+# 0 Date, 1 Customer ID, 2 Campaign ID, 3 AD Group ID, 4 AD keyword ID, 5 AD ID,
+# 6 Business Channel ID, 7 Media code, 8 PC Mobile Type, 9 Impression, 10 Click,
+# 11 Cost, 12 Sum of AD rank, 13 View count
+COL_DATE = 0
+COL_CAMPAIGN = 2
+COL_ADGROUP = 3
+COL_KEYWORD = 4
+COL_DEVICE = 8
+COL_IMP = 9
+COL_CLICK = 10
+COL_COST = 11
+COL_RANK_SUM = 12
+
+
+def to_number(val):
+    try:
+        return float(val) if '.' in val else int(val)
+    except (TypeError, ValueError):
+        return 0
+
+
+def aggregate_rows(rows):
+    """
+    TSV 행(문자열 리스트) 스트림 -> {키워드ID: {"M"|"P": {imp, clk, cost, rank_sum}}}
+    키워드가 없는 행(확장소재 등)은 광고그룹 ID로 합산
+    """
+    keywords = {}
+    count = 0
+
+    for row in rows:
+        if len(row) <= COL_RANK_SUM:
+            continue
+        count += 1
+
+        key = row[COL_KEYWORD]
+        if not key or key == '-':
+            key = row[COL_ADGROUP]
+        device = 'M' if row[COL_DEVICE] == 'M' else 'P'
+
+        entry = keywords.setdefault(key, {
+            'campaign': row[COL_CAMPAIGN],
+            'adgroup': row[COL_ADGROUP],
+        })
+        stat = entry.setdefault(device, {'imp': 0, 'clk': 0, 'cost': 0, 'rank_sum': 0})
+        stat['imp'] += to_number(row[COL_IMP])
+        stat['clk'] += to_number(row[COL_CLICK])
+        stat['cost'] += to_number(row[COL_COST])
+        stat['rank_sum'] += to_number(row[COL_RANK_SUM])
+
+    return keywords, count
+
+
+class PerformanceStore:
+    """날짜별 성과 파일 (output/ads_performance/YYYY-MM-DD.json)"""
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+
+    def _path(self, date_str):
+        return os.path.join(self.store_dir, f"{date_str}.json")
+
+    def has(self, date_str):
+        return os.path.exists(self._path(date_str))
+
+    def dates(self):
+        return sorted(
+            name[:-5] for name in os.listdir(self.store_dir)
+            if name.endswith('.json') and len(name) == 15
+        )
+
+    def missing(self, days, end_date=None):
+        """최근 days일(기본: 어제까지) 중 아직 저장되지 않은 날짜"""
+        end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now() - timedelta(days=1)
+        wanted = [(end - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(days)]
+        return [d for d in reversed(wanted) if not self.has(d)]
+
+    def write(self, date_str, rows):
+        """행 스트림을 합산해서 하루치 파일로 저장 (임시 파일 후 교체)"""
+        keywords, count = aggregate_rows(rows)
+        data = {'date': date_str, 'rows': count, 'keywords': keywords}
+
+        tmp = self._path(date_str) + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, self._path(date_str))
+        return count
+
+    def load(self, date_str):
+        with open(self._path(date_str), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def summary(self, days=30, keyword_names=None):
+        """
+        최근 days일 일별 합계 + 키워드별 기간 합계
+        keyword_names: {키워드ID: 키워드} (대시보드 표시용)
+        """
+        keyword_names = keyword_names or {}
+        dates = self.dates()[-days:]
+        daily = []
+        totals = {}
+
+        for date_str in dates:
+            day = {'date': date_str, 'imp': 0, 'clk': 0, 'cost': 0}
+            for key, entry in self.load(date_str).get('keywords', {}).items():
+                total = totals.setdefault(key, {
+                    'id': key,
+                    'keyword': keyword_names.get(key, ''),
+                    'imp': 0, 'clk': 0, 'cost': 0, 'rank_sum': 0
+                })
+                for device in ('M', 'P'):
+                    stat = entry.get(device)
+                    if not stat:
+                        continue
+                    for field in ('imp', 'clk', 'cost'):
+                        day[field] += stat[field]
+                        total[field] += stat[field]
+                    total['rank_sum'] += stat['rank_sum']
+            daily.append(day)
+
+        keywords = []
+        for total in totals.values():
+            rank_sum = total.pop('rank_sum')
+            total['avg_rank'] = round(rank_sum / total['imp'], 1) if total['imp'] else None
+            total['ctr'] = round(total['clk'] / total['imp'] * 100, 2) if total['imp'] else None
+            total['cpc'] = round(total['cost'] / total['clk']) if total['clk'] else None
+            keywords.append(total)
+        keywords.sort(key=lambda x: -x['cost'])
+
+        return {'dates': dates, 'daily': daily, 'keywords': keywords}
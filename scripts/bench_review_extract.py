@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리뷰 목록 추출 비교 (고정 페이지, Selenium 필요)
+- tests/fixtures/review_pages/*.html을 크롬으로 열고 리뷰 항목을 repeat배로 복제
+- 이전 방식(항목/필드마다 find_elements + .text)과 execute_script 한 번 추출을 각각 실행해서
+  시간 비교 + 리뷰 필드/리뷰 ID가 모두 같은지 확인 (다르면 종료 코드 1)
+
+사용법:
+    python scripts/bench_review_extract.py
+    python scripts/bench_review_extract.py --repeat 100
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import naver_review_crawler as crawler
+
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'tests', 'fixtures', 'review_pages')
+COMPARE_FIELDS = ('id', 'author', 'content', 'keywords', 'tags', 'visit_date_raw', 'visit_info',
+                  'blog_name', 'title', 'write_date_raw')
+
+CLONE_JS = """
+const first = arguments[1].map(sel => document.querySelector(sel)).find(el => el);
+const list = first.parentElement;
+const items = Array.from(list.children);
+for (let i = 1; i < arguments[0]; i++) items.forEach(li => list.appendChild(li.cloneNode(true)));
+return list.children.length;
+"""
+
+
+def legacy_items(driver, kind):
+    """이전 방식 - 항목/필드마다 chromedriver 왕복 (.text)"""
+    by = crawler.By.CSS_SELECTOR
+
+    def first_text(item, selectors):
+        for sel in selectors:
+            els = item.find_elements(by, sel)
+            if els:
+                return els[0].text
+        return ''
+
+    def texts(item, sel):
+        return [el.text for el in item.find_elements(by, sel)]
+
+    selectors = crawler.VISITOR_ITEM_SELECTORS if kind == 'visitor' else crawler.BLOG_ITEM_SELECTORS
+    items = []
+    for sel in selectors:
+        items = driver.find_elements(by, sel)
+        if items:
+            break
+
+    result = []
+    for item in items:
+        if kind == 'visitor':
+            result.append({
+                'author': first_text(item, ['.pui__NMi-Dp', '[class*="NMi-Dp"]']),
+                'content': first_text(item, ['.pui__vn15t2', '[class*="vn15t2"]']),
+                'keywords': texts(item, '.pui__V8F9nN em'),
+                'tags': [t for t in texts(item, '.pui__jhpEyP') if t.strip() and not t.startswith('+')],
+                'date': first_text(item, ['.pui__gfuUIT time, time']),
+                'visit_info': texts(item, '.pui__gfuUIT'),
+            })
+        else:
+            result.append({
+                'author': first_text(item, ['.pui__NMi-Dp']),
+                'blog_name': first_text(item, ['.XR_ao']),
+                'title': first_text(item, ['.pui__dGLDWy']),
+                'content': first_text(item, ['.pui__vn15t2']),
+                'date': first_text(item, ['.u5XwJ time, time']),
+            })
+    return result
+
+
+def script_items(driver, kind):
+    script = crawler.VISITOR_EXTRACT_JS if kind == 'visitor' else crawler.BLOG_EXTRACT_JS
+    selectors = crawler.VISITOR_ITEM_SELECTORS if kind == 'visitor' else crawler.BLOG_ITEM_SELECTORS
+    items, _ = crawler.extract_review_items(driver, script, selectors)
+    return items
+
+
+def comparable(review):
+    values = {field: review.get(field) for field in COMPARE_FIELDS}
+    values['keywords'] = sorted(values['keywords'] or [])
+    return values
+
+
+def run_page(driver, kind, repeat):
+    path = os.path.join(FIXTURE_DIR, f"{kind}.html")
+    driver.get('file://' + path)
+    selectors = crawler.VISITOR_ITEM_SELECTORS if kind == 'visitor' else crawler.BLOG_ITEM_SELECTORS
+    count = driver.execute_script(CLONE_JS, repeat, selectors)
+    item_review = crawler.visitor_item_review if kind == 'visitor' else crawler.blog_item_review
+
+    started = time.time()
+    old = crawler.items_to_reviews(legacy_items(driver, kind), item_review)
+    old_seconds = time.time() - started
+
+    started = time.time()
+    new = crawler.items_to_reviews(script_items(driver, kind), item_review)
+    new_seconds = time.time() - started
+
+    diffs = [(i, field, a.get(field), b.get(field))
+             for i, (a, b) in enumerate(zip(map(comparable, old), map(comparable, new)))
+             for field in COMPARE_FIELDS if a[field] != b[field]]
+    if len(old) != len(new):
+        diffs.append((None, 'count', len(old), len(new)))
+
+    print(f"[BENCH] {kind}: 항목 {count}개 - 이전 {old_seconds:.2f}초, 스크립트 {new_seconds:.2f}초 "
+          f"({old_seconds / max(new_seconds, 1e-6):.0f}배), 리뷰 {len(new)}개", flush=True)
+    changed_ids = sum(1 for a, b in zip(old, new) if a['id'] != b['id'])
+    print(f"  리뷰 ID 불일치 {changed_ids}개, 필드 불일치 {len(diffs)}건", flush=True)
+    for i, field, a, b in diffs[:10]:
+        print(f"    #{i} {field}: {a!r} != {b!r}", flush=True)
+    return not diffs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리뷰 목록 추출 비교 (고정 페이지)')
+    parser.add_argument('--repeat', type=int, default=50, help='페이지 리뷰 항목 복제 배수 - 기본 50')
+    args = parser.parse_args()
+
+    crawler.load_browser_modules()
+    driver = crawler.setup_driver()
+    try:
+        same = all([run_page(driver, kind, args.repeat) for kind in ('visitor', 'blog')])
+    finally:
+        driver.quit()
+
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+키워드 감성 점수 회귀/성능 확인
+- reference_negative_score: 정규식 매처 이전의 calculate_negative_score (키워드마다 in/find) - 비교 기준
+- 저장된 리뷰를 반복하거나 합성 리뷰로 N건(기본 10만)을 두 구현으로 채점해서 시간 비교 + 결과 일치 확인
+- --write-corpus: 테스트용 고정 코퍼스(본문, 태그, 기대 점수/매칭 목록) 생성
+  (tests/fixtures/sentiment_corpus.json - 점수 규칙을 바꿀 때만 다시 생성)
+
+사용법:
+    python scripts/bench_sentiment.py
+    python scripts/bench_sentiment.py --reviews 100000 --synthetic
+    python scripts/bench_sentiment.py --write-corpus tests/fixtures/sentiment_corpus.json
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+
+from review_store import ReviewStore, KINDS
+from review_sentiment import (
+    NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS, NEGATION_PATTERNS, POSITIVE_TAGS,
+    calculate_negative_score,
+)
+
+
+def reference_negative_score(review):
+    """이전 구현 - 키워드마다 본문 검색, 첫 위치 앞뒤 15글자 안에서 부정어 확인"""
+    content = (review.get('content') or '').lower()
+    tags = review.get('tags') or []
+
+    score = 0
+    matched_keywords = []
+
+    for keyword, weight in NEGATIVE_KEYWORDS.items():
+        if keyword in content:
+            idx = content.find(keyword)
+            context = content[max(0, idx - 15):idx + len(keyword) + 15]
+
+            negated = False
+            for neg in NEGATION_PATTERNS:
+                neg_idx = context.find(neg)
+                kw_idx = context.find(keyword)
+                if neg_idx != -1 and neg_idx < kw_idx:
+                    negated = True
+                    break
+
+            if not negated:
+                score += weight
+                matched_keywords.append(f"-{keyword}({weight})")
+
+    for keyword, weight in POSITIVE_KEYWORDS.items():
+        if keyword in content:
+            score += weight
+            matched_keywords.append(f"+{keyword}({weight})")
+
+    tag_text = ' '.join(tags).lower()
+
+    for pt in POSITIVE_TAGS:
+        if pt in tag_text:
+            score -= 2
+            matched_keywords.append(f"+tag:{pt}")
+
+    for keyword, weight in NEGATIVE_KEYWORDS.items():
+        if keyword in tag_text:
+            score += weight
+            matched_keywords.append(f"-tag:{keyword}")
+
+    return score, matched_keywords
+
+
+def stored_reviews(review_dir):
+    """저장소의 리뷰 (본문/태그만)"""
+    if not os.path.isdir(review_dir):
+        return []
+    store = ReviewStore(review_dir)
+    return [
+        {'content': r.get('content') or '', 'tags': list(r.get('tags') or [])}
+        for place_id in store.stores for kind in KINDS for r in store.reviews(place_id, kind)
+    ]
+
+
+def synthetic_reviews(count, seed=1):
+    """키워드/부정어/접두사 조각을 이어 붙인 합성 리뷰 (겹치는 키워드, 부정어 거리 경계 포함)"""
+    rng = random.Random(seed)
+    pieces = (list(NEGATIVE_KEYWORDS) + list(POSITIVE_KEYWORDS) + NEGATION_PATTERNS
+              + ['맛', '있', '가', '나', ' ', 'a', 'jmt', '요', '.', '음식이 정말 ', '사장님이 '])
+    tag_pieces = pieces + POSITIVE_TAGS
+    reviews = []
+    for _ in range(count):
+        content = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 14)))
+        tags = [''.join(rng.choice(tag_pieces) for _ in range(rng.randint(1, 3)))
+                for _ in range(rng.randint(0, 2))]
+        reviews.append({'content': content, 'tags': tags})
+    return reviews
+
+
+def timed(func, reviews):
+    started = time.perf_counter()
+    results = [func(r) for r in reviews]
+    return results, time.perf_counter() - started
+
+
+def write_corpus(path, stored, stored_count, synthetic_count, seed):
+    """고정 코퍼스 - 저장된 리뷰 표본(고정 간격) + 합성 리뷰, 기대값은 이전 구현 결과"""
+    step = max(1, len(stored) // stored_count) if stored_count else 0
+    stored = stored[::step][:stored_count] if step else []
+    reviews = stored + synthetic_reviews(synthetic_count, seed)
+    corpus = [
+        {'content': r['content'], 'tags': r['tags'], 'expected': list(reference_negative_score(r))}
+        for r in reviews
+    ]
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"[SAVE] {path} (저장 리뷰 {len(stored)}개 + 합성 {synthetic_count}개, "
+          f"매칭 있음 {sum(1 for c in corpus if c['expected'][1])}개)", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 감성 점수 회귀/성능 확인')
+    parser.add_argument('--review-dir', type=str, default='output/reviews', help='리뷰 저장소')
+    parser.add_argument('--reviews', type=int, default=100000, help='채점할 리뷰 수 - 기본 100000')
+    parser.add_argument('--synthetic', action='store_true', help='저장된 리뷰 대신 합성 리뷰로')
+    parser.add_argument('--seed', type=int, default=1, help='합성 리뷰 시드')
+    parser.add_argument('--write-corpus', type=str, help='고정 코퍼스 파일 생성 후 종료')
+    parser.add_argument('--corpus-stored', type=int, default=200, help='코퍼스에 넣을 저장 리뷰 수')
+    parser.add_argument('--corpus-synthetic', type=int, default=1000, help='코퍼스에 넣을 합성 리뷰 수')
+    args = parser.parse_args()
+
+    stored = stored_reviews(args.review_dir)
+    if args.write_corpus:
+        write_corpus(args.write_corpus, stored, args.corpus_stored, args.corpus_synthetic, args.seed)
+        return
+
+    if args.synthetic or not stored:
+        reviews = synthetic_reviews(args.reviews, args.seed)
+        source = '합성'
+    else:
+        reviews = [stored[i % len(stored)] for i in range(args.reviews)]
+        source = f'저장 리뷰 {len(stored)}개 반복'
+
+    avg_len = sum(len(r['content']) for r in reviews) / max(len(reviews), 1)
+    print(f"[BENCH] 리뷰 {len(reviews):,}개 ({source}, 평균 {avg_len:.0f}자)", flush=True)
+
+    expected, old_seconds = timed(reference_negative_score, reviews)
+    actual, new_seconds = timed(calculate_negative_score, reviews)
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+
+    print(f"  이전 구현: {old_seconds:.2f}초 ({len(reviews) / old_seconds:,.0f}건/초)", flush=True)
+    print(f"  매처 구현: {new_seconds:.2f}초 ({len(reviews) / new_seconds:,.0f}건/초, "
+          f"{old_seconds / new_seconds:.1f}배)", flush=True)
+    print(f"  결과 불일치: {mismatches}건", flush=True)
+
+
+if __name__ == "__main__":
+    main()
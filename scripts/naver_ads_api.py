@@ -3,6 +3,8 @@
 """
 네이버 검색광고 API - 데이터 수집 v2
 - 순위별 입찰가(CPC) 조회 추가
+- 세션 재사용(keep-alive) + 동시 요청 + 토큰 버킷 속도 제한
+- 대용량 리포트(stat-reports) 작업으로 일별 노출/클릭/비용 수집
 """
 
 import os
@@ -12,19 +14,62 @@ import time
 import hmac
 import hashlib
 import base64
+import argparse
+import threading
+from urllib.parse import urlparse
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("requests 모듈 필요: pip install requests")
     sys.exit(1)
 
+from ads_history import record_snapshot, build_series
+from ads_performance import PerformanceStore
+
+
+class TokenBucket:
+    """초당 rate개 요청, 최대 capacity개까지 순간 허용 (스레드 안전)"""
+    
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+DEFAULT_POSITIONS = (1, 2, 3, 4, 5)
+DEFAULT_DEVICES = ('MOBILE', 'PC')
+REJECTED = object()  # 재시도하지 않는 4xx 응답 (_request의 invalid 값)
+
 
 class NaverAdsAPI:
     BASE_URL = "https://api.searchad.naver.com"
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+    INVALID_STATUS = {400, 404, 422}  # 요청 내용 오류 (재시도/인증 오류와 구분)
+    MAX_ESTIMATE_ITEMS = 100  # average-position-bid 요청당 최대 항목 수
+    KEYWORD_IDS_BATCH = 100  # /ncc/keywords?ids= 요청당 키워드 ID 수
+    REPORT_DONE = {'BUILT', 'NONE', 'ERROR'}  # stat-reports 최종 상태 (NONE: 데이터 없음)
     
-    def __init__(self):
+    def __init__(self, rate=8, workers=4, max_retries=4, base_url=None):
         self.api_key = os.environ.get('NAVER_AD_API_KEY')
         self.secret_key = os.environ.get('NAVER_AD_SECRET_KEY')
         self.customer_id = os.environ.get('NAVER_AD_CUSTOMER_ID')
@@ -32,7 +77,44 @@ class NaverAdsAPI:
         if not all([self.api_key, self.secret_key, self.customer_id]):
             raise ValueError("API 인증 정보가 없습니다. GitHub Secrets를 확인하세요.")
         
-        print(f"[INFO] API 초기화 완료 (Customer: {self.customer_id})", flush=True)
+        if base_url:
+            self.BASE_URL = base_url
+        
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.bucket = TokenBucket(rate)
+        
+        # 커넥션 풀 (동시 요청 수만큼 keep-alive 연결 유지)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0, 'failed': 0}
+        self.stats_lock = threading.Lock()
+        self.started_at = time.monotonic()
+        
+        print(f"[INFO] API 초기화 완료 (Customer: {self.customer_id}, "
+              f"{rate}req/s, workers={self.workers})", flush=True)
+    
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+    
+    def map_concurrent(self, func, items):
+        """items 순서대로 func 결과 반환 (동시 실행)"""
+        items = list(items)
+        if self.workers == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(func, items))
+    
+    def report_stats(self):
+        elapsed = time.monotonic() - self.started_at
+        rps = self.stats['requests'] / elapsed if elapsed > 0 else 0
+        print(f"  API 요청: {self.stats['requests']}회 ({rps:.1f} req/s, {elapsed:.1f}초)", flush=True)
+        print(f"  재시도: {self.stats['retries']}회 (429: {self.stats['throttled']}회), "
+              f"실패: {self.stats['failed']}회", flush=True)
     
     def _sign(self, timestamp, method, path):
         message = f"{timestamp}.{method}.{path}"
@@ -43,131 +125,456 @@ class NaverAdsAPI:
         ).digest()
         return base64.b64encode(sig).decode()
     
-    def _request(self, method, path, params=None, data=None):
+    def _headers(self, method, path):
+        # 서명은 타임스탬프를 포함하므로 요청마다 새로 생성
         timestamp = str(int(time.time() * 1000))
-        
-        headers = {
+        return {
             'Content-Type': 'application/json; charset=UTF-8',
             'X-Timestamp': timestamp,
             'X-API-KEY': self.api_key,
             'X-Customer': str(self.customer_id),
             'X-Signature': self._sign(timestamp, method, path)
         }
+    
+    def _request(self, method, path, params=None, data=None, invalid=None):
+        """API 요청 - 실패 시 None (invalid: INVALID_STATUS 응답일 때 대신 반환할 값)"""
+        if method not in ('GET', 'POST', 'DELETE'):
+            return None
         
         url = f"{self.BASE_URL}{path}"
         
-        try:
-            if method == 'GET':
-                r = requests.get(url, headers=headers, params=params, timeout=30)
-            elif method == 'POST':
-                r = requests.post(url, headers=headers, json=data, timeout=30)
-            else:
-                return None
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            headers = self._headers(method, path)
             
-            if r.status_code == 200:
-                return r.json() if r.text else {}
-            else:
-                print(f"[ERROR] {method} {path} -> {r.status_code}: {r.text[:300]}", flush=True)
+            try:
+                self._count('requests')
+                r = self.session.request(
+                    method, url, headers=headers,
+                    params=params if method != 'POST' else None,
+                    json=data if method == 'POST' else None,
+                    timeout=30
+                )
+            except Exception as e:
+                if attempt < self.max_retries:
+                    self._count('retries')
+                    time.sleep(min(2 ** attempt * 0.5, 8))
+                    continue
+                print(f"[ERROR] 요청 실패: {e}", flush=True)
+                self._count('failed')
                 return None
-                
-        except Exception as e:
-            print(f"[ERROR] 요청 실패: {e}", flush=True)
+            
+            if r.status_code in (200, 204):
+                if not r.text:
+                    return {}
+                try:
+                    return r.json()
+                except ValueError:
+                    # 점검/프록시 페이지 등 JSON이 아닌 성공 응답 - 호출부에는 실패(None)로
+                    print(f"[ERROR] {method} {path} -> {r.status_code} JSON 아님: {r.text[:300]}", flush=True)
+                    self._count('failed')
+                    return None
+            
+            if r.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                self._count('retries')
+                if r.status_code == 429:
+                    self._count('throttled')
+                # Retry-After 헤더 우선, 없으면 지수 백오프
+                try:
+                    delay = float(r.headers.get('Retry-After', ''))
+                except ValueError:
+                    delay = min(2 ** attempt * 0.5, 8)
+                time.sleep(delay)
+                continue
+            
+            print(f"[ERROR] {method} {path} -> {r.status_code}: {r.text[:300]}", flush=True)
+            self._count('failed')
+            if invalid is not None and r.status_code in self.INVALID_STATUS:
+                return invalid
             return None
+        
+        return None
     
     def get_campaigns(self):
         return self._request('GET', '/ncc/campaigns') or []
     
-    def get_adgroups(self, campaign_id):
-        return self._request('GET', '/ncc/adgroups', {'nccCampaignId': campaign_id}) or []
+    def get_adgroups(self, campaign_id=None):
+        """광고그룹 조회 (campaign_id가 없으면 계정 전체를 한 번에)"""
+        params = {'nccCampaignId': campaign_id} if campaign_id else None
+        return self._request('GET', '/ncc/adgroups', params) or []
     
     def get_keywords(self, adgroup_id):
+        """키워드 조회 (API가 광고그룹 필터를 요구하므로 광고그룹 단위)"""
         return self._request('GET', '/ncc/keywords', {'nccAdgroupId': adgroup_id}) or []
     
+    def get_keywords_by_ids(self, keyword_ids):
+        """키워드 ID 목록으로 조회 (광고그룹을 가리지 않고 요청당 KEYWORD_IDS_BATCH개)"""
+        return self._request('GET', '/ncc/keywords', {'ids': ','.join(keyword_ids)})
+    
     def get_keyword_stats(self, keywords):
-        """키워드 검색량 조회"""
+        """키워드 검색량 조회 (hintKeywords 최대 5개)"""
         if not keywords:
             return None
         
-        print(f"[API] 검색량 조회 (GET 방식)...", flush=True)
-        
         params = {
             'hintKeywords': ','.join(keywords),
             'showDetail': '1'
         }
         
-        result = self._request('GET', '/keywordstool', params=params)
-        
-        if result:
-            return result
-        
-        # POST 방식 재시도
-        print(f"[API] 검색량 조회 (POST 방식)...", flush=True)
-        data = {
-            'hintKeywords': ','.join(keywords),
-            'showDetail': '1'
-        }
-        
-        return self._request('POST', '/keywordstool', data=data)
+        # 429/5xx는 _request에서 재시도하므로 같은 배치를 POST로 다시 보내지 않음
+        return self._request('GET', '/keywordstool', params=params)
     
-    def get_rank_bids(self, keyword):
+    def get_rank_bids(self, keyword, positions=DEFAULT_POSITIONS, devices=DEFAULT_DEVICES):
         """
         순위별 입찰가 조회 (Average Position Bid API)
         1~5위까지 PC/모바일 입찰가 조회
         """
+        return self.get_rank_bids_batch([keyword], positions, devices).get(keyword, [])
+    
+    def get_rank_bids_batch(self, keywords, positions=DEFAULT_POSITIONS, devices=DEFAULT_DEVICES):
+        """
+        여러 키워드의 순위별 입찰가를 한 번에 조회
+        키워드 x 순위 항목을 요청당 MAX_ESTIMATE_ITEMS개까지 묶어서 전송
+        잘못된 키워드가 하나라도 있으면 묶음 전체가 INVALID_STATUS이므로 키워드를 반으로 나눠 다시 요청
+        (429/인증 오류 등은 나누지 않고 조회 실패로 처리)
+        반환: {키워드: [{"rank", "mobileBid", "pcBid"}, ...]}
+        """
         uri = '/estimate/average-position-bid/keyword'
         
-        results = {'PC': [], 'MOBILE': []}
+        keywords = list(dict.fromkeys(k for k in keywords if k))
+        items = [{"key": kw, "position": pos} for kw in keywords for pos in positions]
+        
+        chunks = [
+            (device, items[i:i + self.MAX_ESTIMATE_ITEMS])
+            for device in devices
+            for i in range(0, len(items), self.MAX_ESTIMATE_ITEMS)
+        ]
+        
+        print(f"[API] 순위별 입찰가 조회: {len(keywords)}개 키워드 x {len(positions)}개 순위 "
+              f"x {len(devices)}개 기기 → {len(chunks)}회 요청", flush=True)
+        
+        rejected = []
         
-        for device in ['MOBILE', 'PC']:
-            # 1~5위까지 조회
-            items = [{"key": keyword, "position": pos} for pos in range(1, 6)]
+        def fetch(chunk):
+            device, chunk_items = chunk
+            response = self._request('POST', uri, data={"device": device, "items": chunk_items},
+                                     invalid=REJECTED)
+            if response is REJECTED:
+                chunk_keywords = list(dict.fromkeys(item['key'] for item in chunk_items))
+                if len(chunk_keywords) == 1:
+                    rejected.append((device, chunk_keywords[0]))
+                    return []
+                half = set(chunk_keywords[:len(chunk_keywords) // 2])
+                return (fetch((device, [item for item in chunk_items if item['key'] in half]))
+                        + fetch((device, [item for item in chunk_items if item['key'] not in half])))
+            if not response:
+                print(f"  → {device}: 조회 실패 ({len(chunk_items)}개 항목)", flush=True)
+                return [(device, chunk_items, [])]
+            return [(device, chunk_items, response.get("estimate", []))]
+        
+        responses = [r for chunk_responses in self.map_concurrent(fetch, chunks) for r in chunk_responses]
+        for device, kw in rejected:
+            print(f"  → {device}: '{kw}' 조회 불가 (잘못된 요청) - 제외", flush=True)
+        
+        # (키워드, 순위, 기기) -> 입찰가
+        bids = {}
+        for device, chunk_items, estimates in responses:
+            for i, est in enumerate(estimates):
+                # 응답에 keyword/position이 없으면 요청 순서로 매칭
+                req = chunk_items[i] if i < len(chunk_items) else {}
+                kw = est.get('keyword') or req.get('key')
+                pos = est.get('position') or req.get('position')
+                if kw and pos:
+                    bids[(kw, int(pos), device)] = est.get('bid', 0)
+        
+        # 결과 정리
+        result = {}
+        for kw in keywords:
+            if not any((kw, pos, device) in bids for pos in positions for device in devices):
+                continue
             
-            payload = {
-                "device": device,
-                "items": items
-            }
+            result[kw] = [
+                {
+                    "rank": pos,
+                    "mobileBid": bids.get((kw, pos, 'MOBILE'), 0),
+                    "pcBid": bids.get((kw, pos, 'PC'), 0)
+                }
+                for pos in positions
+            ]
+        
+        return result
+    
+    # ----------------------------------------
+    # 대용량 리포트 (stat-reports)
+    # ----------------------------------------
+    
+    def create_stat_report(self, stat_date, report_type='AD_DETAIL'):
+        """리포트 작업 생성 (stat_date: YYYY-MM-DD)"""
+        data = {'reportTp': report_type, 'statDt': f"{stat_date}T00:00:00Z"}
+        return self._request('POST', '/stat-reports', data=data)
+    
+    def get_stat_report(self, job_id):
+        return self._request('GET', f'/stat-reports/{job_id}')
+    
+    def delete_stat_report(self, job_id):
+        return self._request('DELETE', f'/stat-reports/{job_id}')
+    
+    def wait_stat_report(self, job_id, timeout=600, delay=1.0, max_delay=30.0):
+        """작업이 끝날 때까지 대기 (1초부터 2배씩, 최대 max_delay초 간격으로 조회)"""
+        deadline = time.monotonic() + timeout
+        job = None
+        
+        while time.monotonic() < deadline:
+            job = self.get_stat_report(job_id)
+            if job and job.get('status') in self.REPORT_DONE:
+                return job
+            time.sleep(min(delay, max(0, deadline - time.monotonic())))
+            delay = min(delay * 2, max_delay)
+        
+        print(f"[WARN] 리포트 작업 {job_id} 대기 시간 초과 "
+              f"(상태: {job.get('status') if job else '-'})", flush=True)
+        return job
+    
+    def download_report(self, download_url):
+        """
+        리포트 TSV를 스트리밍으로 읽어 행(컬럼 리스트) 단위로 반환
+        파일 전체를 메모리에 올리지 않음
+        """
+        path = urlparse(download_url).path
+        
+        # 응답 시작 전(429/5xx)까지만 재시도 - 스트리밍이 시작되면 그대로 읽음
+        for attempt in range(self.max_retries + 1):
+            self.bucket.acquire()
+            self._count('requests')
+            r = self.session.get(download_url, headers=self._headers('GET', path),
+                                 stream=True, timeout=60)
+            if r.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                r.close()
+                self._count('retries')
+                if r.status_code == 429:
+                    self._count('throttled')
+                try:
+                    delay = float(r.headers.get('Retry-After', ''))
+                except ValueError:
+                    delay = min(2 ** attempt * 0.5, 8)
+                time.sleep(delay)
+                continue
+            break
+        
+        with r:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if line:
+                    yield line.decode('utf-8').split('\t')
+    
+    def fetch_stat_reports(self, dates, handle_rows, report_type='AD_DETAIL'):
+        """
+        날짜별 리포트 작업을 동시에 생성/대기/다운로드
+        handle_rows(date, rows): 행 스트림 처리 (반환값을 결과로 모음)
+        데이터 없음(NONE)은 빈 행 스트림으로 handle_rows 호출
+        반환: {날짜: handle_rows 결과 | None(실패)}
+        """
+        def run(stat_date):
+            job = self.create_stat_report(stat_date, report_type)
+            if not job or 'reportJobId' not in job:
+                print(f"  {stat_date}: 리포트 작업 생성 실패", flush=True)
+                return None
             
+            job_id = job['reportJobId']
             try:
-                print(f"[API] 순위별 입찰가 조회: {keyword} ({device})", flush=True)
+                if job.get('status') not in self.REPORT_DONE:
+                    job = self.wait_stat_report(job_id) or {}
                 
-                response = self._request('POST', uri, data=payload)
+                status = job.get('status')
+                if status == 'NONE':
+                    # 데이터 없는 날 - 빈 행으로 처리해서 저장 (다음 실행에서 다시 요청하지 않도록)
+                    print(f"  {stat_date}: 데이터 없음", flush=True)
+                    return handle_rows(stat_date, iter(()))
+                if status != 'BUILT' or not job.get('downloadUrl'):
+                    print(f"  {stat_date}: 리포트 없음 (상태: {status})", flush=True)
+                    return None
                 
-                if response:
-                    estimates = response.get("estimate", [])
-                    results[device] = estimates
-                    print(f"  → {device}: {len(estimates)}개 결과", flush=True)
-                else:
-                    print(f"  → {device}: 조회 실패", flush=True)
-                    
+                return handle_rows(stat_date, self.download_report(job['downloadUrl']))
             except Exception as e:
-                print(f"[ERROR] {device} 순위 조회 오류: {e}", flush=True)
-        
-        # 결과 정리
-        bid_landscape = []
-        
-        mobile_estimates = results.get('MOBILE', [])
-        pc_estimates = results.get('PC', [])
-        
-        max_len = max(len(mobile_estimates), len(pc_estimates), 5)
+                print(f"  {stat_date}: 리포트 다운로드 실패: {e}", flush=True)
+                self._count('failed')
+                return None
+            finally:
+                # 서버에 남은 작업 정리 (계정당 작업 수 제한)
+                self.delete_stat_report(job_id)
         
-        for i in range(min(max_len, 5)):
-            rank = i + 1
-            mobile_bid = 0
-            pc_bid = 0
-            
-            if i < len(mobile_estimates):
-                mobile_bid = mobile_estimates[i].get('bid', 0)
-            
-            if i < len(pc_estimates):
-                pc_bid = pc_estimates[i].get('bid', 0)
-            
-            bid_landscape.append({
-                "rank": rank,
-                "mobileBid": mobile_bid,
-                "pcBid": pc_bid
-            })
+        return dict(zip(dates, self.map_concurrent(run, dates)))
+
+
+def normalize_keyword(keyword):
+    """검색량 캐시 키 (keywordstool은 공백 없는 대문자로 응답)"""
+    return ''.join(str(keyword or '').split()).upper()
+
+
+class KeywordStatsCache:
+    """
+    keywordstool 검색량 디스크 캐시
+    - hints: 조회한 키워드별 조회 시각과 함께 받은 연관 키워드 목록
+    - stats: 연관 키워드별 검색량
+    TTL이 지난 키워드만 다시 조회
+    """
+    
+    def __init__(self, path, ttl_days=7):
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.hints = {}
+        self.stats = {}
+        self.hits = 0
+        self.misses = 0
         
-        return bid_landscape
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.hints = data.get('hints', {})
+                self.stats = data.get('stats', {})
+            except Exception as e:
+                print(f"[CACHE] 캐시 로드 실패: {e}", flush=True)
+    
+    def is_fresh(self, keyword):
+        entry = self.hints.get(normalize_keyword(keyword))
+        if not entry or self.ttl <= 0:
+            return False
+        if not all(rel in self.stats for rel in entry.get('related', [])):
+            return False
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+    
+    def split(self, keywords):
+        """(캐시 유효 키워드, 다시 조회할 키워드)"""
+        fresh, stale = [], []
+        for kw in keywords:
+            (fresh if self.is_fresh(kw) else stale).append(kw)
+        self.hits += len(fresh)
+        self.misses += len(stale)
+        return fresh, stale
+    
+    def put(self, batch, keyword_list):
+        now = time.time()
+        related = []
+        for item in keyword_list:
+            rel_kw = item.get('relKeyword', '')
+            if not rel_kw:
+                continue
+            related.append(rel_kw)
+            self.stats[rel_kw] = {
+                'monthlyPcQcCnt': parse_volume(item.get('monthlyPcQcCnt')),
+                'monthlyMobileQcCnt': parse_volume(item.get('monthlyMobileQcCnt')),
+                'compIdx': item.get('compIdx', '')
+            }
+        # 배치 단위 응답이라 연관 키워드는 배치 내 키워드가 함께 보관
+        for kw in batch:
+            self.hints[normalize_keyword(kw)] = {'fetched_at': now, 'related': related}
+    
+    def collect(self, keywords):
+        """키워드들의 캐시된 검색량 (연관 키워드 포함)"""
+        result = {}
+        for kw in keywords:
+            entry = self.hints.get(normalize_keyword(kw))
+            if not entry:
+                continue
+            for rel_kw in entry.get('related', []):
+                if rel_kw in self.stats:
+                    result[rel_kw] = self.stats[rel_kw]
+        return result
+    
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'hints': self.hints, 'stats': self.stats}, f, ensure_ascii=False)
+
+
+def fetch_entity_tree(api, snapshot=None):
+    """
+    캠페인 > 광고그룹 > 키워드 구조 조회
+    - 캠페인/광고그룹은 계정 전체를 각 1회 요청으로 조회
+    - 키워드는 광고그룹 단위로 동시 조회
+    - snapshot(이전 ads_data.json)이 있으면 editTm이 같은 광고그룹은 이전 키워드 ID를
+      KEYWORD_IDS_BATCH개씩 묶어 조회하고, 키워드 editTm이 하나라도 다르거나 빠진 광고그룹만 다시 조회
+      (키워드만 수정해도 광고그룹 editTm은 바뀌지 않음)
+    반환: (campaigns, adgroups, keywords, refetched_adgroup_count)
+    """
+    campaigns = api.get_campaigns()
+    campaign_index = {c.get('nccCampaignId'): i for i, c in enumerate(campaigns)}
+    campaign_names = {c.get('nccCampaignId'): c.get('name', '') for c in campaigns}
+    
+    adgroups = api.get_adgroups()
+    if not adgroups and campaigns:
+        # 전체 조회 실패 시 캠페인별 조회
+        adgroups = [
+            ag
+            for ags in api.map_concurrent(lambda c: api.get_adgroups(c.get('nccCampaignId')), campaigns)
+            for ag in ags
+        ]
+    
+    # 캠페인 순서대로 정렬 (캠페인 내 순서는 API 응답 순서 유지, 목록에 없는 캠페인의 광고그룹은 맨 뒤)
+    adgroups.sort(key=lambda ag: campaign_index.get(ag.get('nccCampaignId'), len(campaigns)))
+    for ag in adgroups:
+        ag['campaignName'] = campaign_names.get(ag.get('nccCampaignId'), '')
+    
+    # 이전 스냅샷 인덱스
+    prev_edit = {}
+    prev_keywords = {}
+    if snapshot:
+        prev_edit = {ag.get('nccAdgroupId'): ag.get('editTm') for ag in snapshot.get('adgroups', [])}
+        for kw in snapshot.get('keywords', []):
+            prev_keywords.setdefault(kw.get('nccAdgroupId'), []).append(kw)
+    
+    def is_unchanged(ag):
+        ag_id = ag.get('nccAdgroupId')
+        return ag_id in prev_edit and ag.get('editTm') and prev_edit[ag_id] == ag.get('editTm')
+    
+    # 광고그룹 editTm이 같으면 이전 키워드를 ID로 묶어 조회해서 키워드 editTm 비교
+    reused = {}
+    candidates = [ag for ag in adgroups if is_unchanged(ag)]
+    prev_ids = [kw.get('nccKeywordId') for ag in candidates
+                for kw in prev_keywords.get(ag.get('nccAdgroupId'), [])]
+    batches = [prev_ids[i:i + api.KEYWORD_IDS_BATCH] for i in range(0, len(prev_ids), api.KEYWORD_IDS_BATCH)]
+    results = api.map_concurrent(api.get_keywords_by_ids, batches)
+    if all(r is not None for r in results):
+        current = {kw.get('nccKeywordId'): kw for r in results for kw in r}
+        for ag in candidates:
+            ag_id = ag.get('nccAdgroupId')
+            previous = prev_keywords.get(ag_id, [])
+            if all(kw.get('nccKeywordId') in current
+                   and current[kw.get('nccKeywordId')].get('editTm') == kw.get('editTm')
+                   for kw in previous):
+                reused[ag_id] = [current[kw.get('nccKeywordId')] for kw in previous]
+    
+    to_fetch = [ag for ag in adgroups if ag.get('nccAdgroupId') not in reused]
+    fetched = dict(zip(
+        [ag.get('nccAdgroupId') for ag in to_fetch],
+        api.map_concurrent(lambda ag: api.get_keywords(ag.get('nccAdgroupId')), to_fetch)
+    ))
+    
+    keywords = []
+    for ag in adgroups:
+        ag_id = ag.get('nccAdgroupId')
+        ag_keywords = fetched[ag_id] if ag_id in fetched else reused[ag_id]
+        for kw in ag_keywords:
+            kw['campaignName'] = ag['campaignName']
+            kw['adgroupName'] = ag.get('name', '')
+            keywords.append(kw)
+    
+    return campaigns, adgroups, keywords, len(to_fetch)
+
+
+def load_snapshot(path):
+    """이전 수집 결과 (증분 조회용)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] 스냅샷 로드 실패: {e}", flush=True)
+        return None
 
 
 def parse_volume(val):
@@ -186,11 +593,30 @@ def parse_volume(val):
 
 
 def main():
+    parser = argparse.ArgumentParser(description='네이버 광고 데이터 수집')
+    parser.add_argument('--rate', type=float, default=8, help='초당 최대 요청 수 - 기본 8')
+    parser.add_argument('--workers', type=int, default=4, help='동시 요청 수 - 기본 4')
+    parser.add_argument('--max-retries', type=int, default=4, help='429/5xx 재시도 횟수 - 기본 4')
+    parser.add_argument('--positions', type=str, default='1,2,3,4,5', help='입찰가 조회 순위 - 기본 1,2,3,4,5')
+    parser.add_argument('--devices', type=str, default='MOBILE,PC', help='입찰가 조회 기기 - 기본 MOBILE,PC')
+    parser.add_argument('--stats-cache', type=str, default='output/keyword_stats_cache.json', help='검색량 캐시 파일')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 ads_data.json 기준 광고그룹/키워드 editTm이 바뀐 광고그룹의 키워드만 재조회')
+    parser.add_argument('--history-days', type=int, default=90, help='대시보드 시계열 기간 (일) - 기본 90')
+    parser.add_argument('--report-days', type=int, default=7,
+                        help='성과 리포트 수집 기간 (어제부터 역순, 저장된 날짜는 건너뜀) - 기본 7, 0이면 생략')
+    parser.add_argument('--performance-dir', type=str, default='output/ads_performance', help='일별 성과 저장 폴더')
+    parser.add_argument('--stats-ttl-days', type=float, default=7, help='검색량 캐시 유효기간 (일) - 기본 7, 0이면 항상 조회')
+    args = parser.parse_args()
+    
+    positions = tuple(int(p) for p in args.positions.split(',') if p.strip())
+    devices = tuple(d.strip().upper() for d in args.devices.split(',') if d.strip())
+    
     print("=" * 60, flush=True)
     print("네이버 광고 데이터 수집 v2", flush=True)
     print("=" * 60, flush=True)
     
-    api = NaverAdsAPI()
+    api = NaverAdsAPI(rate=args.rate, workers=args.workers, max_retries=args.max_retries)
     
     result = {
         'generated_at': datetime.now().isoformat(),
@@ -207,98 +633,91 @@ def main():
         }
     }
     
-    # 1. 캠페인 조회
-    print("\n[1/4] 캠페인 조회...", flush=True)
-    campaigns = api.get_campaigns()
+    # 1~2. 캠페인 > 광고그룹 > 키워드 조회
+    print("\n[1-2/5] 캠페인 > 광고그룹 > 키워드 조회...", flush=True)
+    snapshot = load_snapshot('output/ads_data.json') if args.incremental else None
+    campaigns, adgroups, keywords, refetched = fetch_entity_tree(api, snapshot)
+    
     result['campaigns'] = campaigns
+    result['adgroups'] = adgroups
+    result['keywords'] = keywords
     result['summary']['total_campaigns'] = len(campaigns)
-    print(f"  → {len(campaigns)}개 캠페인", flush=True)
+    if snapshot:
+        print(f"  → 증분 조회: {refetched}/{len(adgroups)}개 광고그룹 키워드 재조회", flush=True)
     
-    # 2. 광고그룹 & 키워드 조회
-    print("\n[2/4] 광고그룹 & 키워드 조회...", flush=True)
     keyword_texts = []
-    
-    for camp in campaigns:
-        camp_id = camp.get('nccCampaignId')
-        camp_name = camp.get('name', '')
-        
-        adgroups = api.get_adgroups(camp_id)
+    for kw in keywords:
+        kw_text = kw.get('keyword', '')
+        if kw_text and kw_text not in keyword_texts:
+            keyword_texts.append(kw_text)
         
-        for ag in adgroups:
-            ag['campaignName'] = camp_name
-            result['adgroups'].append(ag)
-            
-            ag_id = ag.get('nccAdgroupId')
-            ag_name = ag.get('name', '')
-            
-            keywords = api.get_keywords(ag_id)
-            
-            for kw in keywords:
-                kw['campaignName'] = camp_name
-                kw['adgroupName'] = ag_name
-                result['keywords'].append(kw)
-                
-                kw_text = kw.get('keyword', '')
-                if kw_text and kw_text not in keyword_texts:
-                    keyword_texts.append(kw_text)
-                
-                if not kw.get('userLock', False):
-                    result['summary']['active_keywords'] += 1
-            
-            time.sleep(0.1)
+        if not kw.get('userLock', False):
+            result['summary']['active_keywords'] += 1
     
     result['summary']['total_adgroups'] = len(result['adgroups'])
     result['summary']['total_keywords'] = len(result['keywords'])
     print(f"  → {len(result['adgroups'])}개 광고그룹, {len(result['keywords'])}개 키워드", flush=True)
     
     # 3. 검색량 조회
-    print(f"\n[3/4] 검색량 조회 ({len(keyword_texts)}개 키워드)...", flush=True)
+    print(f"\n[3/5] 검색량 조회 ({len(keyword_texts)}개 키워드)...", flush=True)
     
-    if keyword_texts:
-        for i in range(0, len(keyword_texts), 5):
-            batch = keyword_texts[i:i+5]
-            print(f"  배치 {i//5 + 1}: {batch}", flush=True)
-            
-            stats = api.get_keyword_stats(batch)
-            
-            if stats:
-                if 'keywordList' in stats:
-                    for item in stats['keywordList']:
-                        rel_kw = item.get('relKeyword', '')
-                        if rel_kw:
-                            result['keyword_stats'][rel_kw] = {
-                                'monthlyPcQcCnt': parse_volume(item.get('monthlyPcQcCnt')),
-                                'monthlyMobileQcCnt': parse_volume(item.get('monthlyMobileQcCnt')),
-                                'compIdx': item.get('compIdx', '')
-                            }
-            
-            time.sleep(0.3)
+    stats_cache = KeywordStatsCache(args.stats_cache, args.stats_ttl_days)
+    _, stale_keywords = stats_cache.split(keyword_texts)
+    
+    # 만료/미조회 키워드만 5개씩 꽉 채워서 조회
+    batches = [stale_keywords[i:i+5] for i in range(0, len(stale_keywords), 5)]
+    for i, batch in enumerate(batches):
+        print(f"  배치 {i + 1}: {batch}", flush=True)
+    
+    for batch, stats in zip(batches, api.map_concurrent(api.get_keyword_stats, batches)):
+        if stats and 'keywordList' in stats:
+            stats_cache.put(batch, stats['keywordList'])
     
+    stats_cache.save()
+    result['keyword_stats'] = stats_cache.collect(keyword_texts)
+    
+    total_batches = (len(keyword_texts) + 4) // 5
+    stats_calls_saved = total_batches - len(batches)
+    hit_rate = stats_cache.hits / len(keyword_texts) * 100 if keyword_texts else 0
+    print(f"  → 캐시 적중 {stats_cache.hits}/{len(keyword_texts)}개 ({hit_rate:.0f}%), "
+          f"API {len(batches)}회 호출 ({stats_calls_saved}회 절약)", flush=True)
     print(f"  → {len(result['keyword_stats'])}개 검색량 데이터", flush=True)
     
     # 4. 순위별 입찰가 조회 (각 키워드별)
-    print(f"\n[4/4] 순위별 입찰가 조회 ({len(keyword_texts)}개 키워드)...", flush=True)
+    print(f"\n[4/5] 순위별 입찰가 조회 ({len(keyword_texts)}개 키워드)...", flush=True)
+    
+    rank_bids = api.get_rank_bids_batch(keyword_texts, positions, devices)
     
     for idx, kw_text in enumerate(keyword_texts):
-        print(f"  [{idx+1}/{len(keyword_texts)}] {kw_text}", flush=True)
-        
-        try:
-            bid_landscape = api.get_rank_bids(kw_text)
+        bid_landscape = rank_bids.get(kw_text)
+        if bid_landscape:
+            result['keyword_rank_bids'][kw_text] = bid_landscape
             
-            if bid_landscape:
-                result['keyword_rank_bids'][kw_text] = bid_landscape
-                
-                # 1위 입찰가 출력
-                if bid_landscape and len(bid_landscape) > 0:
-                    first = bid_landscape[0]
-                    print(f"    → 1위: PC {first.get('pcBid', 0):,}원 / M {first.get('mobileBid', 0):,}원", flush=True)
-        except Exception as e:
-            print(f"    → 조회 실패: {e}", flush=True)
-        
-        time.sleep(0.5)  # API 부하 방지
+            # 1위 입찰가 출력
+            first = bid_landscape[0]
+            print(f"  [{idx+1}/{len(keyword_texts)}] {kw_text} → {first['rank']}위: PC {first.get('pcBid', 0):,}원 / M {first.get('mobileBid', 0):,}원", flush=True)
     
     print(f"  → {len(result['keyword_rank_bids'])}개 순위별 입찰가 데이터", flush=True)
     
+    # 5. 성과 리포트 (노출/클릭/비용) - 저장되지 않은 날짜만 리포트 작업으로 수집
+    store = PerformanceStore(args.performance_dir)
+    report_dates = store.missing(args.report_days) if args.report_days > 0 else []
+    print(f"\n[5/5] 성과 리포트 수집 ({len(report_dates)}일)...", flush=True)
+    
+    def save_rows(stat_date, rows):
+        count = store.write(stat_date, rows)
+        print(f"  {stat_date}: {count:,}행 저장", flush=True)
+        return count
+    
+    reports = api.fetch_stat_reports(report_dates, save_rows) if report_dates else {}
+    report_rows = sum(c for c in reports.values() if c)
+    
+    keyword_names = {kw.get('nccKeywordId'): kw.get('keyword', '') for kw in keywords}
+    performance = store.summary(days=30, keyword_names=keyword_names)
+    performance['generated_at'] = result['generated_at']
+    print(f"  → {len([c for c in reports.values() if c is not None])}/{len(report_dates)}일 수집, "
+          f"{report_rows:,}행 / 저장된 날짜 {len(store.dates())}일", flush=True)
+    
     # 저장
     os.makedirs('docs', exist_ok=True)
     os.makedirs('output', exist_ok=True)
@@ -309,14 +728,28 @@ def main():
     with open('output/ads_data.json', 'w', encoding='utf-8') as f:
         json.dump(result, f, ensure_ascii=False, indent=2)
     
+    with open('docs/ads_performance.json', 'w', encoding='utf-8') as f:
+        json.dump(performance, f, ensure_ascii=False, separators=(',', ':'))
+    
+    # 일별 이력 (변경분만 추가) + 대시보드용 시계열
+    history_changes = record_snapshot(result, 'output/ads_history')
+    history = build_series('output/ads_history', days=args.history_days)
+    history['generated_at'] = result['generated_at']
+    
+    with open('docs/ads_history.json', 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, separators=(',', ':'))
+    
     print("\n" + "=" * 60, flush=True)
     print("완료!", flush=True)
     print(f"  캠페인: {result['summary']['total_campaigns']}개", flush=True)
     print(f"  광고그룹: {result['summary']['total_adgroups']}개", flush=True)
     print(f"  키워드: {result['summary']['total_keywords']}개", flush=True)
     print(f"  활성: {result['summary']['active_keywords']}개", flush=True)
-    print(f"  검색량: {len(result['keyword_stats'])}개", flush=True)
+    print(f"  검색량: {len(result['keyword_stats'])}개 (캐시 적중 {hit_rate:.0f}%, API {stats_calls_saved}회 절약)", flush=True)
     print(f"  순위별 입찰가: {len(result['keyword_rank_bids'])}개", flush=True)
+    print(f"  성과: {len(performance['dates'])}일, 키워드 {len(performance['keywords'])}개", flush=True)
+    print(f"  이력: {history_changes}개 키워드 변경 저장, 시계열 {len(history['series'])}개", flush=True)
+    api.report_stats()
     print("=" * 60, flush=True)
 
 
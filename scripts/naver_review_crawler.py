@@ -14,38 +14,64 @@ import time
 import re
 import hashlib
 import argparse
+import queue
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 print("=" * 60, flush=True)
 print("네이버 플레이스 리뷰 크롤러 v5", flush=True)
 print("=" * 60, flush=True)
 
-try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
-    print("[INFO] Selenium 로드 완료", flush=True)
-except ImportError as e:
-    print(f"[ERROR] Selenium 필요: {e}", flush=True)
-    sys.exit(1)
+# 브라우저 모듈은 수집할 때만 로드 (--rescore는 Selenium 없이 실행)
+webdriver = By = WebDriverWait = EC = Service = Options = ChromeDriverManager = None
+TimeoutException = NoSuchElementException = None
+ElementClickInterceptedException = StaleElementReferenceException = None
+
+
+def load_browser_modules():
+    global webdriver, By, WebDriverWait, EC, Service, Options, ChromeDriverManager
+    global TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
+    
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException, StaleElementReferenceException
+        print("[INFO] Selenium 로드 완료", flush=True)
+    except ImportError as e:
+        print(f"[ERROR] Selenium 필요: {e}", flush=True)
+        sys.exit(1)
+    
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        print("[INFO] WebDriver Manager 로드 완료", flush=True)
+    except ImportError as e:
+        print(f"[ERROR] WebDriver Manager 필요: {e}", flush=True)
+        sys.exit(1)
 
-try:
-    from webdriver_manager.chrome import ChromeDriverManager
-    print("[INFO] WebDriver Manager 로드 완료", flush=True)
-except ImportError as e:
-    print(f"[ERROR] WebDriver Manager 필요: {e}", flush=True)
-    sys.exit(1)
 
 try:
     import requests
+    from naver_review_fetcher import PlaceReviewFetcher, fetch_meta_descriptions
+    from review_ai import GeminiReviewAnalyzer
     print("[INFO] Requests 로드 완료", flush=True)
 except ImportError:
     requests = None
-    print("[WARN] Requests 없음 - AI 분석 비활성화", flush=True)
+    PlaceReviewFetcher = None
+    fetch_meta_descriptions = None
+    GeminiReviewAnalyzer = None
+    print("[WARN] Requests 없음 - AI 분석/API 수집 비활성화", flush=True)
+
+from review_sentiment import needs_ai, keyword_sentiment, keyword_sentiments
+from review_classifier import load_model, review_text
+from review_store import ReviewStore, store_fields
+
+# 저장소 루트의 공용 모듈 (사조/KIS 크롤러와 같은 리소스 차단 정책)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from browser_policy import NAVER_REVIEW_POLICY, apply_policy, measure_policy, policy_mode
 
 # ============================================
 # 설정
@@ -63,38 +89,24 @@ STORE_PLACES = {
     "역대짬뽕 여수국동점": "1773140342",
 }
 
-# 부정적 키워드 (가중치 포함)
-NEGATIVE_KEYWORDS = {
-    "최악": 3, "비추": 3, "후회": 3, "다시 안": 3, "다신 안": 3,
-    "재방문 의사 없": 3, "맛없": 3, "맛이 없": 3, "불결": 3,
-    "환불": 3, "신고": 3, "사기": 3,
-    "실망": 2, "별로": 2, "불친절": 2, "더럽": 2, "위생": 2,
-    "비싸": 2, "비쌌": 2, "짜다": 2, "짰": 2, "싱겁": 2,
-    "느끼": 2, "식었": 2, "차갑": 2, "늦": 2, "오래 걸": 2,
-    "기다": 2, "웨이팅": 2, "퍽퍽": 2, "질겨": 2,
-    "아쉽": 1, "아쉬웠": 1, "적었": 1, "적다": 1, "양이 적": 1,
-    "그닥": 1, "그저 그": 1, "평범": 1, "보통": 1, "애매": 1,
-    "기대 이하": 1, "안 좋": 1, "글쎄": 1
-}
-
-POSITIVE_KEYWORDS = {
-    "맛있": -2, "맛있었": -2, "최고": -3, "추천": -2, "강추": -3,
-    "또 올": -2, "또 가": -2, "또 방문": -2, "재방문 의사 있": -2,
-    "친절": -1, "깔끔": -1, "청결": -1, "좋았": -1, "좋아요": -1,
-    "만족": -2, "감사": -1, "훌륭": -2, "대박": -2, "존맛": -3,
-    "JMT": -3, "인생": -2
-}
-
-NEGATION_PATTERNS = ["않", "안 ", "없", "아니", "못 ", "절대"]
+# 키워드 사전/점수 계산은 review_sentiment.py
 
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
-GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
 
 
 # ============================================
 # 메타태그에서 리뷰수 수집
 # ============================================
 
+def parse_meta_counts(content):
+    """og:description 내용 -> (방문자 리뷰수, 블로그 리뷰수) - 예: 방문자리뷰 2,984 · 블로그리뷰 410"""
+    visitor_match = re.search(r'방문자리뷰\s*([\d,]+)', content or '')
+    blog_match = re.search(r'블로그리뷰\s*([\d,]+)', content or '')
+    visitor_count = int(visitor_match.group(1).replace(',', '')) if visitor_match else 0
+    blog_count = int(blog_match.group(1).replace(',', '')) if blog_match else 0
+    return visitor_count, blog_count
+
+
 def get_review_counts_from_meta(driver, place_id):
     """
     플레이스 홈 페이지의 og:description 메타태그에서 리뷰수 추출
@@ -116,15 +128,7 @@ def get_review_counts_from_meta(driver, place_id):
             content = meta.get_attribute('content') or ''
             print(f"[META] og:description: {content}", flush=True)
             
-            # "방문자리뷰 2,984 · 블로그리뷰 410" 파싱
-            visitor_match = re.search(r'방문자리뷰\s*([\d,]+)', content)
-            blog_match = re.search(r'블로그리뷰\s*([\d,]+)', content)
-            
-            if visitor_match:
-                visitor_count = int(visitor_match.group(1).replace(',', ''))
-            if blog_match:
-                blog_count = int(blog_match.group(1).replace(',', ''))
-                
+            visitor_count, blog_count = parse_meta_counts(content)
             print(f"[META] 파싱 결과: 방문자 {visitor_count}, 블로그 {blog_count}", flush=True)
             
         except NoSuchElementException:
@@ -140,114 +144,71 @@ def get_review_counts_from_meta(driver, place_id):
 # 감성 분석
 # ============================================
 
-def calculate_negative_score(review):
-    content = (review.get('content') or '').lower()
-    tags = review.get('tags') or []
-    
-    score = 0
-    matched_keywords = []
-    
-    for keyword, weight in NEGATIVE_KEYWORDS.items():
-        if keyword in content:
-            idx = content.find(keyword)
-            context = content[max(0, idx-15):idx+len(keyword)+15]
-            
-            negated = False
-            for neg in NEGATION_PATTERNS:
-                neg_idx = context.find(neg)
-                kw_idx = context.find(keyword)
-                if neg_idx != -1 and neg_idx < kw_idx:
-                    negated = True
-                    break
-            
-            if not negated:
-                score += weight
-                matched_keywords.append(f"-{keyword}({weight})")
-    
-    for keyword, weight in POSITIVE_KEYWORDS.items():
-        if keyword in content:
-            score += weight
-            matched_keywords.append(f"+{keyword}({weight})")
-    
-    tag_text = ' '.join(tags).lower()
+def is_negative_review_hybrid(review, ai_results=None):
+    """
+    키워드 점수 + (있으면) AI 분석 결과로 부정 여부 판단
+    ai_results: {본문: is_negative} - GeminiReviewAnalyzer.analyze 결과
+    """
+    content = review.get('content') or ''
     
-    positive_tags = ["맛있어요", "음식이 맛있어요", "양이 많아요", "친절해요", 
-                     "재방문 의사 있음", "분위기가 좋아요", "가성비가 좋아요"]
-    for pt in positive_tags:
-        if pt in tag_text:
-            score -= 2
-            matched_keywords.append(f"+tag:{pt}")
+    is_neg, score, method, matched = keyword_sentiment(review)
     
-    for keyword, weight in NEGATIVE_KEYWORDS.items():
-        if keyword in tag_text:
-            score += weight
-            matched_keywords.append(f"-tag:{keyword}")
+    if method == "keyword_threshold" and ai_results and needs_ai(content, score):
+        ai_result = ai_results.get(content)
+        if ai_result is not None:
+            return ai_result, score, "ai_analyzed", matched
     
-    return score, matched_keywords
+    return is_neg, score, method, matched
 
 
-def analyze_with_ai(content, api_key):
-    if not requests or not api_key:
-        return None
-    
-    try:
-        prompt = f"""다음 음식점 리뷰의 감성을 분석해주세요.
-
-리뷰: "{content[:500]}"
-
-판단 기준:
-1. 음식 맛에 대한 평가 (긍정/부정)
-2. 서비스/친절도 평가
-3. 가격 대비 만족도
-4. 재방문 의사
-5. 전체적인 톤
-
-반드시 아래 JSON 형식으로만 응답하세요:
-{{"is_negative": true 또는 false, "confidence": 0.0~1.0 사이 숫자, "reason": "한 줄 이유"}}"""
-
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={api_key}",
-            json={
-                "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.1, "maxOutputTokens": 100}
-            },
-            timeout=10
-        )
-        
-        if response.ok:
-            result = response.json()
-            text = result.get('candidates', [{}])[0].get('content', {}).get('parts', [{}])[0].get('text', '')
-            
-            json_match = re.search(r'\{[^}]+\}', text)
-            if json_match:
-                data = json.loads(json_match.group())
-                return data.get('is_negative', None)
-        
-        return None
-        
-    except Exception as e:
-        print(f"[AI] 분석 오류: {e}", flush=True)
-        return None
+def finish_review(review, ai_results=None):
+    """감성 분석 결과와 ID 추가 - 반환: 분석 방법"""
+    is_neg, score, method, matched = is_negative_review_hybrid(review, ai_results)
+    review['is_negative'] = is_neg
+    review['sentiment_score'] = score
+    review['sentiment_method'] = method
+    review['id'] = generate_review_id(review)
+    return method
 
 
-def is_negative_review_hybrid(review, use_ai=True):
-    content = review.get('content') or ''
+def apply_ai_analysis(reviews, analyzer, classifier=None):
+    """
+    키워드로 애매한 리뷰만 모아서 로컬 분류기로 먼저 판정, 확신 없는 것만 한 번에 AI 분석
+    반환: (AI 판정 리뷰 수, 로컬 분류기 판정 리뷰 수)
+    """
+    if not analyzer and not classifier:
+        return 0, 0
     
-    score, matched = calculate_negative_score(review)
+    targets = [
+        r for r in reviews
+        if r.get('sentiment_method') == 'keyword_threshold'
+        and needs_ai(r.get('content') or '', r.get('sentiment_score', 0))
+    ]
+    if not targets:
+        return 0, 0
     
-    if score >= 5:
-        return True, score, "keyword_strong_negative", matched
+    local_count = 0
+    if classifier:
+        remaining = []
+        for review, decision in zip(targets, classifier.decide([review_text(r) for r in targets])):
+            if decision is None:
+                remaining.append(review)
+                continue
+            review['is_negative'] = decision
+            review['sentiment_method'] = 'local_model'
+            local_count += 1
+        targets = remaining
     
-    if score <= -3:
-        return False, score, "keyword_strong_positive", matched
+    if not analyzer or not targets:
+        return 0, local_count
     
-    if use_ai and GEMINI_API_KEY and 1 <= score <= 4 and len(content) > 20:
-        ai_result = analyze_with_ai(content, GEMINI_API_KEY)
-        if ai_result is not None:
-            return ai_result, score, "ai_analyzed", matched
+    ai_results = analyzer.analyze([r.get('content') or '' for r in targets])
     
-    is_neg = score >= 2
-    return is_neg, score, "keyword_threshold", matched
+    count = 0
+    for review in targets:
+        if finish_review(review, ai_results) == 'ai_analyzed':
+            count += 1
+    return count, local_count
 
 
 # ============================================
@@ -273,6 +234,7 @@ def setup_driver():
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(30)
+        apply_policy(driver, NAVER_REVIEW_POLICY)
         print("[SETUP] Chrome 드라이버 설정 완료", flush=True)
         return driver
     except Exception as e:
@@ -322,12 +284,20 @@ def scroll_to_bottom(driver):
     time.sleep(1)
 
 
-def load_all_reviews(driver, max_clicks=10):
-    """더보기 클릭 (기본 10회)"""
+def load_all_reviews(driver, max_clicks=10, should_stop=None, on_click=None):
+    """
+    더보기 클릭 (기본 10회)
+    should_stop(driver)가 True를 반환하면 (이미 아는/기간 밖 리뷰 도달) 더 펼치지 않음
+    on_click(driver, 클릭 수): 클릭 성공할 때마다 호출 (수집 진행 상태 기록용)
+    """
     click_count = 0
     no_button_count = 0
     
     while click_count < max_clicks:
+        if should_stop and should_stop(driver):
+            print(f"[MORE] 이전 수집분/기간 밖 리뷰 도달 - {click_count}회 클릭 후 중단", flush=True)
+            break
+        
         try:
             more_button = None
             selectors = ['a.fvwqf', 'a[class*="fvwqf"]']
@@ -365,33 +335,30 @@ def load_all_reviews(driver, max_clicks=10):
                 
                 time.sleep(1.0)
                 
+                if on_click:
+                    on_click(driver, click_count)
+                
             except (StaleElementReferenceException, ElementClickInterceptedException):
                 time.sleep(0.5)
                 continue
                 
         except Exception as e:
-            break
+            # 드라이버 오류 - 호출한 쪽(crawl_with_retry)이 진행 상태를 유지하고 재시도
+            print(f"[MORE] {click_count}회 클릭 후 오류로 중단", flush=True)
+            raise
     
     print(f"[MORE] 총 {click_count}회 클릭", flush=True)
     return click_count
 
 
-def get_all_images(item):
+def normalize_images(srcs):
+    """이미지 src 목록 -> 네이버 이미지만, 고해상도 타입으로 변환"""
     images = []
-    try:
-        img_selectors = ['img.K0PDV', '.place_thumb img', '.HH5sZ img', '.MKLdN img']
-        for selector in img_selectors:
-            try:
-                for img in item.find_elements(By.CSS_SELECTOR, selector):
-                    src = img.get_attribute('src')
-                    if src and 'pstatic.net' in src and src not in images:
-                        if 'type=' in src:
-                            src = re.sub(r'type=\w+', 'type=w1500_60_sharpen', src)
-                        images.append(src)
-            except:
-                continue
-    except:
-        pass
+    for src in srcs:
+        if src and 'pstatic.net' in src and src not in images:
+            if 'type=' in src:
+                src = re.sub(r'type=\w+', 'type=w1500_60_sharpen', src)
+            images.append(src)
     return images
 
 
@@ -409,6 +376,18 @@ def is_date_in_range(date_str, start_date, end_date):
         return True
 
 
+WHITESPACE_RE = re.compile(r'[^\S\n]+')
+
+
+def clean_text(text):
+    """
+    브라우저 innerText를 Selenium .text와 같은 공백 규칙으로 정리 (리뷰 ID 해시가 바뀌지 않도록)
+    줄바꿈은 유지하고, 줄 안의 공백/nbsp 연속은 공백 하나로, 줄마다 앞뒤 공백 제거
+    """
+    lines = (text or '').replace('\r', '').split('\n')
+    return '\n'.join(WHITESPACE_RE.sub(' ', line).strip() for line in lines).strip()
+
+
 def generate_review_id(review):
     author = (review.get('author') or '')[:20]
     content = (review.get('content') or '')[:50]
@@ -416,225 +395,299 @@ def generate_review_id(review):
     return hashlib.md5(f"{author}_{content}_{date}".encode()).hexdigest()[:16]
 
 
-def find_elements_safe(driver, selectors, context=None):
-    target = context if context else driver
-    for selector in selectors:
-        try:
-            elements = target.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                return elements, selector
-        except:
-            continue
-    return [], None
+# ============================================
+# 리뷰 목록 추출 (브라우저에서 한 번에)
+# ============================================
+
+# 리뷰마다 find_elements/text 호출을 반복하면 chromedriver 왕복이 수천 번 발생하므로
+# 페이지의 리뷰 목록 전체를 execute_script 한 번으로 읽어 일반 dict 목록으로 반환
+# (text는 innerText - 공백은 clean_text로 Selenium .text와 같게 정리, 셀렉터는 앞쪽부터 처음 찾은 것 사용)
+REVIEW_JS_HELPERS = """
+const text = el => el ? (el.innerText || '') : '';
+const first = (root, sels) => {
+    for (const sel of sels) {
+        const el = root.querySelector(sel);
+        if (el) return el;
+    }
+    return null;
+};
+const all = (root, sel) => Array.from(root.querySelectorAll(sel));
+const images = item => ['img.K0PDV', '.place_thumb img', '.HH5sZ img', '.MKLdN img']
+    .flatMap(sel => all(item, sel).map(img => img.getAttribute('src') ? img.src : ''));
+const findItems = sels => {
+    for (const sel of sels) {
+        const found = all(document, sel);
+        if (found.length) return [found, sel];
+    }
+    return [[], null];
+};
+"""
+
+VISITOR_EXTRACT_JS = REVIEW_JS_HELPERS + """
+const [found, selector] = findItems(arguments[0]);
+const items = arguments[1] ? found.slice(-1) : found.slice(arguments[2] || 0);
+return {selector: selector, items: items.map(item => ({
+    author: text(first(item, ['.pui__NMi-Dp', '[class*="NMi-Dp"]'])),
+    content: text(first(item, ['.pui__vn15t2', '[class*="vn15t2"]'])),
+    keywords: all(item, '.pui__V8F9nN em').map(text),
+    tags: all(item, '.pui__jhpEyP').map(text).filter(t => t.trim() && !t.startsWith('+')),
+    date: text(item.querySelector('.pui__gfuUIT time, time')),
+    visit_info: all(item, '.pui__gfuUIT').map(text),
+    images: images(item)
+}))};
+"""
+
+BLOG_EXTRACT_JS = REVIEW_JS_HELPERS + """
+const [found, selector] = findItems(arguments[0]);
+const items = arguments[1] ? found.slice(-1) : found.slice(arguments[2] || 0);
+return {selector: selector, items: items.map(item => {
+    const link = item.querySelector('a.behIY, a[href*="blog.naver.com"]');
+    return {
+        blog_url: link && link.getAttribute('href') ? link.href : '',
+        author: text(item.querySelector('.pui__NMi-Dp')),
+        blog_name: text(item.querySelector('.XR_ao')),
+        title: text(item.querySelector('.pui__dGLDWy')),
+        content: text(item.querySelector('.pui__vn15t2')),
+        date: text(item.querySelector('.u5XwJ time, time')),
+        images: images(item)
+    };
+})};
+"""
+
+
+VISITOR_ITEM_SELECTORS = ['li.place_apply_pui.EjjAW', 'li.EjjAW', 'li[class*="EjjAW"]', 'li.pui__X35jYm']
+BLOG_ITEM_SELECTORS = ['li.EblIP', 'li[class*="EblIP"]', 'li.pui__X35jYm']
+
+
+def extract_review_items(driver, script, selectors, last_only=False, offset=0):
+    """
+    리뷰 목록을 execute_script 한 번으로 추출 (last_only: 마지막 항목만, offset: 앞 항목 건너뜀)
+    반환: (원시 dict 목록, 사용된 셀렉터)
+    """
+    try:
+        data = driver.execute_script(script, selectors, last_only, offset) or {}
+    except Exception as e:
+        print(f"[PARSE] 리뷰 목록 추출 실패: {e}", flush=True)
+        return [], None
+    return data.get('items') or [], data.get('selector')
 
 
 # ============================================
 # 리뷰 파싱
 # ============================================
 
-def parse_visitor_reviews(driver, start_date=None, end_date=None, use_ai=True):
-    reviews = []
-    ai_analyzed_count = 0
+def visitor_item_review(item, start_date=None, end_date=None):
+    """추출한 방문자 리뷰 항목 -> 리뷰 dict (기간 밖이거나 내용이 없으면 None)"""
+    review = {'type': 'visitor'}
+    review['author'] = clean_text(item.get('author', ''))
+    review['content'] = clean_text(item.get('content', ''))
+    review['keywords'] = list(set(t for t in map(clean_text, item.get('keywords', [])) if t))
+    review['tags'] = [clean_text(t) for t in item.get('tags', [])]
     
-    try:
-        scroll_to_top(driver)
-        time.sleep(1)
-        
-        selectors = ['li.place_apply_pui.EjjAW', 'li.EjjAW', 'li[class*="EjjAW"]', 'li.pui__X35jYm']
-        review_items, used_selector = find_elements_safe(driver, selectors)
-        
-        if not review_items:
-            time.sleep(3)
-            review_items, used_selector = find_elements_safe(driver, selectors)
-        
-        if not review_items:
-            print("[PARSE] 방문자 리뷰 요소를 찾을 수 없음", flush=True)
-            return reviews, ai_analyzed_count
-        
-        print(f"[PARSE] 셀렉터 '{used_selector}'로 {len(review_items)}개 발견", flush=True)
-        
-        for idx, item in enumerate(review_items):
-            try:
-                review = {'type': 'visitor'}
-                
-                try:
-                    els, _ = find_elements_safe(item, ['.pui__NMi-Dp', '[class*="NMi-Dp"]'])
-                    review['author'] = els[0].text.strip() if els else ''
-                except:
-                    review['author'] = ''
-                
-                try:
-                    els, _ = find_elements_safe(item, ['.pui__vn15t2', '[class*="vn15t2"]'])
-                    review['content'] = els[0].text.strip() if els else ''
-                except:
-                    review['content'] = ''
-                
-                try:
-                    keyword_els = item.find_elements(By.CSS_SELECTOR, '.pui__V8F9nN em')
-                    review['keywords'] = list(set(el.text.strip() for el in keyword_els if el.text.strip()))
-                except:
-                    review['keywords'] = []
-                
-                try:
-                    tag_els = item.find_elements(By.CSS_SELECTOR, '.pui__jhpEyP')
-                    review['tags'] = [el.text.strip() for el in tag_els if el.text.strip() and not el.text.startswith('+')]
-                except:
-                    review['tags'] = []
-                
-                try:
-                    date_els = item.find_elements(By.CSS_SELECTOR, '.pui__gfuUIT time, time')
-                    raw_date = date_els[0].text.strip() if date_els else ''
-                    review['visit_date_raw'] = raw_date
-                    review['visit_date'] = parse_date(raw_date)
-                except:
-                    review['visit_date_raw'] = ''
-                    review['visit_date'] = ''
-                
-                if not is_date_in_range(review['visit_date'], start_date, end_date):
-                    continue
-                
-                try:
-                    info_els = item.find_elements(By.CSS_SELECTOR, '.pui__gfuUIT')
-                    review['visit_info'] = [el.text.strip() for el in info_els if el.text.strip()][:5]
-                except:
-                    review['visit_info'] = []
-                
-                review['images'] = get_all_images(item)
-                
-                is_neg, score, method, matched = is_negative_review_hybrid(review, use_ai)
-                review['is_negative'] = is_neg
-                review['sentiment_score'] = score
-                review['sentiment_method'] = method
-                
-                if method == 'ai_analyzed':
-                    ai_analyzed_count += 1
-                
-                review['id'] = generate_review_id(review)
-                
-                if review['author'] or review['content']:
-                    reviews.append(review)
-                    
-            except StaleElementReferenceException:
-                continue
-            except Exception:
-                continue
-        
-    except Exception as e:
-        print(f"[ERROR] 방문자 리뷰 파싱 실패: {e}", flush=True)
+    raw_date = clean_text(item.get('date', ''))
+    review['visit_date_raw'] = raw_date
+    review['visit_date'] = parse_date(raw_date)
     
-    print(f"[PARSE] 방문자 리뷰 {len(reviews)}개 파싱 (AI 분석: {ai_analyzed_count}개)", flush=True)
-    return reviews, ai_analyzed_count
+    if not is_date_in_range(review['visit_date'], start_date, end_date):
+        return None
+    
+    review['visit_info'] = [t for t in map(clean_text, item.get('visit_info', [])) if t][:5]
+    review['images'] = normalize_images(item.get('images', []))
+    
+    finish_review(review)
+    
+    if review['author'] or review['content']:
+        return review
+    return None
 
 
-def parse_blog_reviews(driver, start_date=None, end_date=None, use_ai=True):
+def blog_item_review(item, start_date=None, end_date=None):
+    """추출한 블로그 리뷰 항목 -> 리뷰 dict (기간 밖이거나 내용이 없으면 None)"""
+    review = {'type': 'blog'}
+    review['blog_url'] = item.get('blog_url', '')
+    review['author'] = clean_text(item.get('author', ''))
+    review['blog_name'] = clean_text(item.get('blog_name', ''))
+    review['title'] = clean_text(item.get('title', ''))
+    review['content'] = clean_text(item.get('content', ''))
+    
+    raw_date = clean_text(item.get('date', ''))
+    review['write_date_raw'] = raw_date
+    review['write_date'] = parse_date(raw_date)
+    
+    if not is_date_in_range(review['write_date'], start_date, end_date):
+        return None
+    
+    review['images'] = normalize_images(item.get('images', []))
+    review['tags'] = []
+    review['keywords'] = []
+    
+    finish_review(review)
+    
+    if review['author'] or review['content'] or review['title']:
+        return review
+    return None
+
+
+def items_to_reviews(items, item_review, start_date=None, end_date=None):
+    reviews = []
+    for item in items:
+        try:
+            review = item_review(item, start_date, end_date)
+        except Exception:
+            continue
+        if review:
+            reviews.append(review)
+    return reviews
+
+
+def parse_reviews(driver, kind, script, selectors, item_review, start_date=None, end_date=None):
+    """펼쳐진 리뷰 목록 전체 파싱 (kind: 로그용 '방문자'/'블로그')"""
     reviews = []
-    ai_analyzed_count = 0
     
     try:
         scroll_to_top(driver)
         time.sleep(1)
         
-        selectors = ['li.EblIP', 'li[class*="EblIP"]', 'li.pui__X35jYm']
-        review_items, used_selector = find_elements_safe(driver, selectors)
+        started = time.time()
+        review_items, used_selector = extract_review_items(driver, script, selectors)
         
         if not review_items:
             time.sleep(3)
-            review_items, used_selector = find_elements_safe(driver, selectors)
+            started = time.time()
+            review_items, used_selector = extract_review_items(driver, script, selectors)
         
         if not review_items:
-            print("[PARSE] 블로그 리뷰 요소를 찾을 수 없음", flush=True)
-            return reviews, ai_analyzed_count
+            print(f"[PARSE] {kind} 리뷰 요소를 찾을 수 없음", flush=True)
+            return reviews
         
-        print(f"[PARSE] 셀렉터 '{used_selector}'로 {len(review_items)}개 발견", flush=True)
+        print(f"[PARSE] 셀렉터 '{used_selector}'로 {len(review_items)}개 발견 "
+              f"({time.time() - started:.2f}초)", flush=True)
         
-        for idx, item in enumerate(review_items):
-            try:
-                review = {'type': 'blog'}
-                
-                try:
-                    link_els = item.find_elements(By.CSS_SELECTOR, 'a.behIY, a[href*="blog.naver.com"]')
-                    review['blog_url'] = link_els[0].get_attribute('href') if link_els else ''
-                except:
-                    review['blog_url'] = ''
-                
-                try:
-                    els, _ = find_elements_safe(item, ['.pui__NMi-Dp'])
-                    review['author'] = els[0].text.strip() if els else ''
-                except:
-                    review['author'] = ''
-                
-                try:
-                    els = item.find_elements(By.CSS_SELECTOR, '.XR_ao')
-                    review['blog_name'] = els[0].text.strip() if els else ''
-                except:
-                    review['blog_name'] = ''
-                
-                try:
-                    els = item.find_elements(By.CSS_SELECTOR, '.pui__dGLDWy')
-                    review['title'] = els[0].text.strip() if els else ''
-                except:
-                    review['title'] = ''
-                
-                try:
-                    els = item.find_elements(By.CSS_SELECTOR, '.pui__vn15t2')
-                    review['content'] = els[0].text.strip() if els else ''
-                except:
-                    review['content'] = ''
-                
-                try:
-                    date_els = item.find_elements(By.CSS_SELECTOR, '.u5XwJ time, time')
-                    raw_date = date_els[0].text.strip() if date_els else ''
-                    review['write_date_raw'] = raw_date
-                    review['write_date'] = parse_date(raw_date)
-                except:
-                    review['write_date_raw'] = ''
-                    review['write_date'] = ''
-                
-                if not is_date_in_range(review['write_date'], start_date, end_date):
-                    continue
-                
-                review['images'] = get_all_images(item)
-                review['tags'] = []
-                review['keywords'] = []
-                
-                is_neg, score, method, matched = is_negative_review_hybrid(review, use_ai)
-                review['is_negative'] = is_neg
-                review['sentiment_score'] = score
-                review['sentiment_method'] = method
-                
-                if method == 'ai_analyzed':
-                    ai_analyzed_count += 1
-                
-                review['id'] = generate_review_id(review)
-                
-                if review['author'] or review['content'] or review['title']:
-                    reviews.append(review)
-                    
-            except StaleElementReferenceException:
-                continue
-            except Exception:
-                continue
+        reviews = items_to_reviews(review_items, item_review, start_date, end_date)
         
     except Exception as e:
-        print(f"[ERROR] 블로그 리뷰 파싱 실패: {e}", flush=True)
+        print(f"[ERROR] {kind} 리뷰 파싱 실패: {e}", flush=True)
     
-    print(f"[PARSE] 블로그 리뷰 {len(reviews)}개 파싱 (AI 분석: {ai_analyzed_count}개)", flush=True)
-    return reviews, ai_analyzed_count
+    print(f"[PARSE] {kind} 리뷰 {len(reviews)}개 파싱", flush=True)
+    return reviews
+
+
+def parse_visitor_reviews(driver, start_date=None, end_date=None):
+    return parse_reviews(driver, '방문자', VISITOR_EXTRACT_JS, VISITOR_ITEM_SELECTORS,
+                         visitor_item_review, start_date, end_date)
+
+
+def parse_blog_reviews(driver, start_date=None, end_date=None):
+    return parse_reviews(driver, '블로그', BLOG_EXTRACT_JS, BLOG_ITEM_SELECTORS,
+                         blog_item_review, start_date, end_date)
+
+
+# 파싱 함수 -> (추출 스크립트, 셀렉터, 날짜 필드, 항목 변환 함수)
+REVIEW_PAGES = {
+    parse_visitor_reviews: (VISITOR_EXTRACT_JS, VISITOR_ITEM_SELECTORS, 'visit_date', visitor_item_review),
+    parse_blog_reviews: (BLOG_EXTRACT_JS, BLOG_ITEM_SELECTORS, 'write_date', blog_item_review),
+}
 
 
 # ============================================
 # 크롤링 메인 로직
 # ============================================
 
-def crawl_with_retry(driver, url, parse_func, start_date, end_date, max_clicks, use_ai, max_retries=2):
+SORT_DATE_FIELD = 'write_date'  # 목록 정렬(reviewSort=recent) 기준 - 작성일
+
+
+def reached_watermark(review, date_field, start_date, known_ids):
+    """
+    최신순 목록에서 이 리뷰 이후로는 더 볼 필요가 없는지 (이미 수집한 리뷰이거나 작성일이 기간 밖)
+    방문일은 작성일 순서와 다르므로 방문자 리뷰는 날짜로 멈추지 않음 (기간 필터는 파싱 단계에서 적용)
+    """
+    if known_ids and generate_review_id(review) in known_ids:
+        return True
+    review_date = review.get(date_field)
+    return (date_field == SORT_DATE_FIELD and bool(start_date) and bool(review_date)
+            and review_date < start_date)
+
+
+def make_page_stop(parse_func, start_date, known_ids):
+    """
+    브라우저 수집용 중단 조건 - 현재 펼쳐진 목록의 마지막(가장 오래된) 리뷰만 확인
+    작성일 최신순이므로 마지막 리뷰가 이미 아는 리뷰(블로그는 작성일이 기간 밖)면 그 뒤도 모두 해당
+    """
+    script, selectors, date_field, _ = REVIEW_PAGES[parse_func]
+    
+    def should_stop(driver):
+        items, _ = extract_review_items(driver, script, selectors, last_only=True)
+        if not items:
+            return False
+        item = items[-1]
+        review = {
+            'author': clean_text(item.get('author', '')),
+            'content': clean_text(item.get('content', '')),
+            date_field: parse_date(clean_text(item.get('date', ''))),
+        }
+        return reached_watermark(review, date_field, start_date, known_ids)
+    
+    return should_stop
+
+
+CHECKPOINT_CLICKS = 5  # 더보기 몇 번마다 새로 펼쳐진 리뷰를 파싱해 둘지 (재시도 시 유지)
+
+
+class PartialCrawl(Exception):
+    """재시도를 모두 소진해 일부 리뷰만 수집됨 - reviews: 그때까지 파싱한 리뷰"""
+    
+    def __init__(self, reviews):
+        super().__init__(f"일부만 수집 ({len(reviews)}개)")
+        self.reviews = reviews
+
+
+class CrawlProgress:
+    """
+    브라우저 수집 진행 상태 - 시도가 실패해도 유지
+    reviews: 파싱 완료 리뷰 (ID 기준 중복 제거), parsed: 파싱한 목록 항목 수, clicks: 더보기 클릭 수
+    """
+    
+    def __init__(self):
+        self.reviews = {}
+        self.parsed = 0
+        self.clicks = 0
+    
+    def extract(self, driver, parse_func, start_date, end_date):
+        """아직 파싱하지 않은 목록 항목만 추출/파싱 - 반환: 새로 추가된 리뷰 수"""
+        script, selectors, _, item_review = REVIEW_PAGES[parse_func]
+        items, _ = extract_review_items(driver, script, selectors, offset=self.parsed)
+        self.parsed += len(items)
+        added = 0
+        for review in items_to_reviews(items, item_review, start_date, end_date):
+            if review['id'] not in self.reviews:
+                self.reviews[review['id']] = review
+                added += 1
+        return added
+
+
+def crawl_with_retry(driver, url, parse_func, start_date, end_date, max_clicks, max_retries=2,
+                     known_ids=None, retry_stats=None):
+    """
+    더보기로 목록을 펼치면서 CHECKPOINT_CLICKS회마다 새 항목만 파싱
+    오류로 다시 시도할 때는 이미 파싱한 리뷰를 유지하고, 지난 시도의 클릭 수까지는
+    중단 조건 확인 없이 다시 펼친 뒤 이어서 수집 (파싱은 남은 항목만)
+    retry_stats: 재시도 횟수/낭비 시간/유지 리뷰 수를 누적할 dict (지점별 로그용)
+    오류로 재시도를 모두 소진하면 그때까지 파싱한 리뷰를 담아 PartialCrawl 발생
+    """
+    progress = CrawlProgress()
+    errored = False
+    should_stop = make_page_stop(parse_func, start_date, known_ids)
+    
     for attempt in range(max_retries):
+        attempt_started = time.time()
+        replay_seconds = 0.0
         try:
             print(f"[CRAWL] 시도 {attempt + 1}/{max_retries}", flush=True)
             
             driver.get(url)
             
             if not wait_for_page_load(driver, timeout=20):
-                continue
+                raise TimeoutException("페이지 로드 시간 초과")
             
             try:
                 WebDriverWait(driver, 15).until(
@@ -645,31 +698,112 @@ def crawl_with_retry(driver, url, parse_func, start_date, end_date, max_clicks,
                 pass
             
             time.sleep(2)
-            load_all_reviews(driver, max_clicks)
+            
+            base_clicks = 0
+            if progress.clicks:
+                # 이전 시도에서 펼친 만큼 다시 펼치기 (이 구간 리뷰는 이미 파싱됨)
+                replay_started = time.time()
+                base_clicks = load_all_reviews(driver, progress.clicks)
+                replay_seconds = time.time() - replay_started
+                print(f"[RETRY] 이전 진행 {progress.clicks}회까지 다시 펼침 - {base_clicks}회 "
+                      f"({replay_seconds:.1f}초), 유지 리뷰 {len(progress.reviews)}개", flush=True)
+            
+            def checkpoint(driver, clicks):
+                progress.clicks = base_clicks + clicks
+                if clicks % CHECKPOINT_CLICKS == 0:
+                    progress.extract(driver, parse_func, start_date, end_date)
+            
+            load_all_reviews(driver, max_clicks - base_clicks, should_stop, checkpoint)
             time.sleep(2)
             
-            reviews, ai_count = parse_func(driver, start_date, end_date, use_ai)
+            scroll_to_top(driver)
+            time.sleep(1)
+            progress.extract(driver, parse_func, start_date, end_date)
+            if not progress.parsed:
+                time.sleep(3)
+                progress.extract(driver, parse_func, start_date, end_date)
+            
+            print(f"[PARSE] 목록 {progress.parsed}개 중 리뷰 {len(progress.reviews)}개 파싱", flush=True)
+            
+            if progress.reviews:
+                if retry_stats is not None:
+                    retry_stats['wasted_seconds'] += replay_seconds
+                return list(progress.reviews.values())
             
-            if reviews:
-                return reviews, ai_count
-            elif attempt < max_retries - 1:
-                time.sleep(5)
+            failure = "리뷰 없음"
             
         except Exception as e:
-            print(f"[ERROR] 크롤링 오류: {e}", flush=True)
-            if attempt < max_retries - 1:
-                time.sleep(5)
+            errored = True
+            failure = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            print(f"[ERROR] 크롤링 오류: {failure}", flush=True)
+        
+        if attempt < max_retries - 1:
+            time.sleep(5)
+            # 실패한 시도 중 유지한 리뷰로 이어지지 못한 부분 (대기/다시 펼치기 포함)
+            wasted = time.time() - attempt_started
+            if retry_stats is not None:
+                retry_stats['retries'] += 1
+                retry_stats['wasted_seconds'] += wasted
+                retry_stats['kept_reviews'] += len(progress.reviews)
+            print(f"[RETRY] 시도 {attempt + 1} 실패 ({failure}) - {wasted:.1f}초 소요, "
+                  f"클릭 {progress.clicks}회/리뷰 {len(progress.reviews)}개 유지하고 재시도", flush=True)
     
-    return [], 0
+    # 마지막 시도도 실패 - 오류가 있었으면 그때까지 파싱한 리뷰를 일부 수집으로 넘김
+    if errored:
+        print(f"[RETRY] 재시도 소진 - 파싱된 리뷰 {len(progress.reviews)}개만 반환 (일부 수집)", flush=True)
+        raise PartialCrawl(list(progress.reviews.values()))
+    return list(progress.reviews.values())
 
 
-def crawl_store_reviews(driver, store_name, place_id, start_date=None, end_date=None, max_clicks=10, use_ai=True):
+def finish_api_reviews(reviews, start_date, end_date):
+    """API로 받은 리뷰 목록에 파싱 단계와 같은 필터/후처리 적용"""
+    finished = []
+    
+    for review in reviews:
+        date_field = 'visit_date' if review['type'] == 'visitor' else 'write_date'
+        if not is_date_in_range(review[date_field], start_date, end_date):
+            continue
+        
+        review['images'] = normalize_images(review.get('images', []))
+        finish_review(review)
+        
+        if review['author'] or review['content'] or review.get('title'):
+            finished.append(review)
+    
+    return finished
+
+
+def fetch_or_crawl(driver, fetcher, fetch_func, url, parse_func, place_id,
+                   start_date, end_date, max_clicks, known_ids=None, retry_stats=None):
+    """JSON 수집기가 있으면 먼저 사용하고, 실패하면 브라우저 크롤링 (일부만 수집되면 PartialCrawl)"""
+    if fetcher:
+        def stop(page):
+            date_field = 'visit_date' if page[0]['type'] == 'visitor' else 'write_date'
+            return any(reached_watermark(r, date_field, start_date, known_ids) for r in page)
+        
+        reviews = fetch_func(place_id, max_pages=max_clicks + 1, parse_date=parse_date, stop=stop)
+        if reviews is not None:
+            return finish_api_reviews(reviews, start_date, end_date)
+        print("[API] 조회 실패 - 브라우저로 수집", flush=True)
+    
+    return crawl_with_retry(driver, url, parse_func, start_date, end_date, max_clicks,
+                            known_ids=known_ids, retry_stats=retry_stats)
+
+
+def crawl_store_reviews(driver, store_name, place_id, start_date=None, end_date=None, max_clicks=10, analyzer=None,
+                        fetcher=None, known_ids=None, classifier=None, meta_counts=None):
+    started = time.time()
     print("\n" + "=" * 50, flush=True)
     print(f"[CRAWL] {store_name} (ID: {place_id})", flush=True)
     print("=" * 50, flush=True)
     
     # 먼저 메타태그에서 실제 리뷰수 수집
-    meta_visitor, meta_blog = get_review_counts_from_meta(driver, place_id)
+    # (HTTP로 미리 조회한 값이 없으면 브라우저로)
+    if meta_counts:
+        meta_visitor, meta_blog = meta_counts
+        print(f"[META] 방문자 {meta_visitor}, 블로그 {meta_blog} (HTTP)", flush=True)
+    else:
+        meta_visitor, meta_blog = get_review_counts_from_meta(driver, place_id)
     
     store_data = {
         'store_name': store_name,
@@ -682,32 +816,52 @@ def crawl_store_reviews(driver, store_name, place_id, start_date=None, end_date=
         'meta_blog_count': meta_blog,        # 메타태그에서 수집한 실제 수
         'negative_count': 0,
         'ai_analyzed_count': 0,
+        'local_model_count': 0,
+        'partial': False,  # 재시도 소진으로 일부만 수집 - 워터마크/수집 시각 갱신 안 함
         'crawled_at': datetime.now().isoformat()
     }
+    retry_stats = {'retries': 0, 'wasted_seconds': 0.0, 'kept_reviews': 0}
     
     # 방문자 리뷰
     visitor_url = f"https://m.place.naver.com/restaurant/{place_id}/review/visitor?reviewSort=recent"
     print(f"[CRAWL] 방문자 리뷰: {visitor_url}", flush=True)
-    visitor_reviews, ai_count1 = crawl_with_retry(
-        driver, visitor_url, parse_visitor_reviews,
-        start_date, end_date, max_clicks, use_ai
-    )
+    try:
+        visitor_reviews = fetch_or_crawl(
+            driver, fetcher, fetcher and fetcher.fetch_visitor_reviews,
+            visitor_url, parse_visitor_reviews, place_id,
+            start_date, end_date, max_clicks, known_ids, retry_stats
+        )
+    except PartialCrawl as e:
+        visitor_reviews = e.reviews
+        store_data['partial'] = True
     store_data['visitor_reviews'] = visitor_reviews
     store_data['visitor_count'] = len(visitor_reviews)
-    store_data['ai_analyzed_count'] += ai_count1
     
-    time.sleep(3)
+    if not fetcher:
+        time.sleep(3)
     
     # 블로그 리뷰
     blog_url = f"https://m.place.naver.com/restaurant/{place_id}/review/ugc?reviewSort=recent"
     print(f"[CRAWL] 블로그 리뷰: {blog_url}", flush=True)
-    blog_reviews, ai_count2 = crawl_with_retry(
-        driver, blog_url, parse_blog_reviews,
-        start_date, end_date, max_clicks, use_ai
-    )
+    try:
+        blog_reviews = fetch_or_crawl(
+            driver, fetcher, fetcher and fetcher.fetch_blog_reviews,
+            blog_url, parse_blog_reviews, place_id,
+            start_date, end_date, max_clicks, known_ids, retry_stats
+        )
+    except PartialCrawl as e:
+        blog_reviews = e.reviews
+        store_data['partial'] = True
     store_data['blog_reviews'] = blog_reviews
     store_data['blog_count'] = len(blog_reviews)
-    store_data['ai_analyzed_count'] += ai_count2
+    
+    # 키워드로 애매한 리뷰만 로컬 분류기 -> AI 순서로 판정 (캐시에 있는 본문은 요청하지 않음)
+    store_data['ai_analyzed_count'], store_data['local_model_count'] = apply_ai_analysis(
+        visitor_reviews + blog_reviews, analyzer, classifier
+    )
+    if analyzer or classifier:
+        print(f"[AI] {store_name}: 로컬 판정 {store_data['local_model_count']}개, "
+              f"AI 판정 {store_data['ai_analyzed_count']}개", flush=True)
     
     # 부정적 리뷰 집계
     store_data['negative_count'] = sum(
@@ -716,62 +870,111 @@ def crawl_store_reviews(driver, store_name, place_id, start_date=None, end_date=
     )
     
     total = store_data['visitor_count'] + store_data['blog_count']
-    print(f"[RESULT] {store_name}: 수집 {total}개, 실제(메타) 방문자 {meta_visitor} / 블로그 {meta_blog}", flush=True)
+    store_data['crawl_seconds'] = round(time.time() - started, 1)
+    store_data['retry_count'] = retry_stats['retries']
+    store_data['retry_wasted_seconds'] = round(retry_stats['wasted_seconds'], 1)
+    if retry_stats['retries']:
+        print(f"[RETRY] {store_name}: 재시도 {retry_stats['retries']}회, 낭비 {store_data['retry_wasted_seconds']}초, "
+              f"재시도 시 유지한 리뷰 {retry_stats['kept_reviews']}개", flush=True)
+    print(f"[RESULT] {store_name}: 수집 {total}개, 실제(메타) 방문자 {meta_visitor} / 블로그 {meta_blog} "
+          f"({store_data['crawl_seconds']}초)", flush=True)
     
     return store_data
 
 
-def merge_reviews(existing_reviews, new_reviews):
-    existing_ids = {r.get('id') for r in existing_reviews if r.get('id')}
-    merged = list(existing_reviews)
-    added = 0
+class DriverPool:
+    """
+    지점 동시 수집용 드라이버 풀
+    드라이버 수가 곧 동시 수집 한도이며, 같은 드라이버로 다음 지점을 열 때는 pause초 대기
+    """
     
-    for review in new_reviews:
-        if review.get('id') and review['id'] not in existing_ids:
-            merged.append(review)
-            existing_ids.add(review['id'])
-            added += 1
+    def __init__(self, size, pause=5):
+        self.drivers = []
+        try:
+            for _ in range(max(1, size)):
+                self.drivers.append(setup_driver())
+        except Exception:
+            self.quit()
+            raise
+        self.idle = queue.Queue()
+        for driver in self.drivers:
+            self.idle.put((driver, False))
+        self.pause = pause
     
-    merged.sort(key=lambda r: r.get('visit_date') or r.get('write_date') or '', reverse=True)
-    return merged, added
+    def run(self, func, *args):
+        driver, used = self.idle.get()
+        try:
+            if used:
+                time.sleep(self.pause)
+            return func(driver, *args)
+        finally:
+            self.idle.put((driver, True))
+    
+    def quit(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def review_watermark(reviews, date_field, previous=None):
+    """가장 최근 리뷰의 ID/날짜 (다음 실행에서 페이지 넘김 중단 기준) - 이전 워터마크보다 새 것만"""
+    dated = [r for r in reviews if r.get('id') and r.get(date_field)]
+    if not dated:
+        return previous
+    newest = max(dated, key=lambda r: r[date_field])
+    if previous and previous.get('date', '') >= newest[date_field]:
+        return previous
+    return {'id': newest['id'], 'date': newest[date_field]}
+
+
+def known_review_ids(review_store, place_id):
+    """
+    이전 실행까지 저장된 지점 리뷰 ID (워터마크 포함)
+    지난 수집이 일부만 끝났으면 저장된 리뷰 사이에 빈 구간이 있을 수 있으므로 빈 집합 (전체 수집)
+    """
+    info = review_store.stores.get(place_id) or {}
+    if info.get('partial'):
+        return set()
+    ids = set(review_store.ids(place_id))
+    for mark in (info.get('watermark') or {}).values():
+        if mark and mark.get('id'):
+            ids.add(mark['id'])
+    return ids
 
 
-def calculate_review_stats(stores):
-    today = datetime.now().date()
-    stats = {
-        'today': 0, 'yesterday': 0,
-        'this_week': 0, 'last_week': 0,
-        'this_month': 0, 'last_month': 0,
-        'total_negative': 0, 'total_ai_analyzed': 0
+def window_stats(histograms, today=None):
+    """
+    날짜별 히스토그램 목록 -> 오늘/어제/최근 7일/30일 리뷰 수 + 부정 합계
+    구간마다 히스토그램 누적합 조회 (리뷰 순회 없음)
+    """
+    today = today or datetime.now().date()
+    day = lambda n: (today - timedelta(days=n)).isoformat()
+    windows = {
+        'today': (day(0), day(0)),
+        'yesterday': (day(1), day(1)),
+        'this_week': (day(7), None),
+        'last_week': (day(14), day(8)),
+        'this_month': (day(30), None),
+        'last_month': (day(60), day(31)),
     }
     
-    for store in stores:
-        stats['total_ai_analyzed'] += store.get('ai_analyzed_count', 0)
-        
-        for review in store.get('visitor_reviews', []) + store.get('blog_reviews', []):
-            date_str = review.get('visit_date') or review.get('write_date')
-            if not date_str:
-                continue
-            
-            try:
-                review_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-            except:
-                continue
-            
-            if review_date == today:
-                stats['today'] += 1
-            if review_date == today - timedelta(days=1):
-                stats['yesterday'] += 1
-            if review_date >= today - timedelta(days=7):
-                stats['this_week'] += 1
-            if today - timedelta(days=14) <= review_date < today - timedelta(days=7):
-                stats['last_week'] += 1
-            if review_date >= today - timedelta(days=30):
-                stats['this_month'] += 1
-            if today - timedelta(days=60) <= review_date < today - timedelta(days=30):
-                stats['last_month'] += 1
-            if review.get('is_negative'):
-                stats['total_negative'] += 1
+    stats = {name: 0 for name in windows}
+    stats['total_negative'] = 0
+    for histogram in histograms:
+        for name, (start, end) in windows.items():
+            stats[name] += histogram.window(start, end)[0]
+        stats['total_negative'] += histogram.window()[1]
+    return stats
+
+
+def calculate_review_stats(review_store, place_ids, today=None):
+    """전체 기간 통계 + 지점별 통계 (review_store의 날짜별 히스토그램 사용)"""
+    stats = window_stats([review_store.histogram(pid) for pid in place_ids], today)
+    stats['total_ai_analyzed'] = sum(
+        (review_store.stores.get(pid) or {}).get('ai_analyzed_count', 0) for pid in place_ids
+    )
     
     def calc_change(c, p):
         return round((c - p) / p * 100, 1) if p else (100 if c else 0)
@@ -780,6 +983,8 @@ def calculate_review_stats(stores):
     stats['weekly_change'] = calc_change(stats['this_week'], stats['last_week'])
     stats['monthly_change'] = calc_change(stats['this_month'], stats['last_month'])
     
+    stats['stores'] = {pid: window_stats([review_store.histogram(pid)], today) for pid in place_ids}
+    
     return stats
 
 
@@ -793,38 +998,62 @@ def load_existing_data(file_path):
     return None
 
 
-def save_data(data, file_path):
-    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"[SAVE] {file_path}", flush=True)
+SENTIMENT_FIELDS = ('is_negative', 'sentiment_score', 'sentiment_method')
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--days', type=int, default=2, help='수집 기간 (일) - 기본 2일')
-    parser.add_argument('--max-clicks', type=int, default=10, help='더보기 클릭 횟수 - 기본 10회')
-    parser.add_argument('--store', type=str, help='특정 지점만 수집')
-    parser.add_argument('--no-ai', action='store_true', help='AI 분석 비활성화')
-    args = parser.parse_args()
+def rescore_reviews(review_store, analyzer=None, classifier=None, workers=None):
+    """
+    저장된 리뷰 감성 재계산 (브라우저/재수집 없음 - 키워드 사전이나 기준 점수를 바꿨을 때)
+    - 월 파일 단위로 키워드 판정을 프로세스 풀에서 계산
+    - 애매한 구간은 수집 때와 같은 순서로 로컬 분류기 -> AI 캐시 (새 AI 요청 없음)
+    - 판정 필드가 바뀐 리뷰가 있는 월 파일만 다시 씀
+    반환: (검사한 리뷰 수, 바뀐 리뷰 수)
+    """
+    shards = [(pid, month) for pid in review_store.stores for month in review_store.months(pid)]
+    batches = []
+    for place_id, month in shards:
+        shard = review_store.load_month(place_id, month)
+        batches.append(shard['visitor'] + shard['blog'])
     
-    # 기본값: 2일 전부터 오늘까지
-    end_date = datetime.now().strftime('%Y-%m-%d')
-    start_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        decisions = list(executor.map(keyword_sentiments, batches))
     
-    use_ai = not args.no_ai and bool(GEMINI_API_KEY)
+    # 새 판정은 사본에 먼저 적용 (원본과 비교해서 바뀐 필드만 반영)
+    rescored = []
+    for shard_key, reviews, results in zip(shards, batches, decisions):
+        for review, (is_neg, score, method) in zip(reviews, results):
+            copy = dict(review, is_negative=is_neg, sentiment_score=score, sentiment_method=method)
+            rescored.append((shard_key, review, copy))
     
-    print(f"\n시작: {datetime.now()}", flush=True)
-    print(f"수집 기간: {start_date} ~ {end_date}", flush=True)
-    print(f"더보기 클릭: {args.max_clicks}회", flush=True)
-    print(f"AI 분석: {'활성화' if use_ai else '비활성화'}", flush=True)
+    apply_ai_analysis([copy for _, _, copy in rescored], analyzer, classifier)
     
-    existing_data = load_existing_data('docs/review_data.json')
+    changed = 0
+    changed_months = {}
+    for (place_id, month), review, copy in rescored:
+        # AI 캐시에 없는 예전 AI 판정은 뒤집을 근거가 없으므로 유지
+        if (copy['sentiment_method'] == 'keyword_threshold' and review.get('sentiment_method') == 'ai_analyzed'
+                and needs_ai(copy.get('content') or '', copy['sentiment_score'])):
+            copy['is_negative'] = review['is_negative']
+            copy['sentiment_method'] = 'ai_analyzed'
+        
+        if all(review.get(f) == copy[f] for f in SENTIMENT_FIELDS):
+            continue
+        for field in SENTIMENT_FIELDS:
+            review[field] = copy[field]
+        changed_months.setdefault(place_id, set()).add(month)
+        changed += 1
+    
+    for place_id, months in changed_months.items():
+        review_store.mark_changed(place_id, months)
     
-    result = {
+    return len(rescored), changed
+
+
+def new_result():
+    """대시보드 summary.json 기본 구조 (지점 목록은 publish에서 추가)"""
+    return {
         'generated_at': datetime.now().isoformat(),
         'platform': 'naver',
-        'stores': [],
         'summary': {
             'total_stores': 0, 
             'total_visitor_reviews': 0, 
@@ -832,6 +1061,7 @@ def main():
             'total_reviews': 0, 
             'total_negative': 0, 
             'total_ai_analyzed': 0,
+            'total_local_model': 0,
             'new_visitor_reviews': 0, 
             'new_blog_reviews': 0,
             # 메타태그에서 수집한 실제 총 리뷰수
@@ -840,63 +1070,218 @@ def main():
         },
         'stats': {}
     }
+
+
+def publish_review_data(review_store, result, review_dir, docs_dir):
+    """지점별 합계/통계 계산 후 저장소 저장 + 대시보드 파일 쓰기"""
+    # 대시보드 지점 순서 (설정 순서, 설정에 없는 기존 지점은 뒤에)
+    place_ids = [pid for pid in STORE_PLACES.values() if pid in review_store.stores]
+    place_ids += [pid for pid in review_store.stores if pid not in place_ids]
+    
+    for place_id in place_ids:
+        info = review_store.store_info(place_id)
+        result['summary']['total_visitor_reviews'] += info['visitor_count']
+        result['summary']['total_blog_reviews'] += info['blog_count']
+        result['summary']['total_negative'] += info['negative_count']
+        result['summary']['total_ai_analyzed'] += info.get('ai_analyzed_count', 0)
+        result['summary']['total_local_model'] += info.get('local_model_count', 0)
+    
+        # 메타태그 총계
+        result['summary']['meta_total_visitor'] += info.get('meta_visitor_count', 0)
+        result['summary']['meta_total_blog'] += info.get('meta_blog_count', 0)
+    
+    result['summary']['total_stores'] = len(place_ids)
+    result['summary']['total_reviews'] = result['summary']['total_visitor_reviews'] + result['summary']['total_blog_reviews']
+    result['stats'] = calculate_review_stats(review_store, place_ids)
     
-    driver = None
+    shards = review_store.save()
+    published, search = review_store.publish(docs_dir, result, place_ids)
+    print(f"[SAVE] {review_dir}: 월 파일 {shards}개 갱신", flush=True)
+    print(f"[SAVE] {docs_dir}: summary.json + 지점 파일 {published}개 갱신", flush=True)
+    if search['stores']:
+        print(f"[INDEX] 검색 색인 {search['stores']}개 지점, bigram {search['grams']}개, "
+              f"{search['bytes'] / 1024:.0f}KB ({search['seconds'] * 1000:.0f}ms)", flush=True)
+
+
+def rescore_main(args):
+    """--rescore: 저장소의 리뷰 감성만 다시 계산해서 저장/발행"""
+    started = time.time()
+    print(f"\n재채점 시작: {datetime.now()}", flush=True)
+    
+    review_store = ReviewStore(args.review_dir)
+    classifier = None if args.no_local_model else load_model(args.model)
+    analyzer = None
+    if GeminiReviewAnalyzer is not None and not args.no_ai:
+        analyzer = GeminiReviewAnalyzer(None, offline=True)
+        print(f"AI 캐시: {len(analyzer.cache)}개 (새 요청 없음)", flush=True)
+    
+    checked, changed = rescore_reviews(review_store, analyzer, classifier, args.rescore_workers)
+    elapsed = time.time() - started
+    print(f"[RESCORE] 리뷰 {checked}개 중 {changed}개 판정 변경 ({elapsed:.1f}초)", flush=True)
+    
+    publish_review_data(review_store, new_result(), args.review_dir, args.docs_dir)
+    print(f"재채점 완료: {time.time() - started:.1f}초", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=2, help='수집 기간 (일) - 기본 2일')
+    parser.add_argument('--max-clicks', type=int, default=10, help='더보기 클릭 횟수 - 기본 10회')
+    parser.add_argument('--store', type=str, help='특정 지점만 수집')
+    parser.add_argument('--no-ai', action='store_true', help='AI 분석 비활성화')
+    parser.add_argument('--workers', type=int, default=1, help='동시 수집 지점 수 (드라이버 수) - 기본 1')
+    parser.add_argument('--api', action='store_true',
+                        help='리뷰 목록을 GraphQL(JSON)로 조회 (실패 시 브라우저 수집)')
+    parser.add_argument('--api-url', type=str, default=None, help='GraphQL 주소 (테스트용 재생 서버 등)')
+    parser.add_argument('--ai-batch', type=int, default=10, help='AI 요청 1회에 묶는 리뷰 수 - 기본 10')
+    parser.add_argument('--ai-workers', type=int, default=3, help='AI 동시 요청 수 - 기본 3')
+    parser.add_argument('--ai-url', type=str, default=None, help='Gemini API 주소 (테스트용 로컬 서버 등)')
+    parser.add_argument('--no-local-model', action='store_true',
+                        help='로컬 감성 분류기 없이 애매한 리뷰를 모두 AI로')
+    parser.add_argument('--model', type=str, default='output/sentiment_model.json',
+                        help='로컬 감성 분류기 모델 (scripts/review_classifier.py로 학습)')
+    parser.add_argument('--meta-workers', type=int, default=9,
+                        help='메타태그 리뷰수 HTTP 동시 조회 수 (0이면 브라우저로 지점마다) - 기본 9')
+    parser.add_argument('--review-dir', type=str, default='output/reviews',
+                        help='지점별/월별 리뷰 저장소 - 기본 output/reviews')
+    parser.add_argument('--docs-dir', type=str, default='docs/reviews',
+                        help='대시보드 파일 (summary.json + 지점별) - 기본 docs/reviews')
+    parser.add_argument('--no-watermark', action='store_true',
+                        help='이전 수집분에서 멈추지 않고 더보기/페이지를 끝까지 넘김')
+    parser.add_argument('--rescore', action='store_true',
+                        help='수집 없이 저장된 리뷰 감성만 다시 계산 (브라우저 불필요, AI는 캐시만 사용)')
+    parser.add_argument('--rescore-workers', type=int, default=None,
+                        help='재채점 프로세스 수 - 기본 CPU 수')
+    args = parser.parse_args()
+    
+    if args.rescore:
+        rescore_main(args)
+        return
+    
+    load_browser_modules()
+    
+    # 기본값: 2일 전부터 오늘까지
+    end_date = datetime.now().strftime('%Y-%m-%d')
+    start_date = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d')
+    
+    use_ai = not args.no_ai and bool(GEMINI_API_KEY) and GeminiReviewAnalyzer is not None
+    
+    print(f"\n시작: {datetime.now()}", flush=True)
+    print(f"수집 기간: {start_date} ~ {end_date}", flush=True)
+    print(f"더보기 클릭: {args.max_clicks}회", flush=True)
+    print(f"AI 분석: {'활성화' if use_ai else '비활성화'}", flush=True)
+    print(f"동시 수집: {args.workers}개 지점", flush=True)
+    
+    analyzer = None
+    if use_ai:
+        analyzer = GeminiReviewAnalyzer(GEMINI_API_KEY, batch_size=args.ai_batch, workers=args.ai_workers,
+                                        api_url=args.ai_url)
+        print(f"AI 캐시: {len(analyzer.cache)}개 (묶음 {args.ai_batch}개, 동시 {args.ai_workers}개)", flush=True)
+    
+    classifier = None if args.no_local_model else load_model(args.model)
+    if classifier:
+        print(f"로컬 분류기: {args.model} (비부정 <= {classifier.low}, 부정 >= {classifier.high})", flush=True)
+    
+    fetcher = None
+    if args.api and PlaceReviewFetcher:
+        fetcher = PlaceReviewFetcher(api_url=args.api_url, workers=args.workers)
+    print(f"리뷰 목록: {'GraphQL' if fetcher else '브라우저 (더보기)'}", flush=True)
+    
+    review_store = ReviewStore(args.review_dir)
+    if review_store.is_empty():
+        # 통합 파일(review_data.json)에서 한 번만 옮겨 옴
+        legacy = load_existing_data('docs/review_data.json')
+        if legacy:
+            imported = review_store.import_stores(legacy.get('stores', []))
+            print(f"[STORE] review_data.json에서 리뷰 {imported}개 가져옴", flush=True)
+    
+    result = new_result()
+    
+    pool = None
     
     try:
-        driver = setup_driver()
-        
         stores_to_crawl = {args.store: STORE_PLACES[args.store]} if args.store else STORE_PLACES
         
-        for store_name, place_id in stores_to_crawl.items():
-            store_data = crawl_store_reviews(
-                driver, store_name, place_id,
-                start_date, end_date, args.max_clicks, use_ai
+        # 메타태그 리뷰수는 브라우저 없이 전체 지점 한 번에 (내용이 없거나 실패한 지점만 브라우저로)
+        meta_counts = {}
+        if fetch_meta_descriptions and args.meta_workers > 0:
+            descriptions = fetch_meta_descriptions(list(stores_to_crawl.values()), workers=args.meta_workers)
+            for pid, content in descriptions.items():
+                counts = parse_meta_counts(content)
+                if any(counts):
+                    meta_counts[pid] = counts
+        
+        pool = DriverPool(min(args.workers, len(stores_to_crawl)))
+        if policy_mode() == 'measure':
+            first_place = next(iter(stores_to_crawl.values()))
+            measure_policy(pool.drivers[0], f"https://m.place.naver.com/restaurant/{first_place}/review/visitor?reviewSort=recent",
+                           NAVER_REVIEW_POLICY)
+        
+        def crawl(item):
+            store_name, place_id = item
+            known_ids = set() if args.no_watermark else known_review_ids(review_store, place_id)
+            return pool.run(
+                crawl_store_reviews, store_name, place_id,
+                start_date, end_date, args.max_clicks, analyzer, fetcher, known_ids, classifier,
+                meta_counts.get(place_id)
             )
+        
+        # 지점별 수집은 동시에, 저장은 원래 지점 순서대로
+        crawl_started = time.time()
+        with ThreadPoolExecutor(max_workers=len(pool.drivers)) as executor:
+            crawled = list(executor.map(crawl, stores_to_crawl.items()))
+        crawl_elapsed = time.time() - crawl_started
+        
+        for store_data in crawled:
+            place_id = store_data['place_id']
+            previous = (review_store.stores.get(place_id) or {}).get('watermark') or {}
             
-            if existing_data:
-                existing_store = next(
-                    (s for s in existing_data.get('stores', []) if s['store_name'] == store_name),
-                    None
-                )
-                if existing_store:
-                    merged_v, added_v = merge_reviews(existing_store.get('visitor_reviews', []), store_data['visitor_reviews'])
-                    merged_b, added_b = merge_reviews(existing_store.get('blog_reviews', []), store_data['blog_reviews'])
-                    
-                    store_data['visitor_reviews'] = merged_v
-                    store_data['blog_reviews'] = merged_b
-                    store_data['visitor_count'] = len(merged_v)
-                    store_data['blog_count'] = len(merged_b)
-                    store_data['negative_count'] = sum(1 for r in merged_v + merged_b if r.get('is_negative'))
-                    
-                    result['summary']['new_visitor_reviews'] += added_v
-                    result['summary']['new_blog_reviews'] += added_b
-                    print(f"[MERGE] +{added_v} 방문자, +{added_b} 블로그", flush=True)
-            
-            result['stores'].append(store_data)
-            result['summary']['total_visitor_reviews'] += store_data['visitor_count']
-            result['summary']['total_blog_reviews'] += store_data['blog_count']
-            result['summary']['total_negative'] += store_data['negative_count']
-            result['summary']['total_ai_analyzed'] += store_data.get('ai_analyzed_count', 0)
-            
-            # 메타태그 총계
-            result['summary']['meta_total_visitor'] += store_data.get('meta_visitor_count', 0)
-            result['summary']['meta_total_blog'] += store_data.get('meta_blog_count', 0)
+            # ID 색인으로 새 리뷰만 해당 월 파일에 추가
+            added_v = review_store.add(place_id, 'visitor', store_data['visitor_reviews'])
+            added_b = review_store.add(place_id, 'blog', store_data['blog_reviews'])
+            result['summary']['new_visitor_reviews'] += added_v
+            result['summary']['new_blog_reviews'] += added_b
+            print(f"[MERGE] {store_data['store_name']}: +{added_v} 방문자, +{added_b} 블로그", flush=True)
             
-            time.sleep(5)
+            info = store_fields(store_data)
+            if store_data['partial']:
+                # 일부만 수집 - 워터마크/수집 시각은 그대로 두고 다음 실행에서 전체 수집
+                del info['crawled_at']
+                print(f"[WARN] {store_data['store_name']}: 일부만 수집 - 다음 실행에서 전체 수집", flush=True)
+            else:
+                # 다음 실행의 페이지 넘김 중단 기준
+                info['watermark'] = {
+                    'visitor': review_watermark(store_data['visitor_reviews'], 'visit_date', previous.get('visitor')),
+                    'blog': review_watermark(store_data['blog_reviews'], 'write_date', previous.get('blog'))
+                }
+            review_store.update_store(place_id, info)
         
-        result['summary']['total_stores'] = len(result['stores'])
-        result['summary']['total_reviews'] = result['summary']['total_visitor_reviews'] + result['summary']['total_blog_reviews']
-        result['stats'] = calculate_review_stats(result['stores'])
-        
-        save_data(result, 'docs/review_data.json')
-        save_data(result, 'output/review_data.json')
+        publish_review_data(review_store, result, args.review_dir, args.docs_dir)
+        if analyzer:
+            analyzer.save()
         
         print("\n" + "=" * 60, flush=True)
         print("수집 완료!", flush=True)
         print(f"  수집된 리뷰: {result['summary']['total_reviews']}개", flush=True)
         print(f"  실제 리뷰(메타): 방문자 {result['summary']['meta_total_visitor']} / 블로그 {result['summary']['meta_total_blog']}", flush=True)
         print(f"  부정적: {result['summary']['total_negative']}개", flush=True)
+        
+        store_seconds = [s.get('crawl_seconds', 0) for s in crawled]
+        print(f"  수집 시간: {crawl_elapsed:.1f}초 (지점 합계 {sum(store_seconds):.1f}초, "
+              f"최장 {max(store_seconds, default=0):.1f}초, 드라이버 {len(pool.drivers)}개)", flush=True)
+        for s in crawled:
+            retried = (f" (재시도 {s['retry_count']}회, 낭비 {s['retry_wasted_seconds']}초)"
+                       if s.get('retry_count') else '')
+            print(f"    {s['store_name']}: {s.get('crawl_seconds', 0)}초{retried}", flush=True)
+        if fetcher:
+            print(f"  GraphQL 요청: {fetcher.stats['requests']}회 (재시도 {fetcher.stats['retries']}회, "
+                  f"실패 {fetcher.stats['failed']}회)", flush=True)
+        if classifier:
+            print(f"  로컬 분류기: {result['summary']['total_local_model']}개 판정 (AI 요청 대상에서 제외)", flush=True)
+        if analyzer:
+            ai = analyzer.stats
+            print(f"  AI 분석: 캐시 적중 {ai['cache_hits']}개, 신규 {ai['analyzed']}개 "
+                  f"(요청 {ai['requests']}회, 실패 {ai['failed']}회)", flush=True)
         print("=" * 60, flush=True)
         
     except Exception as e:
@@ -905,8 +1290,8 @@ def main():
         traceback.print_exc()
         sys.exit(1)
     finally:
-        if driver:
-            driver.quit()
+        if pool:
+            pool.quit()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+네이버 플레이스 리뷰 JSON 수집기
+- 모바일 플레이스 페이지가 호출하는 GraphQL 요청으로 리뷰 목록을 직접 조회
+- "더보기" 클릭 없이 커서(방문자)/페이지(블로그) 단위로 넘김
+- 결과는 크롤러의 리뷰 dict 형식 (감성 분석/ID는 크롤러에서 추가)
+- api_url만 바꾸면 로컬 재생 서버로 테스트 가능
+- 지점 홈 og:description 리뷰수는 HTTP로 <head> 부분만 읽어서 동시에 조회
+"""
+
+import re
+import html
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+GRAPHQL_URL = "https://api.place.naver.com/graphql"
+HOME_URL = "https://m.place.naver.com/restaurant/{place_id}/home"
+
+META_TAG_RE = re.compile(rb'<meta[^>]+og:description[^>]*>', re.I)
+META_CONTENT_RE = re.compile(r'content\s*=\s*(["\'])(.*?)\1', re.S | re.I)
+HEAD_END = b'</head>'
+
+MOBILE_UA = (
+    'Mozilla/5.0 (Linux; Android 10; SM-G975F) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36'
+)
+
+VISITOR_REVIEWS_QUERY = """
+query getVisitorReviews($input: VisitorReviewsInput) {
+  visitorReviews(input: $input) {
+    items {
+      id
+      cursor
+      body
+      author { id nickname }
+      media { type thumbnail }
+      tags
+      visitCount
+      visited
+      created
+      votedKeywords { code displayName }
+    }
+    total
+  }
+}
+"""
+
+BLOG_REVIEWS_QUERY = """
+query getFsasReviews($input: FsasReviewsInput) {
+  fsasReviews(input: $input) {
+    items {
+      id
+      name
+      url
+      title
+      contents
+      authorName
+      date
+      createdString
+      thumbnailUrl
+      thumbnailUrlList
+    }
+    total
+  }
+}
+"""
+
+
+class PlaceReviewFetcher:
+    """GraphQL 리뷰 조회 (세션/커넥션 풀 공유 - 여러 지점 동시 호출 가능)"""
+
+    RETRY_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(self, api_url=None, workers=4, page_size=10, max_retries=3, timeout=15):
+        self.api_url = api_url or GRAPHQL_URL
+        self.page_size = page_size
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, workers))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': MOBILE_UA,
+            'Content-Type': 'application/json',
+            'Accept': '*/*',
+        })
+
+        self.stats = {'requests': 0, 'retries': 0, 'failed': 0}
+        self.stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def _query(self, place_id, review_path, operation, query, variables):
+        """GraphQL 요청 1회 (429/5xx는 지수 백오프로 재시도) -> data 또는 None"""
+        payload = [{'operationName': operation, 'variables': variables, 'query': query}]
+        headers = {'Referer': f"https://m.place.naver.com/restaurant/{place_id}/review/{review_path}"}
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._count('requests')
+                r = self.session.post(self.api_url, json=payload, headers=headers, timeout=self.timeout)
+            except Exception as e:
+                if attempt < self.max_retries:
+                    self._count('retries')
+                    time.sleep(min(2 ** attempt, 8))
+                    continue
+                print(f"[API] 요청 실패: {e}", flush=True)
+                self._count('failed')
+                return None
+
+            if r.status_code == 200:
+                try:
+                    body = r.json()
+                except ValueError:
+                    # 차단/점검 페이지 등 JSON이 아닌 200 응답 - 실패로 보고 브라우저로 수집
+                    print(f"[API] {operation} JSON 아님: {r.text[:200]}", flush=True)
+                    self._count('failed')
+                    return None
+                result = body[0] if isinstance(body, list) and body else body
+                if not isinstance(result, dict) or result.get('errors') or not result.get('data'):
+                    print(f"[API] {operation} 응답 오류: {str(result)[:200]}", flush=True)
+                    self._count('failed')
+                    return None
+                return result['data']
+
+            if r.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                self._count('retries')
+                time.sleep(min(2 ** attempt, 8))
+                continue
+
+            print(f"[API] {operation} -> {r.status_code}: {r.text[:200]}", flush=True)
+            self._count('failed')
+            return None
+
+        return None
+
+    def fetch_visitor_reviews(self, place_id, start_date=None, max_pages=11, parse_date=None, stop=None):
+        """
+        방문자 리뷰 (최신순, 커서 페이지네이션)
+        start_date보다 오래된 리뷰가 나오거나 stop(이번 페이지 리뷰 목록)이 True면 중단
+        반환: 리뷰 dict 목록 (요청 실패 시 None)
+        """
+        reviews = []
+        cursor = None
+
+        for page in range(1, max_pages + 1):
+            review_input = {
+                'businessId': str(place_id),
+                'businessType': 'restaurant',
+                'item': '0',
+                'page': page,
+                'size': self.page_size,
+                'includeContent': True,
+                'sort': 'recent',
+            }
+            if cursor:
+                review_input['after'] = cursor
+
+            data = self._query(place_id, 'visitor', 'getVisitorReviews',
+                               VISITOR_REVIEWS_QUERY, {'input': review_input})
+            if data is None:
+                return reviews if reviews else None
+
+            items = (data.get('visitorReviews') or {}).get('items') or []
+            page_reviews = [visitor_review_from_item(item, parse_date) for item in items]
+            reviews.extend(page_reviews)
+
+            cursor = items[-1].get('cursor') if items else None
+            if (len(items) < self.page_size or is_older_than(reviews, 'visit_date', start_date)
+                    or (stop and page_reviews and stop(page_reviews))):
+                break
+
+        print(f"[API] 방문자 리뷰 {len(reviews)}개 조회 ({page}페이지)", flush=True)
+        return reviews
+
+    def fetch_blog_reviews(self, place_id, start_date=None, max_pages=11, parse_date=None, stop=None):
+        """블로그 리뷰 (최신순, 페이지 번호) - 반환 형식은 fetch_visitor_reviews와 동일"""
+        reviews = []
+
+        for page in range(1, max_pages + 1):
+            review_input = {
+                'businessId': str(place_id),
+                'businessType': 'restaurant',
+                'page': page,
+                'display': self.page_size,
+                'deviceType': 'mobile',
+                'query': '',
+            }
+
+            data = self._query(place_id, 'ugc', 'getFsasReviews',
+                               BLOG_REVIEWS_QUERY, {'input': review_input})
+            if data is None:
+                return reviews if reviews else None
+
+            items = (data.get('fsasReviews') or {}).get('items') or []
+            page_reviews = [blog_review_from_item(item, parse_date) for item in items]
+            reviews.extend(page_reviews)
+
+            if (len(items) < self.page_size or is_older_than(reviews, 'write_date', start_date)
+                    or (stop and page_reviews and stop(page_reviews))):
+                break
+
+        print(f"[API] 블로그 리뷰 {len(reviews)}개 조회 ({page}페이지)", flush=True)
+        return reviews
+
+
+def is_older_than(reviews, date_field, start_date):
+    """최신순 목록의 마지막 리뷰가 시작일 이전인지"""
+    if not start_date or not reviews:
+        return False
+    last = reviews[-1].get(date_field)
+    return bool(last) and last < start_date
+
+
+def visitor_review_from_item(item, parse_date=None):
+    """GraphQL 방문자 리뷰 항목 -> 크롤러 리뷰 dict"""
+    raw_date = (item.get('visited') or '').strip()
+    visit_count = item.get('visitCount')
+
+    visit_info = [raw_date] if raw_date else []
+    if visit_count:
+        visit_info.append(f"{visit_count}번째 방문")
+
+    return {
+        'type': 'visitor',
+        'author': ((item.get('author') or {}).get('nickname') or '').strip(),
+        'content': (item.get('body') or '').strip(),
+        'keywords': list(set(t.strip() for t in item.get('tags') or [] if t and t.strip())),
+        'tags': [
+            k.get('displayName', '').strip()
+            for k in item.get('votedKeywords') or []
+            if k.get('displayName', '').strip()
+        ],
+        'visit_date_raw': raw_date,
+        'visit_date': parse_date(raw_date) if parse_date else raw_date,
+        'visit_info': visit_info[:5],
+        'images': [m.get('thumbnail') for m in item.get('media') or [] if m.get('thumbnail')],
+    }
+
+
+def blog_review_from_item(item, parse_date=None):
+    """GraphQL 블로그 리뷰 항목 -> 크롤러 리뷰 dict"""
+    raw_date = (item.get('date') or item.get('createdString') or '').strip()
+    images = item.get('thumbnailUrlList') or ([item['thumbnailUrl']] if item.get('thumbnailUrl') else [])
+
+    return {
+        'type': 'blog',
+        'blog_url': item.get('url') or '',
+        'author': (item.get('authorName') or '').strip(),
+        'blog_name': (item.get('name') or '').strip(),
+        'title': (item.get('title') or '').strip(),
+        'content': (item.get('contents') or '').strip(),
+        'write_date_raw': raw_date,
+        'write_date': parse_date(raw_date) if parse_date else raw_date,
+        'images': images,
+        'tags': [],
+        'keywords': [],
+    }
+
+
+def read_meta_description(response, chunk_size=8192, max_bytes=512 * 1024):
+    """
+    응답 본문을 조금씩 읽다가 og:description 태그를 찾으면 바로 중단
+    반환: (내용 또는 None, 읽은 바이트 수) - </head>까지 없으면 None
+    """
+    buf = b''
+    for chunk in response.iter_content(chunk_size):
+        buf += chunk
+        # 청크 경계에 걸친 태그도 찾도록 누적 버퍼에서 검색
+        match = META_TAG_RE.search(buf)
+        if match:
+            content = META_CONTENT_RE.search(match.group().decode('utf-8', 'replace'))
+            return (html.unescape(content.group(2)) if content else ''), len(buf)
+        if HEAD_END in buf or len(buf) >= max_bytes:
+            break
+    return None, len(buf)
+
+
+def fetch_meta_descriptions(place_ids, workers=9, timeout=10, home_url=None):
+    """
+    지점 홈 페이지 og:description을 동시에 조회 (Selenium 없이)
+    반환: {place_id: og:description 내용} - 실패한 지점은 빠짐 (브라우저로 다시 수집)
+    """
+    home_url = home_url or HOME_URL
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, workers))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': MOBILE_UA,
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Language': 'ko-KR,ko;q=0.9',
+    })
+
+    def fetch(place_id):
+        url = home_url.format(place_id=place_id)
+        for attempt in range(2):
+            try:
+                with session.get(url, timeout=timeout, stream=True) as r:
+                    if r.status_code != 200:
+                        if r.status_code in PlaceReviewFetcher.RETRY_STATUS and attempt == 0:
+                            time.sleep(1)
+                            continue
+                        print(f"[META] {place_id} -> {r.status_code}", flush=True)
+                        return place_id, None, 0
+                    content, size = read_meta_description(r)
+                    if content is None:
+                        print(f"[META] {place_id} og:description 없음 ({size / 1024:.0f}KB 읽음)", flush=True)
+                    return place_id, content, size
+            except Exception as e:
+                if attempt == 0:
+                    time.sleep(1)
+                    continue
+                print(f"[META] {place_id} 요청 실패: {e}", flush=True)
+        return place_id, None, 0
+
+    started = time.time()
+    descriptions = {}
+    total_bytes = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(place_ids) or 1))) as executor:
+        for place_id, content, size in executor.map(fetch, place_ids):
+            total_bytes += size
+            if content is not None:
+                descriptions[place_id] = content
+
+    print(f"[META] HTTP 조회 {len(descriptions)}/{len(place_ids)}개 지점, {time.time() - started:.1f}초 "
+          f"(읽은 용량 {total_bytes / 1024:.0f}KB)", flush=True)
+    return descriptions
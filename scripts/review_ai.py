@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Gemini 리뷰 감성 분석 (애매한 리뷰만)
+- 리뷰 본문 해시 + 모델명으로 결과를 파일에 캐시 (재수집한 리뷰는 다시 묻지 않음)
+- 여러 리뷰를 한 프롬프트에 묶고 JSON 배열로 응답 받음
+- 동시 요청 수 제한 (여러 지점 스레드가 분석기를 공유)
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+GEMINI_MODEL = "gemini-2.0-flash"
+GEMINI_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
+
+MAX_CONTENT_CHARS = 500  # 프롬프트에 넣는 리뷰 길이 (캐시 키도 같은 범위)
+OUTPUT_TOKENS_PER_REVIEW = 150  # 응답 상한 (실제 사용량만 과금되므로 넉넉하게)
+
+
+def content_key(content, model=GEMINI_MODEL):
+    text = (content or '')[:MAX_CONTENT_CHARS]
+    return hashlib.sha1(f"{model}\n{text}".encode('utf-8')).hexdigest()[:20]
+
+
+def build_prompt(contents):
+    # 리뷰 번호 목록이 깨지지 않도록 줄바꿈은 공백으로
+    numbered = '\n'.join(
+        f'{i}. "{" ".join((c or "")[:MAX_CONTENT_CHARS].split())}"' for i, c in enumerate(contents)
+    )
+    return f"""다음 음식점 리뷰들의 감성을 각각 분석해주세요.
+
+리뷰 목록:
+{numbered}
+
+판단 기준:
+1. 음식 맛에 대한 평가 (긍정/부정)
+2. 서비스/친절도 평가
+3. 가격 대비 만족도
+4. 재방문 의사
+5. 전체적인 톤
+
+반드시 리뷰 번호마다 하나씩, 아래 JSON 배열 형식으로만 응답하세요:
+[{{"index": 리뷰 번호, "is_negative": true 또는 false, "confidence": 0.0~1.0 사이 숫자}}]"""
+
+
+def parse_batch_response(text, count):
+    """응답 텍스트 -> [is_negative 또는 None] (count개, 리뷰 번호 순서)"""
+    results = [None] * count
+    match = re.search(r'\[.*\]', text or '', re.S)
+    if not match:
+        return results
+    try:
+        items = json.loads(match.group())
+    except ValueError:
+        return results
+
+    for pos, item in enumerate(items):
+        if not isinstance(item, dict):
+            continue
+        idx = item.get('index', pos)
+        if isinstance(idx, int) and 0 <= idx < count and isinstance(item.get('is_negative'), bool):
+            results[idx] = item['is_negative']
+    return results
+
+
+class GeminiReviewAnalyzer:
+    """애매한 리뷰 일괄 분석 + 본문 해시 캐시"""
+
+    def __init__(self, api_key, cache_path='output/ai_sentiment_cache.json', api_url=None,
+                 model=GEMINI_MODEL, batch_size=10, workers=3, timeout=30, offline=False):
+        self.api_key = api_key
+        self.offline = offline  # True면 캐시에 있는 결과만 반환 (요청 없음 - 재채점용)
+        self.api_url = api_url or GEMINI_API_URL
+        self.model = model
+        self.cache_path = cache_path
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.sending = threading.Semaphore(self.workers)  # 지점 스레드 전체 동시 요청 한도
+        self.lock = threading.Lock()
+        self.cache = self._load()
+        self.stats = {'cache_hits': 0, 'analyzed': 0, 'requests': 0, 'failed': 0}
+
+    def _load(self):
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"[AI] 캐시 로드 실패: {e}", flush=True)
+        return {}
+
+    def save(self):
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        with self.lock:
+            data = dict(self.cache)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    def _send(self, contents):
+        """리뷰 묶음 요청 -> [is_negative 또는 None] (응답이 길이 제한에 걸리면 반으로 나눠 다시 요청)"""
+        answer, truncated = self._request(contents)
+        if not truncated:
+            return answer
+        if len(contents) == 1:
+            with self.lock:
+                self.stats['failed'] += 1
+            return answer
+        half = len(contents) // 2
+        print(f"[AI] 응답 길이 초과 - 리뷰 {len(contents)}개를 {half}/{len(contents) - half}개로 나눠 재요청", flush=True)
+        return self._send(contents[:half]) + self._send(contents[half:])
+
+    def _request(self, contents):
+        """리뷰 묶음 1회 요청 -> ([is_negative 또는 None], 응답이 maxOutputTokens에서 잘렸는지)"""
+        payload = {
+            "contents": [{"parts": [{"text": build_prompt(contents)}]}],
+            "generationConfig": {
+                "temperature": 0.1,
+                "maxOutputTokens": OUTPUT_TOKENS_PER_REVIEW * len(contents) + 100,
+                "responseMimeType": "application/json"
+            }
+        }
+
+        with self.sending:
+            for attempt in range(3):
+                try:
+                    with self.lock:
+                        self.stats['requests'] += 1
+                    r = self.session.post(f"{self.api_url}?key={self.api_key}", json=payload,
+                                          timeout=self.timeout)
+                    if r.status_code == 429 or r.status_code >= 500:
+                        time.sleep(2 ** attempt)
+                        continue
+                    if not r.ok:
+                        break
+                    candidate = r.json().get('candidates', [{}])[0]
+                    text = candidate.get('content', {}).get('parts', [{}])[0].get('text', '')
+                    return (parse_batch_response(text, len(contents)),
+                            candidate.get('finishReason') == 'MAX_TOKENS')
+                except Exception as e:
+                    print(f"[AI] 분석 오류: {e}", flush=True)
+                    time.sleep(2 ** attempt)
+
+        with self.lock:
+            self.stats['failed'] += 1
+        return [None] * len(contents), False
+
+    def analyze(self, contents):
+        """
+        리뷰 본문 목록 -> {본문: is_negative 또는 None(실패)}
+        캐시에 없는 본문만 batch_size개씩 묶어서 동시에 요청
+        """
+        results = {}
+        pending = []
+        for content in dict.fromkeys(contents):
+            key = content_key(content, self.model)
+            with self.lock:
+                cached = self.cache.get(key)
+            if cached is not None:
+                results[content] = cached['is_negative']
+                with self.lock:
+                    self.stats['cache_hits'] += 1
+            else:
+                pending.append(content)
+
+        if self.offline:
+            return results
+
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        if not batches:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as executor:
+            answers = list(executor.map(self._send, batches))
+
+        now = datetime.now().strftime('%Y-%m-%d')
+        for batch, answer in zip(batches, answers):
+            for content, is_neg in zip(batch, answer):
+                results[content] = is_neg
+                if is_neg is None:
+                    continue
+                with self.lock:
+                    self.cache[content_key(content, self.model)] = {'is_negative': is_neg, 'date': now}
+                    self.stats['analyzed'] += 1
+
+        return results
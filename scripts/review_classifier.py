@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 리뷰 감성 분류기 (문자 n-gram 나이브 베이즈, 순수 파이썬)
+- 리뷰 저장소(output/reviews)의 is_negative 라벨로 오프라인 학습 -> output/sentiment_model.json
+- 크롤러에서 키워드 점수가 애매한(1~4) 리뷰를 Gemini로 보내기 전에 먼저 판정
+  (검증 세트 정밀도 95% 이상인 쪽만 로컬 판정, 나머지는 AI로)
+- 임계값은 실제로 판정하게 될 리뷰(키워드 점수 애매 구간)만으로 보정 - 예시가 부족하면 판정 안 함
+- 학습 시 검증용 분할/전체 라벨 대비 정확도 출력
+- 판정 임계값이 하나도 없으면(로컬 판정 없음) 모델을 저장하지 않고, 크롤러도 로드하지 않음
+
+한계: 저장된 라벨 대부분은 sentiment_method가 없는 예전 키워드 점수 판정이라
+      분류기가 키워드 규칙을 다시 배우는 데 가까움 (AI 판정을 대신하는 근거로는 약함)
+      --ai-labels-only로 AI 판정(ai_analyzed) 라벨만 학습할 수 있음 (AI 라벨이 쌓인 뒤 사용)
+
+사용법:
+    python scripts/review_classifier.py                 # 학습 + 정확도 출력
+    python scripts/review_classifier.py --eval-only     # 저장된 모델 정확도만
+    python scripts/review_classifier.py --ai-labels-only
+"""
+
+import os
+import sys
+import json
+import math
+import zlib
+import argparse
+from collections import Counter
+
+from review_store import ReviewStore
+from review_sentiment import keyword_sentiment, needs_ai
+
+
+DEFAULT_MODEL_PATH = 'output/sentiment_model.json'
+NGRAM_SIZES = (2, 3)
+
+# 로컬 판정 임계값 후보 - 검증 세트에서 정밀도 MIN_PRECISION 이상인 값만 사용
+LOW_CANDIDATES = (0.2, 0.1, 0.05, 0.02, 0.01)    # 이하면 비부정
+HIGH_CANDIDATES = (0.8, 0.9, 0.95, 0.98, 0.99)   # 이상이면 부정
+MIN_PRECISION = 0.95
+MIN_SUPPORT = 10
+
+
+def review_text(review):
+    """분류에 쓰는 텍스트 (본문 + 태그)"""
+    return ' '.join([review.get('content') or ''] + list(review.get('tags') or []))
+
+
+def char_ngrams(text, sizes=NGRAM_SIZES):
+    text = ' '.join((text or '').lower().split())
+    grams = []
+    for n in sizes:
+        grams.extend(text[i:i + n] for i in range(len(text) - n + 1))
+    return grams
+
+
+class NaiveBayesClassifier:
+    """부정(1)/비부정(0) 다항 나이브 베이즈 - 특징별 로그 우도비만 저장"""
+
+    def __init__(self, weights=None, bias=0.0, sizes=NGRAM_SIZES, low=None, high=None):
+        self.weights = weights or {}  # n-gram -> log P(g|neg) - log P(g|pos)
+        self.bias = bias              # log P(neg) - log P(pos)
+        self.sizes = tuple(sizes)
+        self.low = low                # 부정 확률 <= low -> 비부정 (None이면 판정 안 함)
+        self.high = high              # 부정 확률 >= high -> 부정 (None이면 판정 안 함)
+
+    def train(self, texts, labels, max_features=2000, alpha=1.0):
+        counts = (Counter(), Counter())
+        docs = [0, 0]
+        for text, label in zip(texts, labels):
+            y = 1 if label else 0
+            docs[y] += 1
+            counts[y].update(set(char_ngrams(text, self.sizes)))
+
+        # 양쪽 합계 빈도가 높은 n-gram만 유지 (모델 파일 크기 제한)
+        vocab = [g for g, _ in (counts[0] + counts[1]).most_common(max_features)]
+        totals = [sum(counts[y][g] for g in vocab) + alpha * len(vocab) for y in (0, 1)]
+
+        self.weights = {
+            g: round(
+                math.log((counts[1][g] + alpha) / totals[1]) -
+                math.log((counts[0][g] + alpha) / totals[0]), 4
+            )
+            for g in vocab
+        }
+        self.bias = math.log((docs[1] + alpha) / (docs[0] + alpha))
+        return self
+
+    def predict_proba(self, texts):
+        """텍스트 목록 -> 부정 확률 목록"""
+        weights, bias = self.weights, self.bias
+        probs = []
+        for text in texts:
+            grams = set(char_ngrams(text, self.sizes))
+            z = bias + sum(weights.get(g, 0.0) for g in grams)
+            z = max(-30.0, min(30.0, z))
+            probs.append(1 / (1 + math.exp(-z)))
+        return probs
+
+    def decide(self, texts):
+        """텍스트 목록 -> [True(부정) / False(비부정) / None(확신 없음 - AI로)]"""
+        results = []
+        for prob in self.predict_proba(texts):
+            if self.low is not None and prob <= self.low:
+                results.append(False)
+            elif self.high is not None and prob >= self.high:
+                results.append(True)
+            else:
+                results.append(None)
+        return results
+
+    def calibrate(self, texts, labels):
+        """
+        검증 세트로 로컬 판정 임계값 선택 (실제 판정 대상과 같은 분포의 리뷰를 넘길 것)
+        한쪽으로 판정한 리뷰의 정밀도가 MIN_PRECISION 미만이면 그쪽은 판정하지 않음 (None)
+        검증 리뷰가 MIN_SUPPORT개 미만이면 양쪽 모두 판정하지 않음
+        """
+        pairs = list(zip(self.predict_proba(texts), labels))
+        self.low = self.high = None
+        if len(pairs) < MIN_SUPPORT:
+            return self
+
+        for t in LOW_CANDIDATES:
+            picked = [bool(y) for p, y in pairs if p <= t]
+            if len(picked) >= MIN_SUPPORT and picked.count(False) / len(picked) >= MIN_PRECISION:
+                self.low = t
+                break
+
+        for t in HIGH_CANDIDATES:
+            picked = [bool(y) for p, y in pairs if p >= t]
+            if len(picked) >= MIN_SUPPORT and picked.count(True) / len(picked) >= MIN_PRECISION:
+                self.high = t
+                break
+        return self
+
+    def to_dict(self):
+        return {'sizes': list(self.sizes), 'bias': self.bias, 'low': self.low, 'high': self.high,
+                'weights': self.weights}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('weights', {}), data.get('bias', 0.0), data.get('sizes', NGRAM_SIZES),
+                   data.get('low'), data.get('high'))
+
+
+def read_model(path=DEFAULT_MODEL_PATH):
+    """저장된 모델 읽기 (없거나 읽기 실패 시 None)"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return NaiveBayesClassifier.from_dict(data['model'])
+    except Exception as e:
+        print(f"[MODEL] 로드 실패: {e}", flush=True)
+        return None
+
+
+def load_model(path=DEFAULT_MODEL_PATH):
+    """크롤러용 모델 로드 - 판정 임계값이 하나도 없으면(로컬 판정 없음) None"""
+    model = read_model(path)
+    if model is not None and model.low is None and model.high is None:
+        print(f"[MODEL] {path}: 판정 임계값 없음 - 로컬 판정 생략", flush=True)
+        return None
+    return model
+
+
+def labelled_reviews(data_path, ai_only=False):
+    """
+    라벨 있는 리뷰 목록 - data_path: 리뷰 저장소 폴더 또는 통합 review_data.json
+    ai_only: AI 판정(sentiment_method == 'ai_analyzed') 라벨만
+    """
+    if os.path.isdir(data_path):
+        store = ReviewStore(data_path)
+        stores = [store.store_data(place_id) for place_id in store.stores]
+    else:
+        with open(data_path, 'r', encoding='utf-8') as f:
+            stores = json.load(f).get('stores', [])
+
+    reviews = []
+    for store in stores:
+        for review in store.get('visitor_reviews', []) + store.get('blog_reviews', []):
+            if ai_only and review.get('sentiment_method') != 'ai_analyzed':
+                continue
+            if isinstance(review.get('is_negative'), bool) and review_text(review).strip():
+                reviews.append(review)
+    return reviews
+
+
+def in_ai_band(review):
+    """크롤러에서 로컬 분류기/AI로 넘어가는 리뷰인지 (키워드 점수 애매 구간 + 본문 20자 초과)"""
+    _, score, method, _ = keyword_sentiment(review)
+    return method == 'keyword_threshold' and needs_ai(review.get('content') or '', score)
+
+
+def is_holdout(review, percent=20):
+    """리뷰 ID 기준 고정 분할 (재학습해도 같은 검증 세트)"""
+    key = review.get('id') or review_text(review)
+    return zlib.crc32(key.encode('utf-8')) % 100 < percent
+
+
+def evaluate(model, reviews, threshold=0.5):
+    if not reviews:
+        return {'count': 0}
+    probs = model.predict_proba([review_text(r) for r in reviews])
+    tp = fp = tn = fn = 0
+    for review, prob in zip(reviews, probs):
+        pred = prob >= threshold
+        if pred and review['is_negative']:
+            tp += 1
+        elif pred:
+            fp += 1
+        elif review['is_negative']:
+            fn += 1
+        else:
+            tn += 1
+    return {
+        'count': len(reviews),
+        'accuracy': round((tp + tn) / len(reviews), 4),
+        'precision': round(tp / (tp + fp), 4) if tp + fp else None,
+        'recall': round(tp / (tp + fn), 4) if tp + fn else None,
+        'tp': tp, 'fp': fp, 'tn': tn, 'fn': fn
+    }
+
+
+def decided_metrics(model, reviews):
+    """로컬 판정(임계값 밖) 비율과 그 정확도"""
+    decided = [(d, r['is_negative']) for d, r in
+               zip(model.decide([review_text(r) for r in reviews]), reviews) if d is not None]
+    correct = sum(1 for d, y in decided if d == y)
+    return {
+        'decided': len(decided),
+        'rate': round(len(decided) / len(reviews), 4) if reviews else None,
+        'accuracy': round(correct / len(decided), 4) if decided else None
+    }
+
+
+def print_decided(m):
+    print(f"    로컬 판정 {m['decided']}개 ({(m['rate'] or 0) * 100:.1f}%), "
+          f"정확도 {m['accuracy']}", flush=True)
+
+
+def print_metrics(name, m):
+    if not m.get('count'):
+        print(f"  {name}: 데이터 없음", flush=True)
+        return
+    print(f"  {name}: {m['count']}개, 정확도 {m['accuracy'] * 100:.1f}%, "
+          f"정밀도 {m['precision']}, 재현율 {m['recall']} "
+          f"(TP {m['tp']} / FP {m['fp']} / TN {m['tn']} / FN {m['fn']})", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 리뷰 감성 분류기 학습')
+    parser.add_argument('--data', type=str, default='output/reviews', help='라벨 데이터 (리뷰 저장소 폴더 또는 review_data.json)')
+    parser.add_argument('--model', type=str, default=DEFAULT_MODEL_PATH, help='모델 파일')
+    parser.add_argument('--max-features', type=int, default=2000, help="유지할 n-gram 수 - 기본 2000")
+    parser.add_argument('--eval-only', action='store_true', help='학습 없이 저장된 모델 평가')
+    parser.add_argument('--ai-labels-only', action='store_true', help='AI 판정 라벨만 학습/평가')
+    args = parser.parse_args()
+
+    reviews = labelled_reviews(args.data, args.ai_labels_only)
+    sources = Counter(r.get('sentiment_method') or '(기록 없음 - 키워드)' for r in reviews)
+    print(f"[DATA] 라벨 출처: {', '.join(f'{k} {v}개' for k, v in sources.most_common()) or '없음'}", flush=True)
+    train = [r for r in reviews if not is_holdout(r)]
+    holdout = [r for r in reviews if is_holdout(r)]
+    negatives = sum(1 for r in reviews if r['is_negative'])
+    print(f"[DATA] 라벨 {len(reviews)}개 (부정 {negatives}개), 학습 {len(train)} / 검증 {len(holdout)}", flush=True)
+
+    if args.eval_only:
+        model = read_model(args.model)
+        if not model:
+            print(f"[ERROR] 모델 없음: {args.model}", flush=True)
+            sys.exit(1)
+    else:
+        # 검증 세트 정확도는 학습 세트로만 학습한 모델로 측정
+        model = NaiveBayesClassifier().train(
+            [review_text(r) for r in train], [r['is_negative'] for r in train], args.max_features
+        )
+        holdout_metrics = evaluate(model, holdout)
+        print_metrics('검증 (학습 제외)', holdout_metrics)
+
+        # 임계값은 실제 판정 대상(애매 구간) 검증 리뷰로만 보정
+        # (구간 리뷰가 MIN_SUPPORT개 미만이거나 정밀도 미달이면 low/high 모두 None -> 전부 AI로)
+        band = [r for r in holdout if in_ai_band(r)]
+        model.calibrate([review_text(r) for r in band], [r['is_negative'] for r in band])
+        holdout_metrics['band'] = decided_metrics(model, band)
+        holdout_metrics['band']['count'] = len(band)
+        print(f"  애매 구간 검증 리뷰 {len(band)}개 - 로컬 판정 임계값: 비부정 <= {model.low}, "
+              f"부정 >= {model.high}", flush=True)
+        print_decided(holdout_metrics['band'])
+
+        # 저장 모델은 전체 라벨로 다시 학습 (임계값은 검증 세트 기준 유지)
+        low, high = model.low, model.high
+        model = NaiveBayesClassifier().train(
+            [review_text(r) for r in reviews], [r['is_negative'] for r in reviews], args.max_features
+        )
+        model.low, model.high = low, high
+
+    metrics = evaluate(model, reviews)
+    print_metrics('전체 라벨', metrics)
+    band = [r for r in reviews if in_ai_band(r)]
+    metrics['band'] = decided_metrics(model, band)
+    metrics['band']['count'] = len(band)
+    print(f"  애매 구간 리뷰 {len(band)}개 (실제 판정 대상)", flush=True)
+    print_decided(metrics['band'])
+
+    if not args.eval_only and model.low is None and model.high is None:
+        print(f"[SKIP] 판정 임계값 없음 - 로컬 판정을 하지 않으므로 {args.model} 저장 안 함", flush=True)
+    elif not args.eval_only:
+        os.makedirs(os.path.dirname(args.model) or '.', exist_ok=True)
+        with open(args.model, 'w', encoding='utf-8') as f:
+            json.dump({
+                'trained_on': len(reviews),
+                'holdout': holdout_metrics,
+                'train_metrics': metrics,
+                'model': model.to_dict()
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        print(f"[SAVE] {args.model} ({os.path.getsize(args.model) / 1024:.0f}KB, "
+              f"n-gram {len(model.weights)}개)", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리뷰 사진 로컬 캐시 (선택 단계 - 리뷰 수집 후 실행)
+- 리뷰 이미지를 동시에 내려받아 내용 해시(sha1)로 저장 -> 같은 사진은 한 번만
+- 목록용 썸네일 생성 (Pillow 있으면 직접 축소, 없으면 네이버 축소본 type=w{폭})
+- docs/images/full/ab/abcd....jpg, docs/images/thumb/ab/abcd....jpg
+- docs/reviews/images.json: 리뷰 ID -> [[썸네일, 원본], ...] (대시보드용)
+- output/reviews/image_index.json: 이미지 URL -> 해시 (이미 받은 URL은 다시 받지 않음)
+
+사용법:
+    python scripts/review_images.py
+    python scripts/review_images.py --days 30 --workers 8
+"""
+
+import os
+import io
+import re
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from review_store import ReviewStore, KINDS, review_day, write_json, read_json
+
+
+IMAGE_UA = (
+    'Mozilla/5.0 (Linux; Android 10; SM-G975F) '
+    'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36'
+)
+
+EXTENSIONS = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/webp': '.webp', 'image/gif': '.gif'}
+
+
+def url_key(url):
+    """크기 파라미터(type=)를 뺀 이미지 URL - 같은 사진의 다른 크기는 같은 키"""
+    return re.sub(r'[?&]type=\w+', '', url)
+
+
+def sized_url(url, image_type):
+    """네이버 이미지 크기 지정 (예: w750, w300)"""
+    base = url_key(url)
+    return f"{base}{'&' if '?' in base else '?'}type={image_type}"
+
+
+def shard_path(kind, digest, ext):
+    return f"images/{kind}/{digest[:2]}/{digest}{ext}"
+
+
+class ImageCache:
+    """URL 색인 + 해시 이름 파일 (docs/images 아래)"""
+
+    def __init__(self, docs_dir, index_path, workers=8, full_type='w750', thumb_width=300, timeout=20):
+        self.docs_dir = docs_dir
+        self.index_path = index_path
+        self.full_type = full_type
+        self.thumb_width = thumb_width
+        self.timeout = timeout
+        self.workers = max(1, workers)
+
+        self.index = read_json(index_path, {})  # URL 키 -> {hash, full, thumb, bytes, thumb_bytes}
+        self.index = {k: e for k, e in self.index.items() if e.get('hash')}  # 중단된 실행의 빈 항목 제외
+        self.hashes = {e['hash']: e for e in self.index.values()}  # 같은 사진 (다른 URL) 재사용
+        self.lock = threading.Lock()
+        self.stats = {'cached': 0, 'downloaded': 0, 'duplicates': 0, 'failed': 0}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'User-Agent': IMAGE_UA, 'Referer': 'https://m.place.naver.com/'})
+
+    def _get(self, url):
+        for attempt in range(3):
+            try:
+                r = self.session.get(url, timeout=self.timeout)
+                if r.status_code == 200:
+                    return r
+                if r.status_code not in (429, 500, 502, 503, 504):
+                    return None
+            except requests.RequestException:
+                pass
+            time.sleep(2 ** attempt)
+        return None
+
+    def _write(self, rel_path, data):
+        """해시 이름 파일 쓰기 - 이미 있으면 건너뜀"""
+        path = os.path.join(self.docs_dir, rel_path)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _thumbnail(self, url, data):
+        """썸네일 바이트 - Pillow로 축소, 없거나 실패하면 네이버 축소본 다운로드"""
+        if Image is not None:
+            try:
+                with Image.open(io.BytesIO(data)) as img:
+                    img = img.convert('RGB')
+                    if img.width > self.thumb_width:
+                        height = round(img.height * self.thumb_width / img.width)
+                        img = img.resize((self.thumb_width, height), Image.LANCZOS)
+                    out = io.BytesIO()
+                    img.save(out, 'JPEG', quality=70, optimize=True, progressive=True)
+                    return out.getvalue()
+            except Exception as e:
+                print(f"[IMAGE] 썸네일 생성 실패: {e}", flush=True)
+
+        r = self._get(sized_url(url, f"w{self.thumb_width}"))
+        return r.content if r is not None else None
+
+    def _fetch(self, key, url):
+        """한 URL 다운로드 - 실패는 세고 넘어감 (다른 URL 다운로드는 계속)"""
+        try:
+            self._download(key, url)
+        except Exception as e:
+            print(f"[IMAGE] 다운로드 실패: {url} ({e})", flush=True)
+            with self.lock:
+                self.stats['failed'] += 1
+
+    def _discard(self, digest, placeholder):
+        """실패한 사진의 자리 표시 제거 (기다리던 같은 사진 URL도 실패로 처리)"""
+        if self.hashes.get(digest) is placeholder:
+            del self.hashes[digest]
+        for key in [k for k, e in self.index.items() if e is placeholder]:
+            del self.index[key]
+            self.stats['downloaded'] -= 1
+            self.stats['duplicates'] -= 1
+            self.stats['failed'] += 1
+
+    def _download(self, key, url):
+        r = self._get(sized_url(url, self.full_type))
+        if r is None:
+            with self.lock:
+                self.stats['failed'] += 1
+            return
+
+        data = r.content
+        digest = hashlib.sha1(data).hexdigest()
+        placeholder = {}
+        with self.lock:
+            known = self.hashes.get(digest)
+            if known is None:
+                self.hashes[digest] = placeholder  # 다른 스레드가 같은 사진을 쓰지 않도록 먼저 등록
+        if known is not None:
+            with self.lock:
+                self.index[key] = known
+                self.stats['downloaded'] += 1
+                self.stats['duplicates'] += 1
+            return
+
+        try:
+            ext = EXTENSIONS.get(r.headers.get('Content-Type', '').split(';')[0].strip(), '.jpg')
+            full = shard_path('full', digest, ext)
+            thumb = shard_path('thumb', digest, '.jpg')
+
+            self._write(full, data)
+            if not os.path.exists(os.path.join(self.docs_dir, thumb)):
+                thumb_data = self._thumbnail(url, data)
+                if thumb_data is None:
+                    thumb = full  # 썸네일 실패 시 원본으로 표시
+                else:
+                    self._write(thumb, thumb_data)
+
+            entry = {'hash': digest, 'full': full, 'thumb': thumb,
+                     'bytes': len(data), 'thumb_bytes': os.path.getsize(os.path.join(self.docs_dir, thumb))}
+        except Exception:
+            with self.lock:
+                self._discard(digest, placeholder)
+            raise
+
+        with self.lock:
+            placeholder.update(entry)
+            self.index[key] = placeholder
+            self.stats['downloaded'] += 1
+
+    def cache(self, urls):
+        """URL 목록 중 색인에 없는 것만 동시에 다운로드"""
+        pending = {}
+        for url in urls:
+            key = url_key(url)
+            if key in self.index and os.path.exists(os.path.join(self.docs_dir, self.index[key]['full'])):
+                self.stats['cached'] += 1
+            else:
+                pending.setdefault(key, url)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                list(executor.map(lambda item: self._fetch(*item), pending.items()))
+
+    def entry(self, url):
+        return self.index.get(url_key(url))
+
+    def save(self):
+        write_json(self.index_path, self.index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리뷰 사진 로컬 캐시 + 썸네일')
+    parser.add_argument('--review-dir', type=str, default='output/reviews', help='리뷰 저장소')
+    parser.add_argument('--docs', type=str, default='docs', help='대시보드 폴더 (images/ 아래에 저장)')
+    parser.add_argument('--days', type=int, default=0, help='최근 N일 리뷰 사진만 (0이면 전체)')
+    parser.add_argument('--workers', type=int, default=8, help='동시 다운로드 수 - 기본 8')
+    parser.add_argument('--full-type', type=str, default='w750', help='원본으로 저장할 네이버 크기 - 기본 w750')
+    parser.add_argument('--thumb-width', type=int, default=300, help='썸네일 폭 - 기본 300')
+    args = parser.parse_args()
+
+    started = time.time()
+    store = ReviewStore(args.review_dir)
+    since = (datetime.now() - timedelta(days=args.days)).strftime('%Y-%m-%d') if args.days else None
+
+    review_images = {}
+    for place_id in store.stores:
+        for kind in KINDS:
+            for review in store.reviews(place_id, kind):
+                images = [u for u in review.get('images') or [] if 'pstatic.net' in u]
+                if not images or not review.get('id'):
+                    continue
+                if since and (review_day(review) or '') < since:
+                    continue
+                review_images[review['id']] = images
+
+    urls = [u for images in review_images.values() for u in images]
+    print(f"[IMAGE] 리뷰 {len(review_images)}개, 이미지 {len(urls)}개 "
+          f"(썸네일: {'Pillow' if Image else '네이버 축소본'})", flush=True)
+
+    cache = ImageCache(args.docs, os.path.join(args.review_dir, 'image_index.json'), args.workers,
+                       args.full_type, args.thumb_width)
+    cache.cache(urls)
+    cache.save()
+
+    manifest = {}
+    full_bytes = thumb_bytes = 0
+    for review_id, images in review_images.items():
+        entries = [cache.entry(u) for u in images]
+        entries = [e for e in entries if e]
+        if not entries:
+            continue
+        manifest[review_id] = [[e['thumb'], e['full']] for e in entries]
+        full_bytes += sum(e['bytes'] for e in entries)
+        thumb_bytes += sum(e['thumb_bytes'] for e in entries)
+
+    write_json(os.path.join(args.docs, 'reviews', 'images.json'), manifest)
+
+    s = cache.stats
+    print(f"[IMAGE] 캐시 {s['cached']}개, 다운로드 {s['downloaded']}개 (같은 사진 {s['duplicates']}개), "
+          f"실패 {s['failed']}개 - {time.time() - started:.1f}초", flush=True)
+    if full_bytes:
+        print(f"[IMAGE] 목록 이미지 용량: 원본 {full_bytes / 1024 / 1024:.1f}MB -> "
+              f"썸네일 {thumb_bytes / 1024 / 1024:.1f}MB ({full_bytes / max(thumb_bytes, 1):.0f}배 감소)", flush=True)
+    print(f"[SAVE] {os.path.join(args.docs, 'reviews', 'images.json')} (리뷰 {len(manifest)}개)", flush=True)
+
+    if s['failed'] and not s['downloaded'] and not s['cached']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
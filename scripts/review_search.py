@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리뷰 검색 색인 (문자 bigram 역색인)
+- 한국어는 띄어쓰기로 단어를 나누기 어려우므로 두 글자 단위(bigram)로 색인
+- 색인 대상: 본문, 제목, 작성자, 태그, 키워드 (대시보드 검색 대상과 동일, 소문자)
+- 지점 파일(docs/reviews/{place_id}.json)의 리뷰 순번
+  (visitor_reviews 다음 blog_reviews)을 bigram별로 오름차순 차이값 목록으로 저장
+- docs/reviews/search/{place_id}.json: {"count": 리뷰 수, "grams": {bigram: [차이값, ...]}}
+- 대시보드는 검색어 bigram의 목록을 교집합한 뒤 후보만 문자열 비교 (결과는 전체 스캔과 동일)
+"""
+
+SEARCH_FIELDS = ('content', 'title', 'author')
+LIST_FIELDS = ('tags', 'keywords')
+
+
+def search_text(review):
+    """검색 대상 필드 (필드 경계를 넘는 bigram이 생기지 않도록 줄바꿈으로 구분)"""
+    parts = [review.get(field) or '' for field in SEARCH_FIELDS]
+    parts += [' '.join(review.get(field) or []) for field in LIST_FIELDS]
+    return '\n'.join(parts).lower()
+
+
+def bigrams(text):
+    """공백이 없는 두 글자 조합 (대시보드 queryBigrams와 같은 규칙)"""
+    return {text[i:i + 2] for i in range(len(text) - 1)
+            if not text[i].isspace() and not text[i + 1].isspace()}
+
+
+def build_search_index(reviews):
+    """리뷰 목록(지점 파일 순서) -> {"count": n, "grams": {bigram: 순번 차이값 목록}}"""
+    postings = {}
+    for pos, review in enumerate(reviews):
+        for gram in bigrams(search_text(review)):
+            postings.setdefault(gram, []).append(pos)
+
+    grams = {}
+    for gram in sorted(postings):
+        previous = 0
+        deltas = []
+        for pos in postings[gram]:
+            deltas.append(pos - previous)
+            previous = pos
+        grams[gram] = deltas
+    return {'count': len(reviews), 'grams': grams}
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리뷰 키워드 감성 점수
+- 키워드 사전(부정어 포함)을 정규식 하나로 한 번만 컴파일
+- 리뷰 본문을 한 번 훑으면서 키워드 위치와 부정어 위치를 함께 수집
+- 점수/매칭 목록은 기존 calculate_negative_score와 동일 (사전 순서, 키워드당 1회)
+  (tests/fixtures/sentiment_corpus.json 고정 코퍼스로 확인, 성능 비교는 scripts/bench_sentiment.py)
+- 키워드 판정 기준(강한 부정/긍정, 기준 점수, AI 대상 구간)도 여기서 관리
+"""
+
+import re
+from bisect import bisect_left
+
+
+# 부정적 키워드 (가중치 포함)
+NEGATIVE_KEYWORDS = {
+    "최악": 3, "비추": 3, "후회": 3, "다시 안": 3, "다신 안": 3,
+    "재방문 의사 없": 3, "맛없": 3, "맛이 없": 3, "불결": 3,
+    "환불": 3, "신고": 3, "사기": 3,
+    "실망": 2, "별로": 2, "불친절": 2, "더럽": 2, "위생": 2,
+    "비싸": 2, "비쌌": 2, "짜다": 2, "짰": 2, "싱겁": 2,
+    "느끼": 2, "식었": 2, "차갑": 2, "늦": 2, "오래 걸": 2,
+    "기다": 2, "웨이팅": 2, "퍽퍽": 2, "질겨": 2,
+    "아쉽": 1, "아쉬웠": 1, "적었": 1, "적다": 1, "양이 적": 1,
+    "그닥": 1, "그저 그": 1, "평범": 1, "보통": 1, "애매": 1,
+    "기대 이하": 1, "안 좋": 1, "글쎄": 1
+}
+
+POSITIVE_KEYWORDS = {
+    "맛있": -2, "맛있었": -2, "최고": -3, "추천": -2, "강추": -3,
+    "또 올": -2, "또 가": -2, "또 방문": -2, "재방문 의사 있": -2,
+    "친절": -1, "깔끔": -1, "청결": -1, "좋았": -1, "좋아요": -1,
+    "만족": -2, "감사": -1, "훌륭": -2, "대박": -2, "존맛": -3,
+    "JMT": -3, "인생": -2
+}
+
+NEGATION_PATTERNS = ["않", "안 ", "없", "아니", "못 ", "절대"]
+
+# 방문자 리뷰 태그 중 긍정 태그 (태그당 -2)
+POSITIVE_TAGS = ["맛있어요", "음식이 맛있어요", "양이 많아요", "친절해요",
+                 "재방문 의사 있음", "분위기가 좋아요", "가성비가 좋아요"]
+
+# 키워드 앞 몇 글자 안에 부정어가 있으면 부정 키워드를 무시
+NEGATION_WINDOW = 15
+
+# 키워드 점수 판정 기준
+STRONG_NEGATIVE_SCORE = 5    # 이상이면 부정 확정
+STRONG_POSITIVE_SCORE = -3   # 이하면 비부정 확정
+NEGATIVE_THRESHOLD = 2       # 그 사이에서 이 점수 이상이면 부정 (AI/로컬 판정 전 기본값)
+AI_SCORE_RANGE = (1, 4)      # 이 구간 + 본문 20자 초과면 AI/로컬 분류기 대상
+
+
+class KeywordMatcher:
+    """
+    다중 키워드 검색 - 전체 키워드를 하나의 정규식(긴 것 우선 alternation)으로 컴파일
+    위치마다 가장 긴 키워드 하나를 찾고, 그 키워드의 접두사인 키워드(예: 맛있었 -> 맛있)도
+    같은 위치에서 매칭된 것으로 처리하므로 겹치는 키워드도 모두 찾음
+    groups: {그룹명: [패턴, ...]} - 한 번의 스캔으로 그룹별 {패턴: 첫 시작 위치}를 수집
+    track: 모든 시작 위치가 필요한 그룹 (예: 부정어)
+    """
+
+    def __init__(self, groups, track=()):
+        self.track = set(track)
+
+        # 패턴 -> 속한 그룹들
+        owners = {}
+        for group, patterns in groups.items():
+            for pattern in patterns:
+                owners.setdefault(pattern, []).append(group)
+
+        # 가장 긴 매칭 패턴 -> 같은 위치에서 함께 매칭되는 (그룹, 패턴) 목록
+        self.hits = {
+            longest: [
+                (group, pattern)
+                for pattern, pattern_groups in owners.items() if longest.startswith(pattern)
+                for group in pattern_groups
+            ]
+            for longest in owners
+        }
+
+        alternation = '|'.join(re.escape(p) for p in sorted(owners, key=len, reverse=True))
+        self.regex = re.compile(alternation)
+
+    def scan(self, text):
+        """
+        반환: (first, starts)
+        first: {그룹: {패턴: 첫 시작 위치}}
+        starts: {track 그룹: [모든 시작 위치 (오름차순)]}
+        """
+        hits, track = self.hits, self.track
+        search = self.regex.search
+        first = {}
+        starts = {}
+
+        # 매칭 다음 글자부터 다시 검색 (겹치는 매칭 포함, 매칭 사이 구간은 정규식 엔진이 건너뜀)
+        m = search(text)
+        while m:
+            start = m.start()
+            for group, pattern in hits[m.group()]:
+                found = first.setdefault(group, {})
+                if pattern not in found:
+                    found[pattern] = start
+                if group in track:
+                    starts.setdefault(group, []).append(start)
+            m = search(text, start + 1)
+
+        return first, starts
+
+
+_CONTENT_MATCHER = KeywordMatcher({
+    'neg': list(NEGATIVE_KEYWORDS),
+    'pos': list(POSITIVE_KEYWORDS),
+    'negation': NEGATION_PATTERNS,
+}, track=('negation',))
+_TAG_MATCHER = KeywordMatcher({
+    'pos_tag': POSITIVE_TAGS,
+    'neg': list(NEGATIVE_KEYWORDS),
+})
+
+# 매칭 목록을 사전 순서대로 정렬하기 위한 순번
+_NEG_ORDER = {k: i for i, k in enumerate(NEGATIVE_KEYWORDS)}
+_POS_ORDER = {k: i for i, k in enumerate(POSITIVE_KEYWORDS)}
+_TAG_ORDER = {k: i for i, k in enumerate(POSITIVE_TAGS)}
+
+
+def _found(first, group, order):
+    """scan 결과에서 그룹의 매칭 패턴을 사전 순서대로 [(패턴, 첫 위치), ...]"""
+    found = first.get(group)
+    if not found:
+        return []
+    return sorted(found.items(), key=lambda item: order[item[0]])
+
+
+def _negated(negations, start):
+    """키워드 시작 위치 앞 NEGATION_WINDOW글자 안에서 시작하는 부정어가 있는지"""
+    if not negations:
+        return False
+    i = bisect_left(negations, max(0, start - NEGATION_WINDOW))
+    return i < len(negations) and negations[i] < start
+
+
+def calculate_negative_score(review):
+    """리뷰 1건 -> (점수, 매칭 키워드 목록)"""
+    content = (review.get('content') or '').lower()
+    tags = review.get('tags') or []
+
+    score = 0
+    matched_keywords = []
+
+    first, starts = _CONTENT_MATCHER.scan(content)
+    negations = starts.get('negation')
+
+    for keyword, start in _found(first, 'neg', _NEG_ORDER):
+        if not _negated(negations, start):
+            weight = NEGATIVE_KEYWORDS[keyword]
+            score += weight
+            matched_keywords.append(f"-{keyword}({weight})")
+
+    for keyword, _ in _found(first, 'pos', _POS_ORDER):
+        weight = POSITIVE_KEYWORDS[keyword]
+        score += weight
+        matched_keywords.append(f"+{keyword}({weight})")
+
+    if tags:
+        tag_first, _ = _TAG_MATCHER.scan(' '.join(tags).lower())
+
+        for tag, _ in _found(tag_first, 'pos_tag', _TAG_ORDER):
+            score -= 2
+            matched_keywords.append(f"+tag:{tag}")
+
+        for keyword, _ in _found(tag_first, 'neg', _NEG_ORDER):
+            score += NEGATIVE_KEYWORDS[keyword]
+            matched_keywords.append(f"-tag:{keyword}")
+
+    return score, matched_keywords
+
+
+def needs_ai(content, score):
+    """키워드 점수만으로 판단하기 애매한 리뷰 (AI 분석 대상)"""
+    return AI_SCORE_RANGE[0] <= score <= AI_SCORE_RANGE[1] and len(content) > 20
+
+
+def keyword_sentiment(review):
+    """키워드 점수만으로 판정 -> (부정 여부, 점수, 방법, 매칭 키워드 목록)"""
+    score, matched = calculate_negative_score(review)
+
+    if score >= STRONG_NEGATIVE_SCORE:
+        return True, score, "keyword_strong_negative", matched
+
+    if score <= STRONG_POSITIVE_SCORE:
+        return False, score, "keyword_strong_positive", matched
+
+    return score >= NEGATIVE_THRESHOLD, score, "keyword_threshold", matched
+
+
+def keyword_sentiments(reviews):
+    """여러 리뷰 키워드 판정 - [(부정 여부, 점수, 방법), ...] (프로세스 풀 작업 단위)"""
+    return [keyword_sentiment(review)[:3] for review in reviews]
@@ -0,0 +1,448 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리뷰 저장소 (지점별/월별 분할)
+- output/reviews/{place_id}/{YYYY-MM}.json: 한 지점 한 달치 {"visitor": [...], "blog": [...]}
+- output/reviews/{place_id}/ids.json: 리뷰 ID -> 월 (중복 확인/추가를 전체 로드 없이)
+- output/reviews/index.json: 지점 정보 (메타 리뷰수, 워터마크, 월별 건수 등)
+- output/reviews/histogram.json: 지점별 날짜별 리뷰 수 (전체/부정) - 기간 통계는 누적합으로
+- output/reviews/trends.json: 지점 x 주 x 태그/키워드 리뷰 수 (전체/부정) - 리뷰 추가 시 누적
+- 대시보드용: docs/reviews/summary.json (요약) + docs/reviews/{place_id}.json (지점별 리뷰)
+  + docs/reviews/search/{place_id}.json (지점별 검색 색인) + docs/reviews/trends.json (최근 주별 트렌드)
+- 바뀐 월/지점 파일만 다시 씀
+"""
+
+import os
+import re
+import json
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from review_search import build_search_index
+
+
+MONTH_RE = re.compile(r'^\d{4}-\d{2}')
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+UNDATED = 'undated'
+KINDS = ('visitor', 'blog')
+COUNT_FIELDS = ('visitor_count', 'blog_count', 'negative_count')  # 월별 건수에서 계산
+TREND_FIELDS = ('tags', 'keywords')
+
+
+def review_month(review):
+    """리뷰 날짜 -> 'YYYY-MM' (날짜 없으면 'undated')"""
+    date = review.get('visit_date') or review.get('write_date') or ''
+    return date[:7] if MONTH_RE.match(date) else UNDATED
+
+
+def review_sort_key(review):
+    return review.get('visit_date') or review.get('write_date') or ''
+
+
+def review_day(review):
+    """리뷰 날짜 'YYYY-MM-DD' (형식이 다르면 None - 통계에서 제외)"""
+    date = review.get('visit_date') or review.get('write_date') or ''
+    return date if DATE_RE.match(date) else None
+
+
+class DailyHistogram:
+    """
+    날짜별 리뷰 수 {날짜: [전체, 부정]}
+    기간 합계는 정렬된 날짜 + 누적합 배열에서 이분 탐색 두 번 (리뷰 순회 없음)
+    """
+
+    def __init__(self, counts=None):
+        self.counts = counts or {}
+        self._prefix = None
+
+    def add(self, day, negative=False):
+        count = self.counts.setdefault(day, [0, 0])
+        count[0] += 1
+        if negative:
+            count[1] += 1
+        self._prefix = None
+
+    def _build(self):
+        days = sorted(self.counts)
+        totals, negatives = [0], [0]
+        for day in days:
+            total, negative = self.counts[day]
+            totals.append(totals[-1] + total)
+            negatives.append(negatives[-1] + negative)
+        self._prefix = (days, totals, negatives)
+        return self._prefix
+
+    def window(self, start=None, end=None):
+        """start~end (양 끝 포함, None이면 열린 구간) -> (전체, 부정)"""
+        days, totals, negatives = self._prefix or self._build()
+        lo = bisect_left(days, start) if start else 0
+        hi = bisect_right(days, end) if end else len(days)
+        if hi <= lo:
+            return 0, 0
+        return totals[hi] - totals[lo], negatives[hi] - negatives[lo]
+
+
+def review_week(review):
+    """리뷰 날짜가 속한 주의 월요일 'YYYY-MM-DD' (날짜 없으면 None)"""
+    day = review_day(review)
+    if not day:
+        return None
+    d = date.fromisoformat(day)
+    return (d - timedelta(days=d.weekday())).isoformat()
+
+
+class TrendCube:
+    """
+    주별 태그/키워드 리뷰 수 {주: {"reviews": [전체, 부정], "tags": {태그: [전체, 부정]}, "keywords": {...}}}
+    리뷰 추가 시 해당 주 칸만 증가 (전체 리뷰 재집계 없음)
+    """
+
+    def __init__(self, weeks=None):
+        self.weeks = weeks or {}
+
+    def add(self, review):
+        week = review_week(review)
+        if not week:
+            return
+        negative = 1 if review.get('is_negative') else 0
+        cell = self.weeks.setdefault(week, {'reviews': [0, 0], 'tags': {}, 'keywords': {}})
+        cell['reviews'][0] += 1
+        cell['reviews'][1] += negative
+        for field in TREND_FIELDS:
+            terms = cell[field]
+            for term in set(review.get(field) or []):
+                count = terms.setdefault(term, [0, 0])
+                count[0] += 1
+                count[1] += negative
+
+    def merge(self, other):
+        """다른 지점 큐브 합산 (전체 지점 트렌드용)"""
+        for week, cell in other.weeks.items():
+            mine = self.weeks.setdefault(week, {'reviews': [0, 0], 'tags': {}, 'keywords': {}})
+            mine['reviews'] = [a + b for a, b in zip(mine['reviews'], cell['reviews'])]
+            for field in TREND_FIELDS:
+                for term, (total, negative) in cell[field].items():
+                    count = mine[field].setdefault(term, [0, 0])
+                    count[0] += total
+                    count[1] += negative
+        return self
+
+    def recent(self, weeks=12, end=None):
+        """최근 N주 (end 주까지, 기본은 데이터의 마지막 주) - 리뷰 없는 주도 빈 칸으로 포함"""
+        if not self.weeks:
+            return []
+        last = date.fromisoformat(end or max(self.weeks))
+        days = [(last - timedelta(weeks=i)).isoformat() for i in range(weeks - 1, -1, -1)]
+        return [(day, self.weeks.get(day) or {'reviews': [0, 0], 'tags': {}, 'keywords': {}}) for day in days]
+
+    def movers(self, field, top=5, baseline_weeks=4, end=None):
+        """
+        마지막 주 언급 수와 직전 N주 평균의 차이가 큰 태그/키워드
+        반환: {"rising": [...], "falling": [...]} - 항목: term, count, baseline, change, negative_ratio
+        """
+        cells = self.recent(baseline_weeks + 1, end)
+        if not cells:
+            return {'rising': [], 'falling': []}
+        current = cells[-1][1][field]
+        previous = [cell[field] for _, cell in cells[:-1]]
+
+        rows = []
+        for term in set(current).union(*previous):
+            count, negative = current.get(term, (0, 0))
+            baseline = sum(p.get(term, (0, 0))[0] for p in previous) / len(previous)
+            rows.append({
+                'term': term,
+                'count': count,
+                'baseline': round(baseline, 2),
+                'change': round(count - baseline, 2),
+                'negative_ratio': round(negative / count, 3) if count else None,
+            })
+
+        rising = sorted((r for r in rows if r['change'] > 0), key=lambda r: (-r['change'], r['term']))
+        falling = sorted((r for r in rows if r['change'] < 0), key=lambda r: (r['change'], r['term']))
+        return {'rising': rising[:top], 'falling': falling[:top]}
+
+    def summary(self, weeks=12, top=5, terms=10, end=None):
+        """
+        대시보드/AI 컨텍스트용 요약
+        - weeks: 최근 주별 [전체, 부정] + 기간 상위 태그/키워드의 주별 [전체, 부정]
+        - movers: 마지막 주 급상승/급감 태그/키워드
+        """
+        cells = self.recent(weeks, end)
+        result = {'weeks': [day for day, _ in cells], 'reviews': [cell['reviews'] for _, cell in cells]}
+        for field in TREND_FIELDS:
+            totals = {}
+            for _, cell in cells:
+                for term, (count, _) in cell[field].items():
+                    totals[term] = totals.get(term, 0) + count
+            top_terms = sorted(totals, key=lambda t: (-totals[t], t))[:terms]
+            result[field] = {term: [cell[field].get(term, [0, 0]) for _, cell in cells] for term in top_terms}
+            result[f"{field}_movers"] = self.movers(field, top, end=end)
+        return result
+
+
+def store_fields(store):
+    """지점 dict에서 리뷰 목록/건수를 뺀 지점 정보"""
+    return {k: v for k, v in store.items() if not k.endswith('_reviews') and k not in COUNT_FIELDS}
+
+
+def write_json(path, data, compact=True):
+    """임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 파일 유지)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        if compact:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        else:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def read_json(path, default=None):
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ReviewStore:
+    """지점별/월별 리뷰 파일 + 리뷰 ID 색인"""
+
+    def __init__(self, root='output/reviews'):
+        self.root = root
+        index = read_json(os.path.join(root, 'index.json'), {})
+        self.stores = index.get('stores', {})  # place_id -> 지점 정보
+        self._ids = {}        # place_id -> {리뷰 ID: 월}
+        self._months = {}     # (place_id, 월) -> {"visitor": [...], "blog": [...]}
+        self._dirty = set()   # 다시 쓸 (place_id, 월)
+        self.changed = set()  # 리뷰가 추가된 place_id
+        self._histogram_dirty = False
+
+        counts = read_json(os.path.join(root, 'histogram.json'))
+        trends = read_json(os.path.join(root, 'trends.json'))
+        if (counts is None or trends is None) and self.stores:
+            counts, trends = self._count_days()
+        self.histograms = {pid: DailyHistogram(days) for pid, days in (counts or {}).items()}
+        self.trends = {pid: TrendCube(weeks) for pid, weeks in (trends or {}).items()}
+
+    def _path(self, place_id, name):
+        return os.path.join(self.root, str(place_id), name)
+
+    def _count_days(self):
+        """histogram.json/trends.json이 없을 때 월 파일에서 한 번 계산"""
+        self._histogram_dirty = True
+        counts, trends = {}, {}
+        for place_id in self.stores:
+            histogram, cube = self._store_aggregates(place_id)
+            counts[place_id], trends[place_id] = histogram.counts, cube.weeks
+        return counts, trends
+
+    def _store_aggregates(self, place_id):
+        """지점 월 파일 전체 -> (날짜별 히스토그램, 주별 트렌드 큐브)"""
+        histogram = DailyHistogram()
+        cube = TrendCube()
+        for month in self.months(place_id):
+            shard = self.load_month(place_id, month)
+            for review in shard['visitor'] + shard['blog']:
+                day = review_day(review)
+                if day:
+                    histogram.add(day, review.get('is_negative'))
+                cube.add(review)
+        return histogram, cube
+
+    def histogram(self, place_id):
+        if place_id not in self.histograms:
+            self.histograms[place_id] = DailyHistogram()
+        return self.histograms[place_id]
+
+    def trend(self, place_id):
+        if place_id not in self.trends:
+            self.trends[place_id] = TrendCube()
+        return self.trends[place_id]
+
+    def is_empty(self):
+        return not self.stores
+
+    def ids(self, place_id):
+        """지점 리뷰 ID -> 월 색인 (처음 접근할 때 한 번만 로드)"""
+        if place_id not in self._ids:
+            self._ids[place_id] = read_json(self._path(place_id, 'ids.json'), {})
+        return self._ids[place_id]
+
+    def months(self, place_id):
+        return sorted((self.stores.get(place_id) or {}).get('months', {}))
+
+    def load_month(self, place_id, month):
+        key = (place_id, month)
+        if key not in self._months:
+            shard = read_json(self._path(place_id, f"{month}.json"), {})
+            self._months[key] = {kind: shard.get(kind, []) for kind in KINDS}
+        return self._months[key]
+
+    def add(self, place_id, kind, reviews):
+        """
+        새 리뷰만 해당 월 파일에 추가 (ID가 이미 있으면 기존 리뷰 유지)
+        반환: 추가된 리뷰 수
+        """
+        ids = self.ids(place_id)
+        info = self.stores.setdefault(place_id, {'place_id': place_id})
+        months = info.setdefault('months', {})
+        histogram = self.histogram(place_id)
+        cube = self.trend(place_id)
+        added = 0
+
+        for review in reviews:
+            review_id = review.get('id')
+            if not review_id or review_id in ids:
+                continue
+            month = review_month(review)
+            self.load_month(place_id, month)[kind].append(review)
+            ids[review_id] = month
+
+            counts = months.setdefault(month, {'visitor': 0, 'blog': 0, 'negative': 0})
+            counts[kind] += 1
+            if review.get('is_negative'):
+                counts['negative'] += 1
+
+            day = review_day(review)
+            if day:
+                histogram.add(day, review.get('is_negative'))
+            cube.add(review)
+
+            self._dirty.add((place_id, month))
+            added += 1
+
+        if added:
+            self.changed.add(place_id)
+        return added
+
+    def mark_changed(self, place_id, months):
+        """
+        이미 저장된 리뷰를 고쳤을 때 (재채점 등) - 해당 월 파일을 다시 쓰고
+        월별 건수와 지점 히스토그램/트렌드를 다시 계산
+        """
+        counts = self.stores[place_id].setdefault('months', {})
+        for month in months:
+            shard = self.load_month(place_id, month)
+            counts[month] = {
+                'visitor': len(shard['visitor']),
+                'blog': len(shard['blog']),
+                'negative': sum(1 for r in shard['visitor'] + shard['blog'] if r.get('is_negative')),
+            }
+            self._dirty.add((place_id, month))
+        self.histograms[place_id], self.trends[place_id] = self._store_aggregates(place_id)
+        self._histogram_dirty = True
+        self.changed.add(place_id)
+
+    def update_store(self, place_id, fields):
+        """지점 정보 갱신 (지점명, 메타 리뷰수, 워터마크, 수집 시각 등)"""
+        self.stores.setdefault(place_id, {'place_id': place_id, 'months': {}}).update(fields)
+
+    def store_info(self, place_id):
+        """지점 정보 + 전체 월 합계 (visitor_count/blog_count/negative_count)"""
+        info = dict(self.stores.get(place_id) or {})
+        months = info.pop('months', {})
+        for field, key in zip(COUNT_FIELDS, ('visitor', 'blog', 'negative')):
+            info[field] = sum(m[key] for m in months.values())
+        return info
+
+    def reviews(self, place_id, kind):
+        """지점의 한 종류 리뷰 전체 (최신순)"""
+        reviews = []
+        for month in self.months(place_id):
+            reviews.extend(self.load_month(place_id, month)[kind])
+        reviews.sort(key=review_sort_key, reverse=True)
+        return reviews
+
+    def store_data(self, place_id):
+        """기존 review_data.json의 지점 항목 형식"""
+        data = self.store_info(place_id)
+        for kind in KINDS:
+            data[f"{kind}_reviews"] = self.reviews(place_id, kind)
+        return data
+
+    def import_stores(self, stores):
+        """기존 통합 파일(review_data.json)의 stores 목록 가져오기"""
+        added = 0
+        for store in stores:
+            place_id = store.get('place_id')
+            if not place_id:
+                continue
+            for kind in KINDS:
+                added += self.add(place_id, kind, store.get(f"{kind}_reviews", []))
+            self.update_store(place_id, store_fields(store))
+        return added
+
+    def save(self):
+        """바뀐 월 파일, ID 색인, 지점 정보 저장"""
+        for place_id, month in sorted(self._dirty):
+            shard = self._months[(place_id, month)]
+            for kind in KINDS:
+                shard[kind].sort(key=review_sort_key, reverse=True)
+            write_json(self._path(place_id, f"{month}.json"), shard)
+
+        for place_id in {place_id for place_id, _ in self._dirty} & set(self._ids):
+            write_json(self._path(place_id, 'ids.json'), self._ids[place_id])
+
+        write_json(os.path.join(self.root, 'index.json'), {'stores': self.stores}, compact=False)
+        if self._dirty or self._histogram_dirty:
+            write_json(os.path.join(self.root, 'histogram.json'),
+                       {pid: h.counts for pid, h in self.histograms.items()})
+            write_json(os.path.join(self.root, 'trends.json'),
+                       {pid: cube.weeks for pid, cube in self.trends.items()})
+        written = len(self._dirty)
+        self._dirty.clear()
+        self._histogram_dirty = False
+        return written
+
+    def publish(self, docs_dir, result, place_ids):
+        """
+        대시보드 파일 쓰기
+        result: generated_at/platform/summary/stats (리뷰 목록 제외)
+        place_ids: 대시보드 지점 순서 - 리뷰가 추가됐거나 파일이 없는 지점만 다시 씀
+        반환: (다시 쓴 지점 수, 검색 색인 통계 {stores, seconds, bytes, grams})
+        """
+        stores = []
+        written = 0
+        search = {'stores': 0, 'seconds': 0.0, 'bytes': 0, 'grams': 0}
+        for place_id in place_ids:
+            info = self.store_info(place_id)
+            info['file'] = f"{place_id}.json"
+            stores.append(info)
+
+            path = os.path.join(docs_dir, info['file'])
+            search_path = os.path.join(docs_dir, 'search', info['file'])
+            if place_id in self.changed or not os.path.exists(path) or not os.path.exists(search_path):
+                visitor = self.reviews(place_id, 'visitor')
+                blog = self.reviews(place_id, 'blog')
+                write_json(path, {
+                    'store_name': info.get('store_name'),
+                    'place_id': place_id,
+                    'visitor_reviews': visitor,
+                    'blog_reviews': blog,
+                })
+                written += 1
+
+                # 색인 순번은 위 파일의 visitor_reviews + blog_reviews 순서
+                started = time.time()
+                index = build_search_index(visitor + blog)
+                search['seconds'] += time.time() - started
+                write_json(search_path, index)
+                search['stores'] += 1
+                search['bytes'] += os.path.getsize(search_path)
+                search['grams'] += len(index['grams'])
+
+        write_json(os.path.join(docs_dir, 'summary.json'), dict(result, stores=stores))
+
+        # 주별 트렌드 (전체 + 지점별, 같은 주 범위) - 지점 리뷰 파일 없이 차트/AI 컨텍스트에 사용
+        overall = TrendCube()
+        for place_id in place_ids:
+            overall.merge(self.trend(place_id))
+        end = max(overall.weeks) if overall.weeks else None
+        write_json(os.path.join(docs_dir, 'trends.json'), {
+            'generated_at': result.get('generated_at'),
+            'all': overall.summary(end=end),
+            'stores': {place_id: self.trend(place_id).summary(end=end) for place_id in place_ids},
+        })
+        return written, search
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+지점 식별 레지스트리
+- KIS(포스) 지점코드/지점명, 사조(발주) 지점명, 네이버 플레이스 ID를 하나의 지점 ID로 연결
+- 별칭 인덱스(dict)로 조회 - 매 실행마다 유사 문자열 매칭하지 않음
+"""
+
+import re
+
+
+# ============================================
+# 지점 목록
+# id: 정규 지점 ID (지점명에서 브랜드명을 뺀 이름)
+# kis_codes: KIS SHOP_CD (KIOSK 등 보조 포스 포함)
+# aliases: 사조/KIS에서 실제로 쓰인 지점명
+# ============================================
+
+STORES = [
+    {
+        "id": "본점",
+        "name": "역대짬뽕 본점",
+        "kis_codes": ["B90117"],
+        "aliases": ["역대짬뽕 장안본점(98)", "역대짬뽕 본점"],
+        "naver_place_id": "1542530224"
+    },
+    {
+        "id": "병점점",
+        "name": "역대짬뽕 병점점",
+        "kis_codes": ["K12021"],
+        "aliases": ["역대짬뽕병점점(99)", "역대짬뽕 병점점(99)", "역대짬뽕 병점점"],
+        "naver_place_id": "1870047654"
+    },
+    {
+        "id": "송파점",
+        "name": "역대짬뽕 송파점",
+        "kis_codes": ["N34702"],
+        "aliases": ["역대짬뽕 송파점(95)", "역대짬뽕 송파점"],
+        "naver_place_id": "2066998075"
+    },
+    {
+        "id": "다산1호점",
+        "name": "역대짬뽕 다산1호점",
+        "kis_codes": ["K95825"],
+        "aliases": ["역대짬뽕 다산1호점(14)", "역대짬뽕 다산1호점"],
+        "naver_place_id": "1455516190"
+    },
+    {
+        "id": "화성반월점",
+        "name": "역대짬뽕 화성반월점",
+        "kis_codes": ["K49757"],
+        "aliases": ["역대짬뽕 화성반월점(99)", "역대짬뽕 화성반월점"],
+        "naver_place_id": "1474983307"
+    },
+    {
+        "id": "오산시청점",
+        "name": "역대짬뽕 오산시청점",
+        "kis_codes": ["K10717"],
+        "aliases": [
+            "역대짬뽕 오산시청점(99)(종료25.04)",
+            "역대짬뽕(화목토)(99)新오산시청점",
+            "역대짬뽕 오산시청점(99)",
+            "역대짬뽕 오산시청점"
+        ],
+        "naver_place_id": "1160136895"
+    },
+    {
+        "id": "두정점",
+        "name": "역대짬뽕 두정점",
+        "kis_codes": ["N37528"],
+        "aliases": ["역대짬뽕 두정점(IOI)", "역대짬뽕 두정점(101)", "역대짬뽕 두정점"],
+        "naver_place_id": "1726445983"
+    },
+    {
+        "id": "송탄점",
+        "name": "역대짬뽕 송탄점",
+        "kis_codes": ["K42183", "K48668"],
+        "aliases": ["역대짬뽕 송탄점(99)", "역대짬뽕 송탄점", "역대짬뽕(송탄점)KIOSK"],
+        "naver_place_id": "1147851109"
+    },
+    {
+        "id": "여수국동점",
+        "name": "역대짬뽕 여수국동점",
+        "kis_codes": [],
+        "aliases": ["역대짬뽕 여수국동점(종료24.07)", "역대짬뽕 여수국동점"],
+        "naver_place_id": "1773140342"
+    },
+    {
+        "id": "봉담점",
+        "name": "역대짬뽕 봉담점",
+        "kis_codes": ["N15875"],
+        "aliases": ["역대짬뽕 봉담점(99)(종료25.07)", "역대짬뽕 봉담점"],
+        "naver_place_id": ""
+    },
+    {
+        "id": "세종점",
+        "name": "역대짬뽕 세종점",
+        "kis_codes": ["B86144"],
+        "aliases": ["역대짬뽕 세종점(수금)(IOI)(종료25.09)", "역대짬뽕 세종점"],
+        "naver_place_id": ""
+    },
+    {
+        "id": "천안SDI점",
+        "name": "역대짬뽕 천안SDI점",
+        "kis_codes": ["K63270"],
+        "aliases": ["역대짬뽕 천안SDI점(36)(종료25.09)", "역대짬뽕 천안SDI점"],
+        "naver_place_id": ""
+    },
+    {
+        "id": "수유점",
+        "name": "역대짬뽕 수유점",
+        "kis_codes": ["B85707"],
+        "aliases": ["역대짬뽕 수유점"],
+        "naver_place_id": ""
+    },
+    {
+        "id": "영통점",
+        "name": "역대짬뽕 영통점",
+        "kis_codes": ["B91513"],
+        "aliases": ["역대짬뽕 영통점"],
+        "naver_place_id": ""
+    },
+    {
+        "id": "역대반점",
+        "name": "역대반점",
+        "kis_codes": ["K14172"],
+        "aliases": ["역대반점"],
+        "naver_place_id": ""
+    },
+]
+
+
+def normalize_store_name(name):
+    """
+    지점명 정규화 키 생성
+    예: "■ 역대짬뽕 두정점(IOI)" -> "두정점"
+        "역대짬뽕(화목토)(99)新오산시청점" -> "오산시청점"
+    """
+    if not name:
+        return ""
+    key = str(name).replace('■', '')
+    key = re.sub(r'\([^)]*\)', '', key)
+    key = key.replace('新', '').replace('KIOSK', '')
+    key = key.replace('역대짬뽕', '')
+    key = re.sub(r'\s+', '', key)
+    return key or re.sub(r'\s+', '', str(name).replace('■', ''))
+
+
+class StoreRegistry:
+    """지점 별칭 인덱스 (지점명/KIS 코드/플레이스 ID -> 정규 지점 ID)"""
+
+    def __init__(self, stores=None):
+        self.stores = {s["id"]: s for s in (stores or STORES)}
+        self.by_code = {}
+        self.by_alias = {}
+        self.by_key = {}
+        self.by_place = {}
+        self.unresolved = set()
+
+        for store_id, store in self.stores.items():
+            for code in store.get("kis_codes", []):
+                self.by_code[code] = store_id
+            for alias in store.get("aliases", []) + [store["name"]]:
+                self.by_alias[alias] = store_id
+                self.by_key[normalize_store_name(alias)] = store_id
+            if store.get("naver_place_id"):
+                self.by_place[store["naver_place_id"]] = store_id
+
+    def resolve(self, name=None, code=None):
+        """KIS 코드 또는 지점명으로 정규 지점 ID 조회 (없으면 None)"""
+        if code and code in self.by_code:
+            return self.by_code[code]
+
+        if not name:
+            return None
+
+        name = str(name).strip()
+        store_id = self.by_alias.get(name)
+        if store_id:
+            return store_id
+
+        key = normalize_store_name(name)
+        store_id = self.by_key.get(key)
+        if store_id:
+            # 다음 조회부터는 원본 이름으로 바로 찾도록 별칭 추가
+            self.by_alias[name] = store_id
+            return store_id
+
+        self.unresolved.add(name)
+        return None
+
+    def resolve_place(self, place_id):
+        return self.by_place.get(str(place_id))
+
+    def name(self, store_id):
+        store = self.stores.get(store_id)
+        return store["name"] if store else store_id
+
+    def to_list(self):
+        return [
+            {
+                "id": s["id"],
+                "name": s["name"],
+                "kis_codes": s.get("kis_codes", []),
+                "naver_place_id": s.get("naver_place_id", "")
+            }
+            for s in self.stores.values()
+        ]
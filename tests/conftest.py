@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 스크립트 실행 때와 같이 루트 공용 모듈(store_registry, browser_policy 등)과
+# scripts/ 형제 모듈을 import할 수 있도록 경로에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
@@ -0,0 +1,90 @@
+import copy
+
+from naver_ads_api import NaverAdsAPI, fetch_entity_tree
+
+
+class FakeAdsAPI:
+    """캠페인/광고그룹/키워드를 메모리에 들고 있는 검색광고 API 대역"""
+    KEYWORD_IDS_BATCH = 2
+    workers = 1
+
+    def __init__(self, campaigns, adgroups, keywords):
+        self.campaigns = campaigns
+        self.adgroups = adgroups
+        self.keywords = keywords
+        self.calls = {'adgroup': 0, 'ids': 0}
+
+    def map_concurrent(self, func, items):
+        return NaverAdsAPI.map_concurrent(self, func, items)
+
+    def get_campaigns(self):
+        return copy.deepcopy(self.campaigns)
+
+    def get_adgroups(self, campaign_id=None):
+        return [copy.deepcopy(ag) for ag in self.adgroups
+                if campaign_id is None or ag['nccCampaignId'] == campaign_id]
+
+    def get_keywords(self, adgroup_id):
+        self.calls['adgroup'] += 1
+        return [copy.deepcopy(kw) for kw in self.keywords if kw['nccAdgroupId'] == adgroup_id]
+
+    def get_keywords_by_ids(self, keyword_ids):
+        self.calls['ids'] += 1
+        return [copy.deepcopy(kw) for kw in self.keywords if kw['nccKeywordId'] in keyword_ids]
+
+
+def make_api():
+    campaigns = [{'nccCampaignId': 'c1', 'name': '캠페인1'}]
+    adgroups = [
+        {'nccAdgroupId': 'g1', 'nccCampaignId': 'c1', 'name': '그룹1', 'editTm': 't1'},
+        {'nccAdgroupId': 'g2', 'nccCampaignId': 'c1', 'name': '그룹2', 'editTm': 't1'},
+        {'nccAdgroupId': 'g3', 'nccCampaignId': 'c9', 'name': '고아 그룹', 'editTm': 't1'},
+    ]
+    keywords = [
+        {'nccKeywordId': 'k1', 'nccAdgroupId': 'g1', 'keyword': '떡볶이', 'bidAmt': 100, 'editTm': 't1'},
+        {'nccKeywordId': 'k2', 'nccAdgroupId': 'g1', 'keyword': '순대', 'bidAmt': 100, 'editTm': 't1'},
+        {'nccKeywordId': 'k3', 'nccAdgroupId': 'g2', 'keyword': '튀김', 'bidAmt': 100, 'editTm': 't1'},
+        {'nccKeywordId': 'k4', 'nccAdgroupId': 'g3', 'keyword': '김밥', 'bidAmt': 100, 'editTm': 't1'},
+    ]
+    return FakeAdsAPI(campaigns, adgroups, keywords)
+
+
+def snapshot_of(api):
+    _, adgroups, keywords, _ = fetch_entity_tree(api)
+    return {'adgroups': adgroups, 'keywords': keywords}
+
+
+def test_incremental_matches_full_fetch_after_keyword_only_edit():
+    api = make_api()
+    snapshot = snapshot_of(api)
+
+    # 키워드 입찰가만 수정 - 광고그룹 editTm은 그대로
+    api.keywords[1].update(bidAmt=300, editTm='t2')
+
+    full = fetch_entity_tree(api)[:3]
+    api.calls = {'adgroup': 0, 'ids': 0}
+    campaigns, adgroups, keywords, refetched = fetch_entity_tree(api, snapshot)
+
+    assert (campaigns, adgroups, keywords) == full
+    assert refetched == 1
+    assert api.calls == {'adgroup': 1, 'ids': 2}
+
+
+def test_incremental_reuses_unchanged_adgroups():
+    api = make_api()
+    snapshot = snapshot_of(api)
+
+    _, _, keywords, refetched = fetch_entity_tree(api, snapshot)
+
+    assert refetched == 0
+    assert keywords == snapshot['keywords']
+
+
+def test_orphan_adgroups_are_kept():
+    api = make_api()
+
+    _, adgroups, keywords, _ = fetch_entity_tree(api)
+
+    assert [ag['nccAdgroupId'] for ag in adgroups] == ['g1', 'g2', 'g3']
+    assert adgroups[-1]['campaignName'] == ''
+    assert keywords[-1]['keyword'] == '김밥'
@@ -0,0 +1,26 @@
+from ads_history import diff_state, record_snapshot, build_series, load_index
+
+
+def result_with(keywords):
+    return {'keywords': [{'keyword': text, 'bidAmt': bid} for text, bid in keywords.items()]}
+
+
+def test_diff_state_emits_removed_keywords():
+    prev = {'떡볶이': {'bid': 100}, '순대': {'bid': 200, 'qc_m': 30}}
+    curr = {'떡볶이': {'bid': 150}}
+
+    assert diff_state(prev, curr) == {'떡볶이': {'bid': 150}, '순대': None}
+
+
+def test_removed_keyword_leaves_state_and_series(tmp_path):
+    history_dir = str(tmp_path)
+    record_snapshot(result_with({'떡볶이': 100, '순대': 200}), history_dir, '2026-01-01')
+    changed = record_snapshot(result_with({'떡볶이': 100}), history_dir, '2026-01-02')
+
+    assert changed == 1
+    assert load_index(history_dir)['state'] == {'떡볶이': {'bid': 100}}
+    assert load_index(history_dir)['keywords']['순대'] == [['2026-01-01', 0], ['2026-01-02', 1]]
+
+    series = build_series(history_dir, days=2, fields=['bid'], end_date='2026-01-02')
+    assert series['series']['순대']['bid'] == [200, None]
+    assert series['series']['떡볶이']['bid'] == [100, 100]
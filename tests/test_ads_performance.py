@@ -0,0 +1,34 @@
+import pytest
+
+from ads_performance import PerformanceStore
+from naver_ads_api import NaverAdsAPI
+
+
+@pytest.fixture
+def api(monkeypatch):
+    for name in ('NAVER_AD_API_KEY', 'NAVER_AD_SECRET_KEY', 'NAVER_AD_CUSTOMER_ID'):
+        monkeypatch.setenv(name, 'test')
+    api = NaverAdsAPI(workers=1)
+    api.deleted = []
+    api.create_stat_report = lambda stat_date, report_type: {
+        'reportJobId': stat_date, 'status': 'NONE' if stat_date.endswith('02') else 'BUILT',
+        'downloadUrl': f'https://example.com/{stat_date}'}
+    api.download_report = lambda url: iter([
+        ['20260102', 'c', 'cmp', 'grp', 'kw', 'ad', 'ch', 'm', 'M', '10', '2', '300', '15', '0'],
+    ])
+    api.delete_stat_report = api.deleted.append
+    return api
+
+
+def test_no_data_day_is_stored_and_not_requested_again(api, tmp_path):
+    store = PerformanceStore(str(tmp_path))
+    dates = store.missing(3, end_date='2026-01-03')
+    assert dates == ['2026-01-01', '2026-01-02', '2026-01-03']
+
+    result = api.fetch_stat_reports(dates, store.write)
+
+    assert result == {'2026-01-01': 1, '2026-01-02': 0, '2026-01-03': 1}
+    assert store.load('2026-01-02') == {'date': '2026-01-02', 'rows': 0, 'keywords': {}}
+    assert store.missing(3, end_date='2026-01-03') == []
+    assert sorted(api.deleted) == dates
+    assert [day['imp'] for day in store.summary(days=3)['daily']] == [10, 0, 10]
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+import naver_ads_api
+from naver_ads_api import NaverAdsAPI
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.text = json.dumps(body) if body is not None else 'error'
+        self.headers = {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    """average-position-bid 대역 - statuses가 남아 있으면 그 상태 코드부터 응답"""
+
+    def __init__(self, statuses=()):
+        self.statuses = list(statuses)
+        self.requests = []
+
+    def request(self, method, url, headers=None, params=None, json=None, timeout=None):
+        self.requests.append(json)
+        if self.statuses:
+            return FakeResponse(self.statuses.pop(0))
+        if any(item['key'] == '없는키워드' for item in json['items']):
+            return FakeResponse(400)
+        return FakeResponse(200, {'estimate': [
+            {'keyword': item['key'], 'position': item['position'], 'bid': 1000 * item['position']}
+            for item in json['items']
+        ]})
+
+
+@pytest.fixture
+def api(monkeypatch):
+    for name in ('NAVER_AD_API_KEY', 'NAVER_AD_SECRET_KEY', 'NAVER_AD_CUSTOMER_ID'):
+        monkeypatch.setenv(name, 'test')
+    monkeypatch.setattr(naver_ads_api.time, 'sleep', lambda seconds: None)
+    api = NaverAdsAPI(rate=1000, workers=1, max_retries=2)
+    api.session = FakeSession()
+    return api
+
+
+def test_invalid_keyword_only_drops_itself(api):
+    keywords = [f'키워드{i}' for i in range(7)] + ['없는키워드']
+
+    result = api.get_rank_bids_batch(keywords, positions=(1, 2), devices=('PC',))
+
+    assert sorted(result) == sorted(keywords[:-1])
+    assert result['키워드0'] == [{'rank': 1, 'mobileBid': 0, 'pcBid': 1000},
+                                {'rank': 2, 'mobileBid': 0, 'pcBid': 2000}]
+    # 8개 키워드 묶음 -> 4/4 -> 2/2 -> 1/1 로 나눠 잘못된 키워드만 제외
+    assert len(api.session.requests) == 7
+
+
+def test_throttled_chunk_is_retried_not_bisected(api):
+    api.session = FakeSession([429, 429])
+    keywords = [f'키워드{i}' for i in range(4)]
+
+    result = api.get_rank_bids_batch(keywords, positions=(1,), devices=('PC',))
+
+    assert sorted(result) == keywords
+    assert len(api.session.requests) == 3
+    assert api.stats['throttled'] == 2
+
+
+@pytest.mark.parametrize('status', [429, 401, 403])
+def test_throttle_or_auth_failure_is_reported_not_bisected(api, status):
+    api.session = FakeSession([status] * 10)
+    keywords = [f'키워드{i}' for i in range(4)]
+
+    result = api.get_rank_bids_batch(keywords, positions=(1,), devices=('PC',))
+
+    assert result == {}
+    # 429는 재시도 후 실패, 인증 오류는 바로 실패 - 어느 쪽도 묶음을 나누지 않음
+    assert len(api.session.requests) == (3 if status == 429 else 1)
+
+
+class HtmlResponse(FakeResponse):
+    def __init__(self):
+        super().__init__(200)
+        self.text = '<html>서비스 점검 중</html>'
+
+    def json(self):
+        raise ValueError('Expecting value: line 1 column 1 (char 0)')
+
+
+def test_non_json_success_is_a_failed_request(api):
+    api.session.request = lambda *args, **kwargs: api.session.requests.append(kwargs['json']) or HtmlResponse()
+
+    assert api._request('GET', '/ncc/campaigns') is None
+    assert api.get_rank_bids_batch(['키워드0', '키워드1'], positions=(1,), devices=('PC',)) == {}
+    # 묶음을 나누거나 재시도하지 않고 실패로 집계
+    assert len(api.session.requests) == 2
+    assert api.stats['failed'] == 2
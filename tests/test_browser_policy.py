@@ -0,0 +1,23 @@
+import pytest
+
+from browser_policy import SAJO_POLICY, KIS_POLICY, NAVER_REVIEW_POLICY
+
+
+@pytest.mark.parametrize('policy, url', [
+    (SAJO_POLICY, 'https://sajo.example.com/ibsheet/ibsheet.js?v=7'),
+    (SAJO_POLICY, 'https://sajo.example.com/ibsheet/ibleaders.js'),
+    (KIS_POLICY, 'https://kis.okpos.co.kr/js/ibsheet/ibsheetinfo.js'),
+    (KIS_POLICY, 'https://kis.okpos.co.kr/js/cswm/cswmMenu.js'),
+    (NAVER_REVIEW_POLICY, 'https://m.place.naver.com/_next/static/chunks/main.js'),
+])
+def test_page_scripts_get_through(policy, url):
+    assert not policy.blocks(url)
+
+
+@pytest.mark.parametrize('url', [
+    'https://kis.okpos.co.kr/js/ibsheet/Main/sheet_icon.png',
+    'https://fonts.example.com/NanumGothic.woff2',
+    'https://www.googletagmanager.com/gtag/js?id=G-1',
+])
+def test_assets_and_analytics_are_blocked(url):
+    assert KIS_POLICY.blocks(url)
@@ -0,0 +1,46 @@
+from json import dumps
+
+from review_ai import GeminiReviewAnalyzer
+
+
+class FakeResponse:
+    status_code = 200
+    ok = True
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    """리뷰 max_batch개를 넘는 요청은 응답이 잘린 것처럼 MAX_TOKENS로 끝냄"""
+
+    def __init__(self, max_batch):
+        self.max_batch = max_batch
+        self.batches = []
+
+    def post(self, url, json=None, timeout=None):
+        prompt = json['contents'][0]['parts'][0]['text']
+        count = sum(1 for line in prompt.splitlines() if line[:1].isdigit() and '. "' in line)
+        self.batches.append(count)
+        if count > self.max_batch:
+            return FakeResponse({'candidates': [{'content': {'parts': [{'text': '[{"index": 0, "is_neg'}]},
+                                                 'finishReason': 'MAX_TOKENS'}]})
+        answer = [{'index': i, 'is_negative': i % 2 == 1, 'confidence': 0.9} for i in range(count)]
+        return FakeResponse({'candidates': [{'content': {'parts': [{'text': dumps(answer)}]},
+                                             'finishReason': 'STOP'}]})
+
+
+def test_truncated_batch_is_split_instead_of_failed():
+    analyzer = GeminiReviewAnalyzer('key', cache_path=None, batch_size=8, workers=1)
+    analyzer.session = FakeSession(max_batch=2)
+    contents = [f'리뷰 본문 {i}' for i in range(8)]
+
+    results = analyzer.analyze(contents)
+
+    assert all(results[c] is not None for c in contents)
+    assert analyzer.session.batches == [8, 4, 2, 2, 4, 2, 2]
+    assert analyzer.stats['failed'] == 0
+    assert analyzer.stats['analyzed'] == 8
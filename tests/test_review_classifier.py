@@ -0,0 +1,24 @@
+import json
+
+from review_classifier import NaiveBayesClassifier, load_model, read_model
+
+
+def save(path, model):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'model': model.to_dict()}, f)
+
+
+def test_model_without_thresholds_is_not_loaded_for_crawling(tmp_path):
+    path = str(tmp_path / 'model.json')
+    save(path, NaiveBayesClassifier({'맛없': 2.0}, low=None, high=None))
+
+    assert load_model(path) is None
+    assert read_model(path).weights == {'맛없': 2.0}
+
+
+def test_model_with_one_threshold_is_loaded(tmp_path):
+    path = str(tmp_path / 'model.json')
+    save(path, NaiveBayesClassifier({'맛없': 5.0}, bias=-5.0, low=0.05, high=None))
+
+    model = load_model(path)
+    assert model.decide(['좋아요', '맛없어요']) == [False, None]
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from naver_review_crawler import clean_text, generate_review_id, visitor_item_review
+from review_store import ReviewStore, KINDS
+
+REVIEW_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output', 'reviews')
+
+
+@pytest.mark.parametrize('inner_text, selenium_text', [
+    ('짬뽕 국물이 진하고\xa0\xa0맛있어요.\n탕수육도\xa0바삭해서 또 올게요!\n\n주차는 조금 불편해요',
+     '짬뽕 국물이 진하고 맛있어요.\n탕수육도 바삭해서 또 올게요!\n\n주차는 조금 불편해요'),
+    ('\t기대 이하였어요.   면이 퍼져서 나왔고\r\n 직원분은 친절했지만 ',
+     '기대 이하였어요. 면이 퍼져서 나왔고\n직원분은 친절했지만'),
+    ('굿굿 👍\n\xa0분위기 좋아요\xa0', '굿굿 👍\n분위기 좋아요'),
+])
+def test_clean_text_follows_selenium_whitespace(inner_text, selenium_text):
+    assert clean_text(inner_text) == selenium_text
+
+
+def test_whitespace_variants_keep_review_id():
+    item = {'author': ' 손민성80 ', 'content': '짬뽕\xa0\xa0맛있어요 \n 또 올게요', 'date': '1.31.토'}
+    selenium = {'author': '손민성80', 'content': '짬뽕 맛있어요\n또 올게요', 'date': '1.31.토'}
+
+    assert visitor_item_review(item)['id'] == visitor_item_review(selenium)['id']
+
+
+@pytest.mark.skipif(not os.path.isdir(REVIEW_DIR), reason='리뷰 저장소 없음')
+def test_stored_selenium_text_is_unchanged():
+    """이미 저장된 리뷰(Selenium .text로 수집)는 정리해도 그대로 - 저장된 리뷰 ID와 같은 해시"""
+    store = ReviewStore(REVIEW_DIR)
+    reviews = [r for pid in store.stores for kind in KINDS for r in store.reviews(pid, kind)]
+
+    changed = [
+        r['id'] for r in reviews
+        if generate_review_id(dict(r, author=clean_text(r.get('author')),
+                                   content=clean_text(r.get('content')))) != generate_review_id(r)
+    ]
+
+    assert reviews
+    assert changed == []
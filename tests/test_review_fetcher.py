@@ -0,0 +1,119 @@
+import os
+import json
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+import naver_review_crawler as crawler
+from naver_review_fetcher import PlaceReviewFetcher
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'graphql')
+EMPTY = {'getVisitorReviews': {'visitorReviews': {'items': [], 'total': 0}},
+         'getFsasReviews': {'fsasReviews': {'items': [], 'total': 0}}}
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """녹화한 GraphQL 응답 재생 - (operationName, page) -> (상태, 본문, Content-Type)"""
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))[0]
+        review_input = payload['variables']['input']
+        self.server.requests.append((payload['operationName'], review_input))
+
+        key = (payload['operationName'], review_input['page'])
+        status, body, content_type = self.server.responses.get(
+            key, (200, json.dumps([{'data': EMPTY[key[0]]}]).encode(), 'application/json'))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(('127.0.0.1', 0), ReplayHandler)
+    httpd.responses = {}
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_fetcher(httpd, page_size=2):
+    return PlaceReviewFetcher(api_url=f"http://127.0.0.1:{httpd.server_port}/graphql",
+                              workers=1, page_size=page_size, max_retries=0)
+
+
+def test_visitor_reviews_follow_cursor(server):
+    server.responses = {
+        ('getVisitorReviews', 1): (200, fixture('visitor_page1.json'), 'application/json'),
+        ('getVisitorReviews', 2): (200, fixture('visitor_page2.json'), 'application/json'),
+    }
+
+    reviews = make_fetcher(server).fetch_visitor_reviews('1234', parse_date=crawler.parse_date)
+
+    assert [r['author'] for r in reviews] == ['손민성80', 'yumyum', '점심사냥꾼']
+    assert 'after' not in server.requests[0][1]
+    assert server.requests[1][1]['after'] == '67a0b5d1e4b0a1d2c3e4f402'
+
+    first = reviews[0]
+    assert first['content'] == '짬뽕 국물이 진하고 맛있어요.\n탕수육도 바삭해서 또 올게요!'
+    assert sorted(first['keywords']) == ['양이 많아요', '음식이 맛있어요']
+    assert first['tags'] == ['음식이 맛있어요', '친절해요']
+    assert first['visit_info'] == ['1.31.토', '2번째 방문']
+    assert first['visit_date'] == crawler.parse_date('1.31.토')
+    assert first['images'] == ['https://pup-review-phinf.pstatic.net/MjAyNjAxMzFf/a1.jpeg']
+    assert reviews[1]['content'] == '기대 이하였어요. 면이 퍼져서 나왔어요'
+    assert reviews[2]['visit_date'] == '2025-12-28'
+    assert reviews[2]['images'] == [] and reviews[2]['tags'] == []
+
+
+def test_blog_reviews_from_recording(server):
+    server.responses = {('getFsasReviews', 1): (200, fixture('blog_page1.json'), 'application/json')}
+
+    reviews = make_fetcher(server, page_size=10).fetch_blog_reviews('1234', parse_date=crawler.parse_date)
+
+    assert len(server.requests) == 1
+    assert [r['title'] for r in reviews] == ['동네 중식당 짬뽕 맛집 후기', '탕수육 포장 후기']
+    assert reviews[0]['write_date'] == '2026-01-24'
+    assert len(reviews[0]['images']) == 2
+    assert reviews[1]['write_date_raw'] == '26.1.10.토'
+    assert reviews[1]['images'] == ['https://blogthumb.pstatic.net/MjAyNjAxMTBf/c1.jpg']
+
+
+@pytest.mark.parametrize('body, content_type', [
+    (fixture('errors.json'), 'application/json'),
+    (b'<html><body>\xec\xa0\x90\xea\xb2\x80 \xec\xa4\x91</body></html>', 'text/html'),
+    (b'', 'application/json'),
+])
+def test_bad_200_response_is_a_failure(server, body, content_type):
+    server.responses = {('getVisitorReviews', 1): (200, body, content_type)}
+    fetcher = make_fetcher(server)
+
+    assert fetcher.fetch_visitor_reviews('1234') is None
+    assert fetcher.stats == {'requests': 1, 'retries': 0, 'failed': 1}
+
+
+def test_non_json_response_falls_back_to_browser(server, monkeypatch):
+    server.responses = {('getFsasReviews', 1): (200, b'<html>blocked</html>', 'text/html')}
+    fetcher = make_fetcher(server)
+    crawled = []
+    monkeypatch.setattr(crawler, 'crawl_with_retry', lambda driver, url, *args, **kwargs: crawled.append(url) or ['browser'])
+
+    reviews = crawler.fetch_or_crawl(None, fetcher, fetcher.fetch_blog_reviews, 'https://blog-url', None,
+                                     '1234', None, None, 10)
+
+    assert reviews == ['browser']
+    assert crawled == ['https://blog-url']
@@ -0,0 +1,81 @@
+import io
+
+from PIL import Image
+
+from review_images import ImageCache
+
+
+def jpeg_bytes(color):
+    out = io.BytesIO()
+    Image.new('RGB', (600, 400), color).save(out, 'JPEG')
+    return out.getvalue()
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {'Content-Type': 'image/jpeg'}
+
+    def __init__(self, content):
+        self.content = content
+
+
+def make_cache(tmp_path, images, fail_first_write=False):
+    cache = ImageCache(str(tmp_path / 'docs'), str(tmp_path / 'image_index.json'), workers=1)
+    cache._get = lambda url: FakeResponse(images[url.split('?')[0]])
+    if fail_first_write:
+        write = cache._write
+        calls = []
+
+        def flaky_write(rel_path, data):
+            calls.append(rel_path)
+            if len(calls) == 1:
+                raise OSError('디스크 오류')
+            write(rel_path, data)
+
+        cache._write = flaky_write
+    return cache
+
+
+def test_first_download_failure_does_not_leave_placeholder(tmp_path):
+    red = jpeg_bytes('red')
+    images = {
+        'https://phinf.pstatic.net/a.jpg': red,
+        'https://phinf.pstatic.net/b.jpg': red,
+        'https://phinf.pstatic.net/c.jpg': jpeg_bytes('blue'),
+    }
+
+    cache = make_cache(tmp_path, images, fail_first_write=True)
+    cache.cache(list(images))
+    cache.save()
+
+    assert cache.stats['failed'] == 1
+    assert cache.stats['downloaded'] == 2
+    assert cache.entry('https://phinf.pstatic.net/a.jpg') is None
+    assert cache.entry('https://phinf.pstatic.net/b.jpg')['full']
+    assert all(e.get('hash') for e in cache.index.values())
+
+    # 다음 실행은 저장된 색인으로 시작하고 실패한 URL만 다시 받음
+    retry = make_cache(tmp_path, images)
+    retry.cache(list(images))
+
+    assert retry.stats == {'cached': 2, 'downloaded': 1, 'duplicates': 1, 'failed': 0}
+    assert retry.entry('https://phinf.pstatic.net/a.jpg')['hash'] == retry.entry('https://phinf.pstatic.net/b.jpg')['hash']
+
+
+def test_unexpected_error_is_counted_and_other_urls_continue(tmp_path):
+    images = {'https://phinf.pstatic.net/a.jpg': jpeg_bytes('red'),
+              'https://phinf.pstatic.net/b.jpg': jpeg_bytes('blue')}
+    cache = make_cache(tmp_path, images)
+    get = cache._get
+
+    def broken_get(url):
+        if 'a.jpg' in url:
+            raise ValueError('잘못된 응답')
+        return get(url)
+
+    cache._get = broken_get
+    cache.cache(list(images))
+
+    assert cache.stats['failed'] == 1
+    assert cache.stats['downloaded'] == 1
+    assert cache.entry('https://phinf.pstatic.net/b.jpg')
@@ -0,0 +1,21 @@
+import json
+import os
+
+from review_sentiment import calculate_negative_score
+
+CORPUS = os.path.join(os.path.dirname(__file__), 'fixtures', 'sentiment_corpus.json')
+
+
+def test_scores_match_frozen_corpus():
+    """이전 calculate_negative_score 결과로 고정한 코퍼스와 점수/매칭 목록이 모두 같은지"""
+    with open(CORPUS, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    mismatches = [
+        (case['content'], case['tags'], case['expected'])
+        for case in corpus
+        if list(calculate_negative_score(case)) != case['expected']
+    ]
+
+    assert len(corpus) > 1000
+    assert mismatches == []